@@ -200,6 +200,35 @@ async def get_current_price() -> float:
         print_log(f"[ERROR] Error fetching current price: {e}")
         return 0.0
 
+MARKER_STYLES = {
+    'buy': {'marker': '^', 'color': 'blue'},
+    'trim': {'marker': 'o', 'color': 'red'},
+    'sell': {'marker': 'v', 'color': 'red'},
+    'sim_trim_lwst': {'marker': 'o', 'color': 'orange'},
+    'sim_trim_avg': {'marker': 'o', 'color': 'yellow'},
+    'sim_trim_win': {'marker': 'o', 'color': 'green'}
+}
+
+def _read_markers(marker_path):
+    marker_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if not marker_path.exists():
+            with open(marker_path, 'w') as f:
+                json.dump([], f)
+
+        with open(marker_path, 'r') as f:
+            markers = json.load(f)
+        # Ensure markers is a list
+        if not isinstance(markers, list):
+            markers = []
+    except (json.decoder.JSONDecodeError, FileNotFoundError):
+        markers = []
+    return markers
+
+def _write_markers(marker_path, markers):
+    with open(marker_path, 'w') as f:
+        json.dump(markers, f, indent=4)
+
 async def add_markers(event_type, x=None, y=None, percentage=None, live_tf="2M", x_offset: int = 0):
 
     if x is None:
@@ -210,42 +239,54 @@ async def add_markers(event_type, x=None, y=None, percentage=None, live_tf="2M",
     y_coord = y if y else await get_current_price()
     print_log(f"    [MARKER-{live_tf}] {x_coord}, {y_coord}, {event_type}")
 
-    marker_styles = {
-        'buy': {'marker': '^', 'color': 'blue'},
-        'trim': {'marker': 'o', 'color': 'red'},
-        'sell': {'marker': 'v', 'color': 'red'},
-        'sim_trim_lwst': {'marker': 'o', 'color': 'orange'},
-        'sim_trim_avg': {'marker': 'o', 'color': 'yellow'},
-        'sim_trim_win': {'marker': 'o', 'color': 'green'}
-    }
-    
     marker = {
         'event_type': event_type,
         'x': x_coord,
         'y': y_coord,
-        'style': marker_styles[event_type],
+        'style': MARKER_STYLES[event_type],
         'percentage': percentage
     }
 
     marker_path = get_markers_path(live_tf)
-    marker_path.parent.mkdir(parents=True, exist_ok=True)
-
-    try:
-        if not marker_path.exists():
-            with open(marker_path, 'w') as f:
-                json.dump([], f)
-
-        with open(marker_path, 'r') as f:
-            markers = json.load(f)
-        # Ensure markers is a list
-        if not isinstance(markers, list):
-            markers = []
-    except (json.decoder.JSONDecodeError, FileNotFoundError):
-        markers = []
-
+    markers = _read_markers(marker_path)
     markers.append(marker)
-    with open(marker_path, 'w') as f:
-        json.dump(markers, f, indent=4)
+    _write_markers(marker_path, markers)
+
+async def add_markers_bulk(events, x_offset: int = 0):
+    """
+    Append several (event_type, live_tf) markers with one read/write per timeframe file.
+    A marker whose event type is already recorded at the same candle index is skipped,
+    so back-to-back opens/adds on one bar leave a single marker.
+    """
+    by_tf = {}
+    for event_type, live_tf in events:
+        by_tf.setdefault(live_tf, [])
+        if event_type not in by_tf[live_tf]:
+            by_tf[live_tf].append(event_type)
+    if not by_tf:
+        return
+
+    y_coord = await get_current_price()
+    for live_tf, event_types in by_tf.items():
+        x_coord = get_current_candle_index(live_tf) + x_offset
+        marker_path = get_markers_path(live_tf)
+        markers = _read_markers(marker_path)
+        existing = {(m.get('event_type'), m.get('x')) for m in markers if isinstance(m, dict)}
+        added = False
+        for event_type in event_types:
+            if (event_type, x_coord) in existing:
+                continue
+            print_log(f"    [MARKER-{live_tf}] {x_coord}, {y_coord}, {event_type}")
+            markers.append({
+                'event_type': event_type,
+                'x': x_coord,
+                'y': y_coord,
+                'style': MARKER_STYLES[event_type],
+                'percentage': None
+            })
+            added = True
+        if added:
+            _write_markers(marker_path, markers)
 
 async def get_candle_data_and_merge(candle_interval, candle_timescale, am_label, pm_label, indent_lvl, timeframe):
     max_ema_window = max([window for window, _ in read_config("EMAS")])
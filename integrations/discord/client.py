@@ -101,7 +101,7 @@ async def edit_discord_message(
                 if delete_last_message:
                     async for old_message in channel.history(limit=1):
                         await old_message.delete()
-                return
+                return message  # None from any failure path below
             except (discord.HTTPException, discord.NotFound) as e:
                 if await _maybe_wait_for_rate_limit(e, attempt, backoff_factor):
                     continue
@@ -1,6 +1,14 @@
 import re
 from datetime import datetime, time, timedelta
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Union
+
+# One pass over a trade message picks up the opening investment and every
+# add/sell line, instead of a separate scan per field.
+_TRADE_TOTALS_RE = re.compile(
+    r"Total Investment:\s*\$(?P<investment>[0-9,]+(?:\.\d+)?)"
+    r"|^(?P<kind>Added|Sold)\s+(?P<qty>\d+)\s+for\s+\$(?P<total>[0-9,]+(?:\.\d+)?)",
+    re.MULTILINE,
+)
 
 
 def extract_trade_results(message, message_id):
@@ -37,35 +45,29 @@ def extract_trade_results(message, message_id):
 
 def extract_trade_totals(message: str) -> dict:
     clean_message = _strip_markdown(message)
-    entry_total = _parse_labeled_money(clean_message, "Total Investment") or 0.0
-
+    entry_total = None
     added_total = 0.0
     sold_total = 0.0
     sold_qty = 0
 
-    for qty, total in re.findall(
-        r"^Added\s+(\d+)\s+for\s+\$([0-9,]+(?:\.\d+)?)",
-        clean_message,
-        re.MULTILINE,
-    ):
+    for match in _TRADE_TOTALS_RE.finditer(clean_message):
+        kind = match.group("kind")
         try:
-            added_total += float(total.replace(",", ""))
-        except ValueError:
-            continue
-
-    for qty, total in re.findall(
-        r"^Sold\s+(\d+)\s+for\s+\$([0-9,]+(?:\.\d+)?)",
-        clean_message,
-        re.MULTILINE,
-    ):
-        try:
-            sold_qty += int(qty)
-            sold_total += float(total.replace(",", ""))
+            if kind is None:
+                if entry_total is None:
+                    entry_total = float(match.group("investment").replace(",", ""))
+                continue
+            total = float(match.group("total").replace(",", ""))
+            if kind == "Added":
+                added_total += total
+            else:
+                sold_qty += int(match.group("qty"))
+                sold_total += total
         except ValueError:
             continue
 
     return {
-        "total_entry_cost": entry_total + added_total,
+        "total_entry_cost": (entry_total or 0.0) + added_total,
         "total_exit_value": sold_total,
         "total_exit_qty": sold_qty,
     }
@@ -140,11 +142,23 @@ def format_trade_close(
     )
 
 
-def append_trade_update(message: str, update_line: str) -> str:
-    if not message:
-        return update_line
-    separator = "" if message.endswith("\n") else "\n"
-    return f"{message}{separator}{update_line}"
+def append_trade_update(message: str, update_line: Union[str, Iterable[str]]) -> str:
+    lines = [update_line] if isinstance(update_line, str) else update_line
+    parts = [message] if message else []
+    ends_with_newline = message.endswith("\n")
+    for line in lines:
+        if not parts:
+            if line:
+                parts.append(line)
+                ends_with_newline = line.endswith("\n")
+            continue
+        if not ends_with_newline:
+            parts.append("\n")
+            ends_with_newline = True
+        if line:
+            parts.append(line)
+            ends_with_newline = line.endswith("\n")
+    return "".join(parts)
 
 
 def format_day_performance(
@@ -320,16 +334,6 @@ def _strip_markdown(message: str) -> str:
     return message.replace("**", "").replace("__", "").replace("`", "")
 
 
-def _parse_labeled_money(message: str, label: str) -> Optional[float]:
-    match = re.search(rf"{re.escape(label)}:\s*\$([0-9,]+(?:\.\d+)?)", message)
-    if not match:
-        return None
-    try:
-        return float(match.group(1).replace(",", ""))
-    except ValueError:
-        return None
-
-
 def _format_price(value: Optional[float], precision: int = 2) -> str:
     if value is None:
         return "n/a"
@@ -1,6 +1,6 @@
 # main.py
 from data_acquisition import get_account_balance, start_feed, stop_feed
-from utils.json_utils import get_correct_message_ids, read_config, update_config_value
+from utils.json_utils import compact_message_ids, get_correct_message_ids, read_config, update_config_value
 from utils.log_utils import clear_temp_logs_and_order_files
 from utils.order_utils import initialize_csv_order_log
 from indicators.ema_manager import hard_reset_ema_state, migrate_ema_state_schema
@@ -43,7 +43,7 @@ from paths import (
 import subprocess
 from pipeline.data_pipeline import run_pipeline
 from pipeline.config import PipelineConfig, PipelineDeps, PipelineSinks
-from session import get_session_bounds, normalize_session_times, is_market_open, wait_until_market_open
+from session import close_http_session, get_session_bounds, normalize_session_times, is_market_open, wait_until_market_open
 from runtime.pipeline_config_loader import load_pipeline_config
 from storage.parquet_writer import append_candle
 from indicators.ema_manager import update_ema
@@ -54,6 +54,11 @@ import aiohttp
 import os
 from contextlib import suppress
 
+try:
+    import uvloop  # optional faster event loop; stock asyncio is used when missing
+except ImportError:
+    uvloop = None
+
 
 @dataclass
 class OptionsRuntime:
@@ -64,11 +69,14 @@ class OptionsRuntime:
     position_watcher: Optional[PositionWatcher] = None
     on_position_closed: Optional[Callable] = None
     research_runner: Optional[ResearchSignalRunner] = None
+    notifier: Optional[OptionsTradeNotifier] = None
 
     async def stop(self) -> None:
         if self.research_runner:
             self.research_runner.stop()
-        self.runner.stop()
+        await self.runner.stop()
+        if self.notifier:
+            await self.notifier.stop()
         if self.position_watcher:
             await self.position_watcher.stop()
         await self.quote_service.stop()
@@ -172,7 +180,7 @@ async def start_options_runtime(
 
         research_runner: Optional[ResearchSignalRunner] = None
         if bool(read_config("RESEARCH_SIGNALS_ENABLED")):
-            research_signals = discover_research_signals()
+            research_signals = discover_research_signals(logger=print_log)
             if research_signals:
                 research_timeframes = read_config("RESEARCH_SIGNALS_TIMEFRAMES")
                 if not isinstance(research_timeframes, list):
@@ -228,6 +236,7 @@ async def start_options_runtime(
             position_watcher=position_watcher,
             on_position_closed=notifier.on_position_closed,
             research_runner=research_runner,
+            notifier=notifier,
         )
     except Exception:
         await session.close()
@@ -310,6 +319,7 @@ async def main():
                 # 10 min before open: enforce clean EMA state for the day
                 migrate_ema_state_schema()             # drop legacy keys like 'seen_ts'
                 hard_reset_ema_state(pipeline_cfg["timeframes"])       # clear per-TF candle_list + has_calculated
+                compact_message_ids()                  # fold yesterday's append-only message id journal
                 
                 # Pre-open setup
                 await ensure_economic_calendar_data()
@@ -515,6 +525,7 @@ async def shutdown(loop):
     """Shutdown tasks and the Discord bot."""
     # Gracefully shutdown the Discord bot
     await bot.close()  # Make sure this is the correct way to close your bot instance
+    await close_http_session()
     # Cancel all remaining tasks
     tasks = [t for t in asyncio.all_tasks(loop) if t is not asyncio.current_task(loop)]
     for task in tasks:
@@ -525,6 +536,8 @@ async def shutdown(loop):
 
 if __name__ == "__main__":
     print_log("Starting the main trading bot...")
+    if uvloop is not None:
+        uvloop.install()
     loop = asyncio.get_event_loop()
 
     #subprocess.Popen(["python", "web_dash/dash_app.py"])
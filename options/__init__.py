@@ -29,7 +29,7 @@ from .order_manager import (
     PositionActionResult,
 )
 from .position_watcher import PositionUpdate, PositionWatcher
-from .trade_ledger import TradeEvent, build_trade_event, record_trade_event
+from .trade_ledger import TradeEvent, build_trade_event, record_trade_event, record_trade_events
 from .quote_service import (
     OptionContract,
     OptionQuote,
@@ -60,6 +60,7 @@ __all__ = [
     "TradeEvent",
     "build_trade_event",
     "record_trade_event",
+    "record_trade_events",
     "ContractSelector",
     "DEFAULT_SELECTOR_REGISTRY",
     "PriceRangeOtmSelector",
@@ -3,12 +3,13 @@ from __future__ import annotations
 import json
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from paths import OPTIONS_RESEARCH_PATHS_PATH
+from utils.compat_utils import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ResearchPathEvent:
     ts: str
     event: str
@@ -35,13 +36,21 @@ def record_research_path_event(
     path: Optional[Path] = None,
     logger=None,
 ) -> None:
+    record_research_path_payload(asdict(event), path=path, logger=logger)
+
+
+def record_research_path_payload(
+    payload: Dict[str, Any],
+    path: Optional[Path] = None,
+    logger=None,
+) -> None:
+    """Append an already-built path event dict, skipping the dataclass round-trip."""
     target = path or OPTIONS_RESEARCH_PATHS_PATH
     target.parent.mkdir(parents=True, exist_ok=True)
-    payload = json.dumps(asdict(event), ensure_ascii=True)
+    line = json.dumps(payload, ensure_ascii=True)
     try:
         with target.open("a", encoding="utf-8") as handle:
-            handle.write(payload + "\n")
+            handle.write(line + "\n")
     except Exception as exc:
         if logger:
             logger(f"[RESEARCH PATH] Failed to write path event: {exc}")
-
@@ -7,9 +7,10 @@ from pathlib import Path
 from typing import Optional
 
 from paths import OPTIONS_RESEARCH_SIGNALS_PATH
+from utils.compat_utils import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ResearchSignalEvent:
     ts: str
     event: str
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+import os
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from paths import OPTIONS_TRADE_LEDGER_PATH
+from utils.json_utils import dumps_json, loads_json
 from utils.timezone import NY_TZ
 
 from .execution_tradier import OrderSubmitResult
@@ -36,6 +38,15 @@ class TradeEvent:
     reason: Optional[str]
 
 
+_TRADE_EVENT_FIELDS = tuple(field.name for field in fields(TradeEvent))
+
+
+def _event_json(event: TradeEvent) -> str:
+    # TradeEvent only holds scalars, so a flat projection serializes the same
+    # as asdict() without its recursive deep copy.
+    return dumps_json({name: getattr(event, name) for name in _TRADE_EVENT_FIELDS})
+
+
 def build_trade_event(
     event: str,
     position: Position,
@@ -43,13 +54,13 @@ def build_trade_event(
     quantity: Optional[int],
     fill_price: Optional[float],
     reason: Optional[str],
+    total_value: Optional[float] = None,
 ) -> TradeEvent:
     now = datetime.now(timezone.utc).isoformat()
     contract = position.contract
     order_id = order_result.order_id if order_result else None
     status = order_result.status if order_result else None
-    total_value = None
-    if quantity is not None and fill_price is not None:
+    if total_value is None and quantity is not None and fill_price is not None:
         total_value = quantity * fill_price * 100
     return TradeEvent(
         ts=now,
@@ -81,7 +92,7 @@ def record_trade_event(
 ) -> None:
     target = path or OPTIONS_TRADE_LEDGER_PATH
     target.parent.mkdir(parents=True, exist_ok=True)
-    payload = json.dumps(asdict(event), ensure_ascii=True)
+    payload = _event_json(event)
     try:
         with target.open("a", encoding="utf-8") as handle:
             handle.write(payload + "\n")
@@ -90,6 +101,28 @@ def record_trade_event(
             logger(f"[LEDGER] Failed to write trade event: {exc}")
 
 
+def record_trade_events(
+    events: Iterable[TradeEvent],
+    path: Optional[Path] = None,
+    logger=None,
+) -> None:
+    # Group commit: one open, one write, one fsync for the whole batch.
+    events = list(events)
+    if not events:
+        return
+    target = path or OPTIONS_TRADE_LEDGER_PATH
+    try:
+        payload = "".join(_event_json(event) + "\n" for event in events)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("a", encoding="utf-8") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+    except Exception as exc:
+        if logger:
+            logger(f"[LEDGER] Failed to write {len(events)} trade event(s): {exc}")
+
+
 def sum_realized_pnl_for_day(
     trading_day: Optional[str],
     path: Optional[Path] = None,
@@ -107,7 +140,7 @@ def sum_realized_pnl_for_day(
                 if not line:
                     continue
                 try:
-                    payload = json.loads(line)
+                    payload = loads_json(line)
                 except json.JSONDecodeError:
                     continue
                 if payload.get("event") != "close":
@@ -50,7 +50,7 @@ LINE_DATA_PATH = STORAGE_DIR / 'line_data.json'                         # No lon
 MARKERS_PATH = STORAGE_DIR / 'markers.json'                             # No longer needed, worked in older version, newer version require different timeframe markers hence the 'markers' folder which replaces this
 ORDER_CANDLE_TYPE_PATH = STORAGE_DIR / 'order_candle_type.json'         # No longer needed, worked in older version, newer version doesn't require this
 PRIORITY_CANDLES_PATH = STORAGE_DIR / 'priority_candles.json'           # No longer needed, worked in older version, newer version doesn't require this
-MESSAGE_IDS_PATH = STORAGE_DIR / 'message_ids.json'                     # This is needed, this records all message ID's sent to discord the same day, doesn't remember anything greater than the current day its running. After market ends it resets to zero meaning `{}`.
+MESSAGE_IDS_PATH = STORAGE_DIR / 'message_ids.jsonl'                    # This is needed, this records all message ID's sent to discord the same day (append-only, one {id: msg} per line), doesn't remember anything greater than the current day its running. After market ends it resets to zero meaning `{}`.
 WEEK_ECOM_CALENDER_PATH = STORAGE_DIR / 'week_ecom_calendar.json'       # This is needed for the weekly economic calendar events. This is being used to fetch major, relevant events for the current week. So it knows if it should take trades or not at certian times where news can alter the trades results.
 
 # CSVs
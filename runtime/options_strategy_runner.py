@@ -3,10 +3,13 @@ from __future__ import annotations
 import asyncio
 import importlib
 import inspect
+import os
+import sys
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional
+from typing import Awaitable, Callable, Deque, Dict, Iterable, List, Optional
 
 from options.order_manager import OptionsOrderManager, Position, PositionActionResult
 from options.position_watcher import PositionUpdate, PositionWatcher
@@ -16,10 +19,15 @@ from paths import get_ema_path
 from runtime.market_bus import CandleCloseEvent, MarketEventBus
 from shared_state import safe_read_json
 from strategies.options.types import PositionAction, StrategyContext, StrategySignal
+from utils.compat_utils import DATACLASS_SLOTS
 from utils.json_utils import read_config
 
+_HOOK_QUEUE_MAXSIZE = 256
+_HOOK_DRAIN_TIMEOUT_SECS = 10.0
+_STRATEGY_MODULE_IGNORE = frozenset({"types.py", "exit_rules.py"})
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class StrategyPosition:
     position_id: str
     direction: str
@@ -29,19 +37,45 @@ class StrategyPosition:
 class EmaSnapshotCache:
     def __init__(self, logger: Optional[Callable[[str], None]] = None) -> None:
         self._logger = logger
-        self._cache: Dict[Path, tuple[float, Optional[dict]]] = {}
+        self._tf_path: Dict[str, str] = {}
+        self._cache: Dict[str, tuple[int, Optional[dict]]] = {}
 
     def get_latest(self, timeframe: str) -> Optional[dict]:
-        path = Path(get_ema_path(timeframe))
-        if not path.exists():
-            return None
-        mtime = path.stat().st_mtime
-        cached = self._cache.get(path)
-        if cached and cached[0] == mtime:
-            return cached[1]
-        data = safe_read_json(path, default=[])
+        path_str, mtime_ns, cached = self._lookup(timeframe)
+        if mtime_ns is None or cached is not None:
+            return cached[1] if cached else None
+        return self._store(path_str, mtime_ns, safe_read_json(path_str, default=[]))
+
+    async def get_latest_async(self, timeframe: str) -> Optional[dict]:
+        # Same as get_latest, but a changed file is parsed off the event loop.
+        path_str, mtime_ns, cached = self._lookup(timeframe)
+        if mtime_ns is None or cached is not None:
+            return cached[1] if cached else None
+        data = await asyncio.to_thread(safe_read_json, path_str, default=[])
+        return self._store(path_str, mtime_ns, data)
+
+    def _lookup(self, timeframe: str) -> tuple[str, Optional[int], Optional[tuple[int, Optional[dict]]]]:
+        path_str = self._tf_path.get(timeframe)
+        if path_str is None:
+            path_str = sys.intern(os.fspath(get_ema_path(timeframe)))
+            self._tf_path[timeframe] = path_str
+        # One stat call covers both the existence check and the mtime; the
+        # integer ns mtime keeps equality exact on sub-ms rewrites.
+        try:
+            mtime_ns = os.stat(path_str).st_mtime_ns
+        except FileNotFoundError:
+            return path_str, None, None
+        cached = self._cache.get(path_str)
+        if cached and cached[0] == mtime_ns:
+            return path_str, mtime_ns, cached
+        return path_str, mtime_ns, None
+
+    def _store(self, path_str: str, mtime_ns: int, data: object) -> Optional[dict]:
         latest = data[-1] if isinstance(data, list) and data else None
-        self._cache[path] = (mtime, latest)
+        if isinstance(latest, dict):
+            # Strategies intern their EMA labels; matching keys make every .get an identity hit.
+            latest = {sys.intern(key) if isinstance(key, str) else key: value for key, value in latest.items()}
+        self._cache[path_str] = (mtime_ns, latest)
         return latest
 
 
@@ -66,35 +100,47 @@ class OptionsStrategyRunner:
     ) -> None:
         self._bus = bus
         self._order_manager = order_manager
-        self._strategies = list(strategies)
+        self._strategies: List[object] = []
+        self._strategy_table: Dict[int, tuple[Optional[tuple], Optional[tuple]]] = {}
+        self._candle_handlers: List[tuple[object, str, Callable]] = []
+        self._candle_routes: Dict[str, List[tuple[object, str, Callable]]] = {}
+        self._update_handlers: List[tuple[str, Callable, bool]] = []
+        self.reload(strategies)
         self._expiration = expiration
         self._selector_name = selector_name
         self._max_otm = max_otm
         self._price_ranges = price_ranges
         self._order_quantity = order_quantity
         self._position_watcher = position_watcher
-        self._on_position_opened = on_position_opened
-        self._on_position_closed = on_position_closed
-        self._on_position_added = on_position_added
-        self._on_position_trimmed = on_position_trimmed
+        self._on_position_opened = _bind_hook(on_position_opened)
+        self._on_position_closed = _bind_hook(on_position_closed)
+        self._on_position_added = _bind_hook(on_position_added)
+        self._on_position_trimmed = _bind_hook(on_position_trimmed)
         self._logger = logger
         self._listener_id: Optional[int] = None
         self._position_listener_id: Optional[int] = None
+        self._hook_queue: Optional[asyncio.Queue] = None
+        self._hook_task: Optional[asyncio.Task] = None
         self._positions: Dict[str, StrategyPosition] = {}
+        self._positions_by_id: Dict[str, str] = {}
         self._ema_cache = EmaSnapshotCache(logger=logger)
-        self._lock = asyncio.Lock()
+        self._busy = False
+        self._pending: Deque[tuple[Callable[[object], Awaitable[None]], object]] = deque()
         self._tag_include_timeframe = _read_tag_include_timeframe()
 
     def start(self) -> None:
         if self._listener_id is not None:
             return
         self._listener_id = self._bus.register_listener(self._handle_event)
+        if self._hook_task is None:
+            self._hook_queue = asyncio.Queue(maxsize=_HOOK_QUEUE_MAXSIZE)
+            self._hook_task = asyncio.create_task(self._hook_consumer(), name="StrategyRunnerHooks")
         if self._position_watcher and self._position_listener_id is None:
             self._position_listener_id = self._position_watcher.register_listener(
                 self._handle_position_updates
             )
 
-    def stop(self) -> None:
+    async def stop(self, timeout: float = _HOOK_DRAIN_TIMEOUT_SECS) -> None:
         if self._listener_id is None:
             return
         self._bus.remove_listener(self._listener_id)
@@ -102,37 +148,107 @@ class OptionsStrategyRunner:
         if self._position_watcher and self._position_listener_id is not None:
             self._position_watcher.remove_listener(self._position_listener_id)
             self._position_listener_id = None
+        if self._hook_queue is not None:
+            # Let queued notifications and ledger writes finish before tearing down.
+            try:
+                await asyncio.wait_for(self._hook_queue.join(), timeout)
+            except asyncio.TimeoutError:
+                self._log(f"[STRATEGY] Hook queue not drained after {timeout}s; cancelling the rest.")
+        if self._hook_task is not None:
+            self._hook_task.cancel()
+            self._hook_task = None
+        if self._hook_queue is not None:
+            while not self._hook_queue.empty():
+                _discard_awaitable(self._hook_queue.get_nowait())
+            self._hook_queue = None
+
+    def reload(self, strategies: Iterable[object]) -> None:
+        # Handler entries are keyed by strategy identity, so re-discovering an
+        # unchanged strategy object reuses its bound entry instead of rebuilding it.
+        table: Dict[int, tuple[Optional[tuple], Optional[tuple]]] = {}
+        ordered: List[object] = []
+        for strategy in strategies:
+            key = id(strategy)
+            if key in table:
+                continue
+            entry = self._strategy_table.get(key)
+            table[key] = entry if entry is not None else _bind_strategy(strategy)
+            ordered.append(strategy)
+        self._strategy_table = table
+        self._strategies = ordered
+        self._candle_handlers = [entry[0] for entry in table.values() if entry[0] is not None]
+        self._candle_routes = {}
+        self._update_handlers = [entry[1] for entry in table.values() if entry[1] is not None]
+
+    def _candle_handlers_for(self, timeframe: str) -> List[tuple[object, str, Callable]]:
+        # Strategies pinned to one timeframe only hear that timeframe's closes;
+        # ones without a ``timeframe`` attribute hear every close. Order is kept.
+        handlers = self._candle_routes.get(timeframe)
+        if handlers is None:
+            handlers = [
+                entry
+                for entry in self._candle_handlers
+                if _strategy_timeframe(entry[0]) in (None, timeframe)
+            ]
+            self._candle_routes[timeframe] = handlers
+        return handlers
 
     async def _handle_event(self, event: CandleCloseEvent) -> None:
-        async with self._lock:
-            ema_snapshot = self._ema_cache.get_latest(event.timeframe)
-            context = StrategyContext(
-                symbol=event.symbol,
-                timeframe=event.timeframe,
-                candle=event.candle,
-                ema=ema_snapshot,
-                timestamp=event.closed_at,
-            )
-            for strategy in self._strategies:
-                signal = _call_strategy(strategy, context)
-                if signal is None:
-                    continue
-                await self._handle_signal(strategy, signal, context)
+        if not self._candle_handlers:
+            return
+        await self._run_exclusive(self._process_candle, event)
 
     async def _handle_position_updates(self, updates: List[PositionUpdate]) -> None:
-        if not updates:
+        if not updates or not self._update_handlers:
+            return
+        await self._run_exclusive(self._process_position_updates, updates)
+
+    async def _run_exclusive(self, handler: Callable[[object], Awaitable[None]], payload: object) -> None:
+        # Everything runs on one event loop, so a flag is enough to stop
+        # re-entrant handling while a previous event is still awaiting; work
+        # that arrives meanwhile is queued and drained in arrival order.
+        if self._busy:
+            self._pending.append((handler, payload))
             return
+        self._busy = True
+        try:
+            while True:
+                # A failing handler must not strand the work queued behind it.
+                try:
+                    await handler(payload)
+                except Exception as exc:
+                    self._log(f"[STRATEGY] Handler error: {exc}")
+                if not self._pending:
+                    break
+                handler, payload = self._pending.popleft()
+        finally:
+            self._busy = False
+
+    async def _process_candle(self, event: CandleCloseEvent) -> None:
+        handlers = self._candle_handlers_for(event.timeframe)
+        if not handlers:
+            return
+        ema_snapshot = await self._ema_cache.get_latest_async(event.timeframe)
+        context = StrategyContext(
+            symbol=event.symbol,
+            timeframe=event.timeframe,
+            candle=event.candle,
+            ema=ema_snapshot,
+            timestamp=event.closed_at,
+        )
+        for strategy, name, handler in handlers:
+            signal = handler(context)
+            if signal is None:
+                continue
+            await self._handle_signal(strategy, signal, context, name=name)
+
+    async def _process_position_updates(self, updates: List[PositionUpdate]) -> None:
         actions: List[PositionAction] = []
-        async with self._lock:
-            for strategy in self._strategies:
-                handler = getattr(strategy, "on_position_update", None)
-                if handler is None:
-                    continue
-                name = getattr(strategy, "name", strategy.__class__.__name__)
-                scoped = [update for update in updates if _tag_matches(name, update.strategy_tag)]
-                if not scoped:
-                    continue
-                actions.extend(await self._resolve_position_actions(handler, scoped, name))
+        for name, handler, is_async in self._update_handlers:
+            scoped = [update for update in updates if _tag_matches(name, update.strategy_tag)]
+            if not scoped:
+                continue
+            actions.extend(await self._resolve_position_actions(handler, scoped, name, is_async))
         if actions:
             await self._apply_position_actions(actions)
 
@@ -141,12 +257,15 @@ class OptionsStrategyRunner:
         strategy: object,
         signal: StrategySignal,
         context: StrategyContext,
+        *,
+        name: Optional[str] = None,
     ) -> None:
         direction = signal.direction
         if direction not in ("call", "put"):
             return
 
-        name = getattr(strategy, "name", strategy.__class__.__name__)
+        if name is None:
+            name = _strategy_name(strategy)
         strategy_tag = _format_strategy_tag(name, context.timeframe, self._tag_include_timeframe)
         key = _position_key(name, context.timeframe, self._tag_include_timeframe)
         active = self._positions.get(key)
@@ -157,7 +276,7 @@ class OptionsStrategyRunner:
             close_result = await self._order_manager.close_position(active.position_id)
             closed_position = self._order_manager.get_position(active.position_id)
             if closed_position:
-                self._dispatch_hook(
+                await self._dispatch_hook(
                     self._on_position_closed,
                     closed_position,
                     close_result.order_result if close_result else None,
@@ -165,6 +284,7 @@ class OptionsStrategyRunner:
                     context.timeframe,
                 )
             self._positions.pop(key, None)
+            self._positions_by_id.pop(active.position_id, None)
 
         underlying = context.candle.get("close")
         if underlying is None:
@@ -193,9 +313,10 @@ class OptionsStrategyRunner:
             direction=direction,
             strategy_tag=strategy_tag,
         )
+        self._positions_by_id[result.position_id] = key
         opened_position = self._order_manager.get_position(result.position_id)
         if opened_position:
-            self._dispatch_hook(
+            await self._dispatch_hook(
                 self._on_position_opened,
                 opened_position,
                 result.order_result,
@@ -211,14 +332,13 @@ class OptionsStrategyRunner:
             self._logger(message)
 
     def _forget_position(self, position_id: str) -> None:
-        for name, position in list(self._positions.items()):
-            if position.position_id == position_id:
-                self._positions.pop(name, None)
-                return
+        key = self._positions_by_id.pop(position_id, None)
+        if key is not None:
+            self._positions.pop(key, None)
 
-    def _dispatch_hook(
+    async def _dispatch_hook(
         self,
-        hook: Optional[Callable[[Position, Optional[OrderSubmitResult], str, Optional[str]], object]],
+        hook: Optional[tuple[Callable[[Position, Optional[OrderSubmitResult], str, Optional[str]], object], bool]],
         position: Position,
         order_result: Optional[OrderSubmitResult],
         reason: str,
@@ -226,25 +346,44 @@ class OptionsStrategyRunner:
     ) -> None:
         if hook is None:
             return
+        call, is_async = hook
         try:
-            if _hook_accepts_timeframe(hook):
-                result = hook(position, order_result, reason, timeframe)
-            else:
-                result = hook(position, order_result, reason)
-            if inspect.isawaitable(result):
-                asyncio.create_task(self._run_hook(result))
+            result = call(position, order_result, reason, timeframe)
+            # partials, decorated coroutines and async __call__ objects return
+            # awaitables without being coroutine functions themselves.
+            if is_async or inspect.isawaitable(result):
+                await self._enqueue_hook(result)
         except Exception as exc:
             self._log(f"[STRATEGY] Hook error: {exc}")
 
+    async def _enqueue_hook(self, coro) -> None:
+        queue = self._hook_queue
+        if queue is None:
+            # Not started (direct handler calls); run it detached as before.
+            asyncio.create_task(self._run_hook(coro))
+            return
+        # A full queue makes the caller wait rather than drop an open/close notification.
+        await queue.put(coro)
+
+    async def _hook_consumer(self) -> None:
+        queue = self._hook_queue
+        while True:
+            coro = await queue.get()
+            try:
+                await self._run_hook(coro)
+            finally:
+                queue.task_done()
+
     async def _resolve_position_actions(
         self,
         handler: Callable[[List[PositionUpdate]], object],
         updates: List[PositionUpdate],
         name: str,
+        is_async: bool = False,
     ) -> List[PositionAction]:
         try:
             result = handler(updates)
-            if inspect.isawaitable(result):
+            if is_async or inspect.isawaitable(result):
                 result = await result
         except Exception as exc:
             self._log(f"[STRATEGY] {name} position update error: {exc}")
@@ -258,60 +397,74 @@ class OptionsStrategyRunner:
             self._log(f"[STRATEGY] Hook async error: {exc}")
 
     async def _apply_position_actions(self, actions: List[PositionAction]) -> None:
+        # Actions on distinct positions are independent; run each position's
+        # actions in order, and the per-position groups concurrently.
+        buckets: Dict[str, List[PositionAction]] = {}
         for action in actions:
-            if action.action == "close":
-                result = await self._order_manager.close_position(action.position_id)
-                position = self._order_manager.get_position(action.position_id)
-                if position:
-                    self._dispatch_hook(
-                        self._on_position_closed,
-                        position,
-                        result.order_result if result else None,
-                        action.reason or "close",
-                        action.timeframe,
-                    )
-                    if position.status == "closed" or position.quantity_open <= 0:
-                        self._forget_position(action.position_id)
-                else:
+            buckets.setdefault(action.position_id, []).append(action)
+        if len(buckets) == 1:
+            await self._apply_action_bucket(actions)
+            return
+        await asyncio.gather(*(self._apply_action_bucket(bucket) for bucket in buckets.values()))
+
+    async def _apply_action_bucket(self, actions: List[PositionAction]) -> None:
+        for action in actions:
+            await self._apply_position_action(action)
+
+    async def _apply_position_action(self, action: PositionAction) -> None:
+        if action.action == "close":
+            result = await self._order_manager.close_position(action.position_id)
+            position = self._order_manager.get_position(action.position_id)
+            if position:
+                await self._dispatch_hook(
+                    self._on_position_closed,
+                    position,
+                    result.order_result if result else None,
+                    action.reason or "close",
+                    action.timeframe,
+                )
+                if position.status == "closed" or position.quantity_open <= 0:
                     self._forget_position(action.position_id)
-                continue
-            if action.action == "trim":
-                if action.quantity is None or action.quantity <= 0:
-                    self._log("[STRATEGY] trim action missing quantity")
-                    continue
-                result = await self._order_manager.trim_position(
-                    action.position_id,
-                    quantity=action.quantity,
+            else:
+                self._forget_position(action.position_id)
+            return
+        if action.action == "trim":
+            if action.quantity is None or action.quantity <= 0:
+                self._log("[STRATEGY] trim action missing quantity")
+                return
+            result = await self._order_manager.trim_position(
+                action.position_id,
+                quantity=action.quantity,
+            )
+            position = self._order_manager.get_position(action.position_id)
+            if position:
+                await self._dispatch_hook(
+                    self._on_position_trimmed,
+                    position,
+                    result.order_result if result else None,
+                    action.reason or "trim",
+                    action.timeframe,
                 )
-                position = self._order_manager.get_position(action.position_id)
-                if position:
-                    self._dispatch_hook(
-                        self._on_position_trimmed,
-                        position,
-                        result.order_result if result else None,
-                        action.reason or "trim",
-                        action.timeframe,
-                    )
-                continue
-            if action.action == "add":
-                if action.quantity is None or action.quantity <= 0:
-                    self._log("[STRATEGY] add action missing quantity")
-                    continue
-                result = await self._order_manager.add_to_position(
-                    action.position_id,
-                    quantity=action.quantity,
+            return
+        if action.action == "add":
+            if action.quantity is None or action.quantity <= 0:
+                self._log("[STRATEGY] add action missing quantity")
+                return
+            result = await self._order_manager.add_to_position(
+                action.position_id,
+                quantity=action.quantity,
+            )
+            position = self._order_manager.get_position(action.position_id)
+            if position:
+                await self._dispatch_hook(
+                    self._on_position_added,
+                    position,
+                    result.order_result if result else None,
+                    action.reason or "add",
+                    action.timeframe,
                 )
-                position = self._order_manager.get_position(action.position_id)
-                if position:
-                    self._dispatch_hook(
-                        self._on_position_added,
-                        position,
-                        result.order_result if result else None,
-                        action.reason or "add",
-                        action.timeframe,
-                    )
-                continue
-            self._log(f"[STRATEGY] Unknown position action: {action.action}")
+            return
+        self._log(f"[STRATEGY] Unknown position action: {action.action}")
 
     async def add_to_position(
         self,
@@ -331,7 +484,7 @@ class OptionsStrategyRunner:
         )
         position = self._order_manager.get_position(position_id)
         if position:
-            self._dispatch_hook(
+            await self._dispatch_hook(
                 self._on_position_added,
                 position,
                 result.order_result,
@@ -358,7 +511,7 @@ class OptionsStrategyRunner:
         )
         position = self._order_manager.get_position(position_id)
         if position:
-            self._dispatch_hook(
+            await self._dispatch_hook(
                 self._on_position_trimmed,
                 position,
                 result.order_result,
@@ -368,11 +521,45 @@ class OptionsStrategyRunner:
         return result
 
 
-def _call_strategy(strategy: object, context: StrategyContext) -> Optional[StrategySignal]:
-    handler = getattr(strategy, "on_candle_close", None)
-    if handler is None:
+def _bind_strategy(strategy: object) -> tuple[Optional[tuple], Optional[tuple]]:
+    name = _strategy_name(strategy)
+    candle_entry = None
+    on_candle = getattr(strategy, "on_candle_close", None)
+    if on_candle is not None:
+        candle_entry = (strategy, name, on_candle)
+    update_entry = None
+    on_update = getattr(strategy, "on_position_update", None)
+    if on_update is not None:
+        update_entry = (name, on_update, asyncio.iscoroutinefunction(on_update))
+    return (candle_entry, update_entry)
+
+
+def _strategy_timeframe(strategy: object) -> Optional[str]:
+    timeframe = getattr(strategy, "timeframe", None)
+    return timeframe if isinstance(timeframe, str) else None
+
+
+def _strategy_name(strategy: object) -> str:
+    return getattr(strategy, "name", strategy.__class__.__name__)
+
+
+def _discard_awaitable(awaitable) -> None:
+    close = getattr(awaitable, "close", None)
+    if callable(close):
+        close()
+
+
+def _bind_hook(hook: Optional[Callable]) -> Optional[tuple[Callable, bool]]:
+    # Resolve arity and async-ness once so dispatch is a plain 4-arg call.
+    if hook is None:
         return None
-    return handler(context)
+    is_async = asyncio.iscoroutinefunction(hook)
+    if _hook_accepts_timeframe(hook):
+        return (hook, is_async)
+    return (
+        lambda position, order_result, reason, _timeframe, _hook=hook: _hook(position, order_result, reason),
+        is_async,
+    )
 
 
 def _hook_accepts_timeframe(hook: Callable) -> bool:
@@ -434,11 +621,18 @@ def discover_strategies(root: Optional[Path] = None) -> List[object]:
     base = root or Path(__file__).resolve().parents[1] / "strategies" / "options"
     if not base.exists():
         return []
+    with os.scandir(base) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".py")
+            and not entry.name.startswith("_")
+            and entry.name not in _STRATEGY_MODULE_IGNORE
+            and entry.is_file()
+        )
     strategies: List[object] = []
-    for path in sorted(base.glob("*.py")):
-        if path.name.startswith("_") or path.name in ("types.py", "exit_rules.py"):
-            continue
-        module_name = f"strategies.options.{path.stem}"
+    for file_name in names:
+        module_name = f"strategies.options.{file_name[:-3]}"
         try:
             module = importlib.import_module(module_name)
         except Exception:
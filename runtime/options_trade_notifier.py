@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Set
 
-from data_acquisition import add_markers
+from data_acquisition import add_markers_bulk
 from integrations.discord import (
     append_trade_update,
     edit_discord_message,
@@ -17,11 +20,39 @@ from integrations.discord import (
 )
 from options.execution_tradier import OrderSubmitResult
 from options.order_manager import OptionsOrderManager, Position
-from options.trade_ledger import build_trade_event, record_trade_event
+from options.trade_ledger import TradeEvent, build_trade_event, record_trade_events
+from utils.compat_utils import DATACLASS_SLOTS
 from utils.json_utils import load_message_ids, save_message_ids
 
+# Discord rate-limits message edits hard; updates landing within this window
+# for the same position are folded into a single edit.
+EDIT_DEBOUNCE_SECS = 0.5
+LEDGER_BATCH_SIZE = 32
+# Markers requested within this window are written together; repeats of the
+# same event on the same candle collapse into one marker.
+MARKER_FLUSH_SECS = 0.25
+# Trade states kept in memory; older ones are rebuilt from Discord on demand.
+TRADE_STATE_CACHE_SIZE = 512
+# How long stop() waits for queued ledger writes before dropping them.
+LEDGER_DRAIN_TIMEOUT_SECS = 10.0
 
-@dataclass
+
+def _notify_guard(label: str):
+    # Notification failures are logged, never raised into the order flow.
+    def decorator(handler: Callable[..., Awaitable[None]]):
+        @functools.wraps(handler)
+        async def wrapper(self: OptionsTradeNotifier, *args, **kwargs) -> None:
+            try:
+                await handler(self, *args, **kwargs)
+            except Exception as exc:
+                self._log(f"[OPTIONS] {label} notify failed: {exc}")
+
+        return wrapper
+
+    return decorator
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TradeMessageState:
     message_id: int
     content: str
@@ -29,15 +60,21 @@ class TradeMessageState:
     total_exit_value: float = 0.0
     total_exit_qty: int = 0
 
-    def record_entry(self, quantity: Optional[int], fill_price: Optional[float]) -> None:
+    @staticmethod
+    def notional(quantity: Optional[int], fill_price: Optional[float]) -> Optional[float]:
         if quantity is None or fill_price is None:
+            return None
+        return quantity * fill_price * 100
+
+    def record_entry(self, notional: Optional[float]) -> None:
+        if notional is None:
             return
-        self.total_entry_cost += quantity * fill_price * 100
+        self.total_entry_cost += notional
 
-    def record_exit(self, quantity: Optional[int], fill_price: Optional[float]) -> None:
-        if quantity is None or fill_price is None:
+    def record_exit(self, quantity: Optional[int], notional: Optional[float]) -> None:
+        if quantity is None or notional is None:
             return
-        self.total_exit_value += quantity * fill_price * 100
+        self.total_exit_value += notional
         self.total_exit_qty += quantity
 
     def avg_exit(self) -> Optional[float]:
@@ -55,8 +92,40 @@ class OptionsTradeNotifier:
     ) -> None:
         self._order_manager = order_manager
         self._logger = logger
-        self._trade_messages: Dict[str, TradeMessageState] = {}
+        self._trade_messages: "OrderedDict[str, TradeMessageState]" = OrderedDict()
+        self._closed_positions: Set[str] = set()
+        self._message_ids: Optional[Dict[str, int]] = None
+        self._pending_edits: Dict[str, List[str]] = {}
+        self._edit_tasks: Dict[str, asyncio.Task] = {}
+        self._marker_tasks: Set[asyncio.Task] = set()
+        self._pending_markers: Dict[tuple[str, str], None] = {}
+        self._marker_flush_scheduled = False
+        self._ledger_queue: Optional[asyncio.Queue] = None
+        self._ledger_task: Optional[asyncio.Task] = None
 
+    async def stop(self, timeout: float = LEDGER_DRAIN_TIMEOUT_SECS) -> None:
+        tasks = list(self._edit_tasks.values())
+        for task in tasks:
+            task.cancel()
+        self._edit_tasks.clear()
+        for position_id in list(self._pending_edits):
+            await self._flush_edits(position_id)
+        if self._marker_tasks:
+            await asyncio.gather(*self._marker_tasks, return_exceptions=True)
+        if self._ledger_queue is not None:
+            try:
+                await asyncio.wait_for(self._ledger_queue.join(), timeout)
+            except asyncio.TimeoutError:
+                dropped = self._ledger_queue.qsize()
+                self._log(
+                    f"[OPTIONS] Trade ledger not drained after {timeout}s; "
+                    f"dropping {dropped} queued event(s)."
+                )
+            self._ledger_task.cancel()
+            self._ledger_queue = None
+            self._ledger_task = None
+
+    @_notify_guard("Open")
     async def on_position_opened(
         self,
         position: Position,
@@ -64,41 +133,38 @@ class OptionsTradeNotifier:
         reason: str,
         timeframe: Optional[str] = None,
     ) -> None:
-        try:
-            quantity, fill_price = self._order_details(order_result)
-            record_trade_event(
-                build_trade_event("open", position, order_result, quantity, fill_price, reason),
-                logger=self._logger,
-            )
-            if quantity is None or fill_price is None:
-                self._log("[OPTIONS] Missing fill details for open; skipping Discord message.")
-                return
-            contract = position.contract
-            total_investment = quantity * fill_price * 100
-            message = format_trade_open(
-                strategy_name=position.strategy_tag or "strategy",
-                ticker_symbol=contract.symbol,
-                strike=contract.strike,
-                option_type=contract.option_type,
-                quantity=quantity,
-                order_price=fill_price,
-                total_investment=total_investment,
-                reason=reason,
+        quantity, fill_price = self._order_details(order_result)
+        total_value = TradeMessageState.notional(quantity, fill_price)
+        self._queue_trade_event(
+            build_trade_event("open", position, order_result, quantity, fill_price, reason, total_value)
+        )
+        if quantity is None or fill_price is None:
+            self._log("[OPTIONS] Missing fill details for open; skipping Discord message.")
+            return
+        contract = position.contract
+        message = format_trade_open(
+            strategy_name=position.strategy_tag or "strategy",
+            ticker_symbol=contract.symbol,
+            strike=contract.strike,
+            option_type=contract.option_type,
+            quantity=quantity,
+            order_price=fill_price,
+            total_investment=total_value,
+            reason=reason,
+        )
+        sent = await print_discord(message)
+        if sent:
+            trade_state = TradeMessageState(
+                message_id=sent.id,
+                content=message,
+                total_entry_cost=total_value,
             )
-            sent = await print_discord(message)
-            if sent:
-                trade_state = TradeMessageState(
-                    message_id=sent.id,
-                    content=message,
-                    total_entry_cost=total_investment,
-                )
-                self._trade_messages[position.position_id] = trade_state
-                save_message_ids(position.position_id, sent.id)
-            marker_tf = timeframe or "2M"
-            await add_markers("buy", live_tf=marker_tf, x_offset=1)  # Trade executes after close; mark next candle.
-        except Exception as exc:
-            self._log(f"[OPTIONS] Open notify failed: {exc}")
+            self._remember_trade_state(position.position_id, trade_state)
+            save_message_ids(position.position_id, sent.id)
+            self._cached_message_ids()[position.position_id] = sent.id
+        self._schedule_marker("buy", timeframe)
 
+    @_notify_guard("Add")
     async def on_position_added(
         self,
         position: Position,
@@ -106,28 +172,24 @@ class OptionsTradeNotifier:
         reason: str,
         timeframe: Optional[str] = None,
     ) -> None:
-        try:
-            quantity, fill_price = self._order_details(order_result)
-            record_trade_event(
-                build_trade_event("add", position, order_result, quantity, fill_price, reason),
-                logger=self._logger,
-            )
-            state = await self._get_trade_state(position.position_id)
-            if not state:
-                self._log(f"[OPTIONS] No Discord message tracked for {position.position_id}")
-                return
-            if quantity is None or fill_price is None:
-                self._log("[OPTIONS] Missing fill details for add; skipping Discord update.")
-                return
-            total_value = quantity * fill_price * 100
-            state.record_entry(quantity, fill_price)
-            update_line = format_trade_add(quantity, total_value, fill_price, reason)
-            await self._edit_trade_message(position.position_id, update_line)
-            marker_tf = timeframe or "2M"
-            await add_markers("buy", live_tf=marker_tf, x_offset=1)  # Trade executes after close; mark next candle.
-        except Exception as exc:
-            self._log(f"[OPTIONS] Add notify failed: {exc}")
+        quantity, fill_price = self._order_details(order_result)
+        total_value = TradeMessageState.notional(quantity, fill_price)
+        self._queue_trade_event(
+            build_trade_event("add", position, order_result, quantity, fill_price, reason, total_value)
+        )
+        state = await self._get_trade_state(position.position_id)
+        if not state:
+            self._log(f"[OPTIONS] No Discord message tracked for {position.position_id}")
+            return
+        if quantity is None or fill_price is None:
+            self._log("[OPTIONS] Missing fill details for add; skipping Discord update.")
+            return
+        state.record_entry(total_value)
+        update_line = format_trade_add(quantity, total_value, fill_price, reason)
+        await self._edit_trade_message(position.position_id, update_line)
+        self._schedule_marker("buy", timeframe)
 
+    @_notify_guard("Trim")
     async def on_position_trimmed(
         self,
         position: Position,
@@ -135,28 +197,24 @@ class OptionsTradeNotifier:
         reason: str,
         timeframe: Optional[str] = None,
     ) -> None:
-        try:
-            quantity, fill_price = self._order_details(order_result)
-            record_trade_event(
-                build_trade_event("trim", position, order_result, quantity, fill_price, reason),
-                logger=self._logger,
-            )
-            state = await self._get_trade_state(position.position_id)
-            if not state:
-                self._log(f"[OPTIONS] No Discord message tracked for {position.position_id}")
-                return
-            if quantity is None or fill_price is None:
-                self._log("[OPTIONS] Missing fill details for trim; skipping Discord update.")
-                return
-            total_value = quantity * fill_price * 100
-            state.record_exit(quantity, fill_price)
-            update_line = format_trade_trim(quantity, total_value, fill_price, reason)
-            await self._edit_trade_message(position.position_id, update_line)
-            marker_tf = timeframe or "2M"
-            await add_markers("trim", live_tf=marker_tf, x_offset=1)  # Trade executes after close; mark next candle.
-        except Exception as exc:
-            self._log(f"[OPTIONS] Trim notify failed: {exc}")
+        quantity, fill_price = self._order_details(order_result)
+        total_value = TradeMessageState.notional(quantity, fill_price)
+        self._queue_trade_event(
+            build_trade_event("trim", position, order_result, quantity, fill_price, reason, total_value)
+        )
+        state = await self._get_trade_state(position.position_id)
+        if not state:
+            self._log(f"[OPTIONS] No Discord message tracked for {position.position_id}")
+            return
+        if quantity is None or fill_price is None:
+            self._log("[OPTIONS] Missing fill details for trim; skipping Discord update.")
+            return
+        state.record_exit(quantity, total_value)
+        update_line = format_trade_trim(quantity, total_value, fill_price, reason)
+        await self._edit_trade_message(position.position_id, update_line)
+        self._schedule_marker("trim", timeframe)
 
+    @_notify_guard("Close")
     async def on_position_closed(
         self,
         position: Position,
@@ -164,40 +222,36 @@ class OptionsTradeNotifier:
         reason: str,
         timeframe: Optional[str] = None,
     ) -> None:
-        try:
-            quantity, fill_price = self._order_details(order_result)
-            record_trade_event(
-                build_trade_event("close", position, order_result, quantity, fill_price, reason),
-                logger=self._logger,
-            )
-            state = await self._get_trade_state(position.position_id)
-            if state and quantity is not None and fill_price is not None:
-                total_value = quantity * fill_price * 100
-                state.record_exit(quantity, fill_price)
-                update_line = format_trade_trim(quantity, total_value, fill_price, reason)
-                await self._edit_trade_message(position.position_id, update_line)
-            else:
-                if not state:
-                    self._log(f"[OPTIONS] No Discord message tracked for {position.position_id}")
-                if quantity is None or fill_price is None:
-                    self._log("[OPTIONS] Missing fill details for close; skipping sell line.")
-
-            avg_exit = state.avg_exit() if state else None
-            total_pnl = position.realized_pnl
-            percent = (
-                (total_pnl / state.total_entry_cost) * 100
-                if state and state.total_entry_cost > 0
-                else None
-            )
-            summary = format_trade_close(avg_exit, total_pnl, percent, None)
-            if state:
-                await self._edit_trade_message(position.position_id, summary)
-            else:
-                await print_discord(summary)
-            marker_tf = timeframe or "2M"
-            await add_markers("sell", live_tf=marker_tf, x_offset=1)  # Trade executes after close; mark next candle.
-        except Exception as exc:
-            self._log(f"[OPTIONS] Close notify failed: {exc}")
+        quantity, fill_price = self._order_details(order_result)
+        total_value = TradeMessageState.notional(quantity, fill_price)
+        self._queue_trade_event(
+            build_trade_event("close", position, order_result, quantity, fill_price, reason, total_value)
+        )
+        state = await self._get_trade_state(position.position_id)
+        if state and quantity is not None and fill_price is not None:
+            state.record_exit(quantity, total_value)
+            update_line = format_trade_trim(quantity, total_value, fill_price, reason)
+            await self._edit_trade_message(position.position_id, update_line)
+        else:
+            if not state:
+                self._log(f"[OPTIONS] No Discord message tracked for {position.position_id}")
+            if quantity is None or fill_price is None:
+                self._log("[OPTIONS] Missing fill details for close; skipping sell line.")
+
+        avg_exit = state.avg_exit() if state else None
+        total_pnl = position.realized_pnl
+        percent = (
+            (total_pnl / state.total_entry_cost) * 100
+            if state and state.total_entry_cost > 0
+            else None
+        )
+        summary = format_trade_close(avg_exit, total_pnl, percent, None)
+        if state:
+            await self._edit_trade_message(position.position_id, summary)
+        else:
+            await print_discord(summary)
+        self._forget_trade_state(position.position_id)
+        self._schedule_marker("sell", timeframe)
 
     def _log(self, message: str) -> None:
         if self._logger:
@@ -216,12 +270,74 @@ class OptionsTradeNotifier:
             fill_price = order_result.raw.get("fill_price")
         return quantity, fill_price
 
+    def _schedule_marker(self, event_type: str, timeframe: Optional[str]) -> None:
+        # Chart markers are bookkeeping only; keep them off the notify path.
+        self._pending_markers[(event_type, timeframe or "2M")] = None
+        if self._marker_flush_scheduled:
+            return
+        self._marker_flush_scheduled = True
+        task = asyncio.create_task(self._flush_markers())
+        self._marker_tasks.add(task)
+        task.add_done_callback(self._on_marker_done)
+
+    async def _flush_markers(self) -> None:
+        await asyncio.sleep(MARKER_FLUSH_SECS)
+        self._marker_flush_scheduled = False
+        events = list(self._pending_markers)
+        self._pending_markers.clear()
+        await add_markers_bulk(events, x_offset=1)  # Trade executes after close; mark next candle.
+
+    def _on_marker_done(self, task: asyncio.Task) -> None:
+        self._marker_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            self._log(f"[OPTIONS] Marker write failed: {exc}")
+
+    def _queue_trade_event(self, event: TradeEvent) -> None:
+        # The event is built eagerly (positions mutate after this call); only
+        # serialization and the file append move to the background writer.
+        if self._ledger_queue is None:
+            self._ledger_queue = asyncio.Queue()
+            self._ledger_task = asyncio.create_task(self._drain_ledger(), name="TradeLedgerWriter")
+        self._ledger_queue.put_nowait(event)
+
+    async def _drain_ledger(self) -> None:
+        queue = self._ledger_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < LEDGER_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._write_ledger_batch, batch)
+            except Exception as exc:
+                # Keep the writer alive; later events must still reach the ledger.
+                self._log(f"[OPTIONS] Trade ledger write failed: {exc}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _write_ledger_batch(self, events: List[TradeEvent]) -> None:
+        record_trade_events(events, logger=self._logger)
+
+    def _cached_message_ids(self) -> Dict[str, int]:
+        # The notifier is the only writer of message_ids during a session, so
+        # the file is read once and kept in sync on save.
+        if self._message_ids is None:
+            self._message_ids = load_message_ids()
+        return self._message_ids
+
     async def _get_trade_state(self, position_id: str) -> Optional[TradeMessageState]:
         state = self._trade_messages.get(position_id)
         if state:
+            self._trade_messages.move_to_end(position_id)
             return state
-        message_ids = load_message_ids()
-        message_id = message_ids.get(position_id)
+        message_ids = self._cached_message_ids()
+        if position_id not in message_ids:
+            # Unknown position: no message to rebuild, so skip the Discord fetch.
+            return None
+        message_id = message_ids[position_id]
         if not message_id:
             return None
         content = await get_message_content(message_id)
@@ -235,13 +351,48 @@ class OptionsTradeNotifier:
             total_exit_value=totals.get("total_exit_value", 0.0),
             total_exit_qty=totals.get("total_exit_qty", 0),
         )
-        self._trade_messages[position_id] = state
+        self._remember_trade_state(position_id, state)
         return state
 
+    def _remember_trade_state(self, position_id: str, state: TradeMessageState) -> None:
+        self._trade_messages[position_id] = state
+        self._trade_messages.move_to_end(position_id)
+        while len(self._trade_messages) > TRADE_STATE_CACHE_SIZE:
+            # Evicted ids stay in message_ids, so _get_trade_state can rebuild them.
+            self._trade_messages.popitem(last=False)
+
+    def _forget_trade_state(self, position_id: str) -> None:
+        if position_id in self._pending_edits:
+            # The final edit still needs the state; _flush_edits drops it afterwards.
+            self._closed_positions.add(position_id)
+            return
+        self._trade_messages.pop(position_id, None)
+
     async def _edit_trade_message(self, position_id: str, update_line: str) -> None:
-        state = await self._get_trade_state(position_id)
-        if not state:
-            self._log(f"[OPTIONS] No Discord message tracked for {position_id}")
+        self._pending_edits.setdefault(position_id, []).append(update_line)
+        if position_id not in self._edit_tasks:
+            self._edit_tasks[position_id] = asyncio.create_task(self._debounced_flush(position_id))
+
+    async def _debounced_flush(self, position_id: str) -> None:
+        await asyncio.sleep(EDIT_DEBOUNCE_SECS)
+        self._edit_tasks.pop(position_id, None)
+        await self._flush_edits(position_id)
+
+    async def _flush_edits(self, position_id: str) -> None:
+        lines = self._pending_edits.pop(position_id, None)
+        if not lines:
             return
-        state.content = append_trade_update(state.content, update_line)
-        await edit_discord_message(state.message_id, state.content)
+        try:
+            state = await self._get_trade_state(position_id)
+            if not state:
+                self._log(f"[OPTIONS] No Discord message tracked for {position_id}")
+                return
+            state.content = append_trade_update(state.content, lines)
+            await edit_discord_message(state.message_id, state.content)
+        except Exception as exc:
+            self._log(f"[OPTIONS] Trade message edit failed: {exc}")
+        finally:
+            if position_id in self._closed_positions and position_id not in self._pending_edits:
+                self._closed_positions.discard(position_id)
+                self._trade_messages.pop(position_id, None)
+
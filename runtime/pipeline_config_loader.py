@@ -1,18 +1,39 @@
-from utils.json_utils import read_config
-from utils.timezone import NY_TZ
+from functools import lru_cache
+from types import MappingProxyType
+
+from utils.json_utils import read_config_bulk
+from utils.timezone import NY_ZONEINFO
 
 TIMEFRAME_SECONDS = {
     "1M": 60, "2M": 120, "3M": 180, "5M": 300,
     "15M": 900, "30M": 1800, "1H": 3600,
 }
 
+@lru_cache(maxsize=8)
+def _durations_for(timeframes: tuple):
+    # Same TIMEFRAMES list -> same read-only mapping, built once.
+    return MappingProxyType({tf: TIMEFRAME_SECONDS[tf] for tf in timeframes})
+
+_CACHE = None
+
 def load_pipeline_config():
-    tfs = read_config("TIMEFRAMES")
-    durations = {tf: TIMEFRAME_SECONDS[tf] for tf in tfs}
-    return {
-        "timeframes": tfs,
-        "durations": durations,
-        "buffer_secs": read_config("CANDLE_BUFFER"),
-        "symbol": read_config("SYMBOL"),
-        "tz": NY_TZ,
-    }
+    # Config is fixed for the life of the process; call invalidate() to reload.
+    global _CACHE
+    if _CACHE is None:
+        cfg = read_config_bulk(["TIMEFRAMES", "CANDLE_BUFFER", "SYMBOL"])
+        tfs = tuple(cfg["TIMEFRAMES"])
+        _CACHE = {
+            "timeframes": tfs,
+            "durations": _durations_for(tfs),
+            "buffer_secs": cfg["CANDLE_BUFFER"],
+            "symbol": cfg["SYMBOL"],
+            "tz": NY_ZONEINFO,
+        }
+    # The memo holds only immutable values; callers get their own timeframes list.
+    config = dict(_CACHE)
+    config["timeframes"] = list(config["timeframes"])
+    return config
+
+def invalidate():
+    global _CACHE
+    _CACHE = None
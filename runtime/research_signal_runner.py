@@ -3,15 +3,26 @@ from __future__ import annotations
 import asyncio
 import importlib
 import inspect
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Sequence
+from typing import Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Set
 
 import shared_state
-from options.research_path_ledger import ResearchPathEvent, record_research_path_event
+from options.research_path_ledger import (
+    ResearchPathEvent,
+    record_research_path_event,
+    record_research_path_payload,
+)
 from options.research_signal_ledger import ResearchSignalEvent, record_research_signal
-from options.selection import DEFAULT_PRICE_RANGES, SelectionRequest, select_contract
+from options.selection import DEFAULT_PRICE_RANGES, SelectionRequest, SelectionResult, select_contract
 from options.quote_service import OptionQuote, OptionQuoteService
 from paths import CURRENT_OBJECTS_PATH, get_ema_path
 from runtime.market_bus import CandleCloseEvent, MarketEventBus
@@ -20,37 +31,51 @@ from strategies_research.types import ResearchContext, ResearchSignal
 from utils.json_utils import read_config
 from utils.timezone import NY_TZ
 
+_SEEN_BUCKETS_MAX = 65_536
+_VALID_DIRECTIONS = frozenset(("call", "put"))
+
 
 class EmaHistoryCache:
     def __init__(self) -> None:
-        self._cache: Dict[Path, tuple[float, List[dict]]] = {}
+        self._tf_path: Dict[str, str] = {}
+        self._cache: Dict[str, tuple[int, List[dict], Dict[int, float]]] = {}
 
     def get_last_two(self, timeframe: str) -> List[dict]:
-        path = Path(get_ema_path(timeframe))
-        if not path.exists():
-            return []
-        mtime = path.stat().st_mtime
+        return self._load(timeframe)[0]
+
+    def get_latest_levels(self, timeframe: str) -> Dict[int, float]:
+        # Parsed once per file version; callers must treat the dict as read-only.
+        return self._load(timeframe)[1]
+
+    def _load(self, timeframe: str) -> tuple[List[dict], Dict[int, float]]:
+        path = self._tf_path.get(timeframe)
+        if path is None:
+            path = self._tf_path[timeframe] = os.fspath(get_ema_path(timeframe))
+        mtime = _mtime_ns(path)
+        if mtime is None:
+            return ([], {})
         cached = self._cache.get(path)
         if cached and cached[0] == mtime:
-            return cached[1]
+            return (cached[1], cached[2])
         data = safe_read_json(path, default=[])
         if not isinstance(data, list) or not data:
             history: List[dict] = []
         else:
             history = data[-2:] if len(data) >= 2 else [data[-1]]
-        self._cache[path] = (mtime, history)
-        return history
+        levels = _extract_ema_levels(history[-1]) if history else {}
+        self._cache[path] = (mtime, history, levels)
+        return (history, levels)
 
 
 class ObjectsCache:
     def __init__(self) -> None:
-        self._cache: tuple[float, list, list] = (0.0, [], [])
+        self._cache: tuple[int, list, list] = (0, [], [])
+        self._index: Optional[TouchIndex] = None
 
     def get_current(self) -> tuple[list, list]:
-        path = Path(CURRENT_OBJECTS_PATH)
-        if not path.exists():
+        mtime = _mtime_ns(CURRENT_OBJECTS_PATH)
+        if mtime is None:
             return ([], [])
-        mtime = path.stat().st_mtime
         cached_mtime, zones, levels = self._cache
         if cached_mtime == mtime:
             return (zones, levels)
@@ -62,6 +87,147 @@ class ObjectsCache:
         self._cache = (mtime, zones, levels)
         return (zones, levels)
 
+    def get_touch_index(self) -> TouchIndex:
+        zones, levels = self.get_current()
+        index = self._index
+        if index is None or index.zones is not zones or index.levels is not levels:
+            index = self._index = TouchIndex(zones, levels)
+        return index
+
+
+class TouchIndex:
+    """Levels sorted by price and zones sorted by low, so a poll only visits nearby objects.
+
+    Event keys and reasons are formatted here, once per objects-file version,
+    rather than on every poll.
+    """
+
+    def __init__(self, zones: list, levels: list) -> None:
+        self.zones = zones
+        self.levels = levels
+        level_rows = []
+        for order, level in enumerate(levels or []):
+            y = _to_float(level.get("y"))
+            if y is not None:
+                level_rows.append((y, order, level))
+        level_rows.sort(key=lambda row: (row[0], row[1]))
+        self._level_ys = [row[0] for row in level_rows]
+        self._levels = [
+            (
+                order,
+                y,
+                level,
+                sys.intern(f"level:{_format_price_key(y)}"),
+                f"level_touch:{level.get('type')}:{level.get('id')}",
+            )
+            for y, order, level in level_rows
+        ]
+
+        zone_rows = []
+        for order, zone in enumerate(zones or []):
+            top = _to_float(zone.get("top"))
+            bottom = _to_float(zone.get("bottom"))
+            if top is None or bottom is None:
+                continue
+            low, high = (bottom, top) if bottom <= top else (top, bottom)
+            zone_rows.append((low, order, high, zone))
+        zone_rows.sort(key=lambda row: (row[0], row[1]))
+        self._zone_lows = [row[0] for row in zone_rows]
+        self._zones = [
+            (
+                order,
+                low,
+                high,
+                zone,
+                sys.intern(f"zone:{_format_price_key(low)}-{_format_price_key(high)}"),
+                f"zone_touch:{zone.get('type')}:{zone.get('id')}",
+            )
+            for low, order, high, zone in zone_rows
+        ]
+        # Running max of zone highs: every zone before the first prefix max
+        # that reaches the price sits entirely below it.
+        self._zone_max_highs = list(accumulate((row[2] for row in zone_rows), max))
+
+    def levels_near(self, price: float, tolerance: float) -> List[tuple[dict, str, str]]:
+        start = bisect_left(self._level_ys, price - tolerance)
+        end = bisect_right(self._level_ys, price + tolerance)
+        hits = [row for row in self._levels[start:end] if abs(price - row[1]) <= tolerance]
+        hits.sort(key=lambda row: row[0])
+        return [(level, key, reason) for _, _, level, key, reason in hits]
+
+    def zones_near(self, price: float, tolerance: float) -> List[tuple[dict, str, str]]:
+        end = bisect_right(self._zone_lows, price + tolerance)
+        start = bisect_left(self._zone_max_highs, price - tolerance, 0, end)
+        zones = self._zones
+        hits = [
+            zones[i]
+            for i in range(start, end)
+            if zones[i][1] - tolerance <= price <= zones[i][2] + tolerance
+        ]
+        hits.sort(key=lambda row: row[0])
+        return [(zone, key, reason) for _, _, _, zone, key, reason in hits]
+
+
+class SeenBuckets:
+    """(signal_id, event_key, bucket) triples already recorded, oldest evicted past max_size."""
+
+    def __init__(self, max_size: int = _SEEN_BUCKETS_MAX) -> None:
+        self._seen: Set[tuple[str, str, str]] = set()
+        self._order: Deque[tuple[str, str, str]] = deque()
+        self._max_size = max_size
+
+    def add(self, signal_id: str, event_key: str, bucket: str) -> bool:
+        key = (signal_id, event_key, bucket)
+        if key in self._seen:
+            return False
+        if len(self._order) >= self._max_size:
+            self._seen.discard(self._order.popleft())
+        self._seen.add(key)
+        self._order.append(key)
+        return True
+
+    def forget(self, signal_ids: Iterable[str]) -> None:
+        dropped = set(signal_ids)
+        if not dropped:
+            return
+        self._order = deque(key for key in self._order if key[0] not in dropped)
+        self._seen = set(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+class ChainSelections:
+    """Contract selection for one snapshot: the chain is bucketed once and repeat requests reuse results."""
+
+    def __init__(self, snapshot: Dict[str, OptionQuote], selector_name: str) -> None:
+        self._snapshot = snapshot
+        self._selector_name = selector_name
+        self._buckets: Optional[Dict[tuple[str, str, str], List[OptionQuote]]] = None
+        self._results: Dict[tuple, Optional[SelectionResult]] = {}
+
+    def select(self, request: SelectionRequest) -> Optional[SelectionResult]:
+        key = (
+            request.symbol,
+            request.option_type,
+            request.expiration,
+            request.underlying_price,
+            request.max_otm,
+            tuple(request.price_ranges),
+        )
+        if key in self._results:
+            return self._results[key]
+        if self._buckets is None:
+            buckets: Dict[tuple[str, str, str], List[OptionQuote]] = {}
+            for quote in self._snapshot.values():
+                contract = quote.contract
+                buckets.setdefault((contract.symbol, contract.expiration, contract.option_type), []).append(quote)
+            self._buckets = buckets
+        quotes = self._buckets.get((request.symbol, request.expiration, request.option_type), [])
+        result = select_contract(quotes, request, selector_name=self._selector_name)
+        self._results[key] = result
+        return result
+
 
 @dataclass(frozen=True)
 class ActiveSignal:
@@ -95,12 +261,14 @@ class ResearchSignalRunner:
         self._listener_id: Optional[int] = None
         self._ema_cache = EmaHistoryCache()
         self._objects_cache = ObjectsCache()
-        self._lock = asyncio.Lock()
-        self._allowed_timeframes = set(self.timeframes or [])
+        self._busy = False
+        self._pending: Deque[tuple[Callable[[object], Awaitable[None]], object]] = deque()
+        self._queued_touch: Optional[tuple[float, datetime, TouchIndex]] = None
+        self._allowed_timeframes = frozenset(self.timeframes or ())
         self._active_signals: Dict[str, ActiveSignal] = {}
         self._touch_task: Optional[asyncio.Task] = None
         self._touch_stop = asyncio.Event()
-        self._touch_seen: Dict[str, Dict[str, str]] = {}
+        self._touch_seen = SeenBuckets()
         self._tag_include_timeframe = _read_tag_include_timeframe()
 
     def start(self) -> None:
@@ -128,27 +296,50 @@ class ResearchSignalRunner:
     async def _handle_event(self, event: CandleCloseEvent) -> None:
         if self._allowed_timeframes and event.timeframe not in self._allowed_timeframes:
             return
-        async with self._lock:
-            ema_history = self._ema_cache.get_last_two(event.timeframe)
-            context = ResearchContext(
-                symbol=event.symbol,
-                timeframe=event.timeframe,
-                candle=event.candle,
-                ema_history=ema_history,
-                timestamp=event.closed_at,
-            )
-            snapshot = self.quote_service.get_snapshot()
-            if not snapshot:
-                return
-            for strategy in self._strategies:
-                signals = await _call_strategy(strategy, context, logger=self._log)
-                if not signals:
-                    continue
-                for signal in signals:
-                    await self._record_signal(strategy, signal, context, snapshot)
-            await self._record_candle_close_paths(event)
-            if event.source == "eod":
-                self._clear_timeframe_signals(event.timeframe)
+        await self._run_exclusive(self._process_candle, event)
+
+    async def _run_exclusive(self, handler: Callable[[object], Awaitable[None]], payload: object) -> None:
+        # Candle closes and touch ticks share one event loop; a flag keeps them
+        # from interleaving, and work arriving mid-await runs afterwards in order.
+        if self._busy:
+            self._pending.append((handler, payload))
+            return
+        self._busy = True
+        try:
+            while True:
+                # A failing handler must not strand the work queued behind it.
+                try:
+                    await handler(payload)
+                except Exception as exc:
+                    self._log(f"[RESEARCH] Handler error: {exc}")
+                if not self._pending:
+                    break
+                handler, payload = self._pending.popleft()
+        finally:
+            self._busy = False
+
+    async def _process_candle(self, event: CandleCloseEvent) -> None:
+        ema_history = self._ema_cache.get_last_two(event.timeframe)
+        context = ResearchContext(
+            symbol=event.symbol,
+            timeframe=event.timeframe,
+            candle=event.candle,
+            ema_history=ema_history,
+            timestamp=event.closed_at,
+        )
+        snapshot = self.quote_service.get_snapshot()
+        if not snapshot:
+            return
+        selections = ChainSelections(snapshot, self.selector_name)
+        for strategy in self._strategies:
+            signals = await _call_strategy(strategy, context, logger=self._log)
+            if not signals:
+                continue
+            for signal in signals:
+                await self._record_signal(strategy, signal, context, snapshot, selections=selections)
+        await self._record_candle_close_paths(event)
+        if event.source == "eod":
+            self._clear_timeframe_signals(event.timeframe)
 
     async def _record_signal(
         self,
@@ -156,15 +347,17 @@ class ResearchSignalRunner:
         signal: ResearchSignal,
         context: ResearchContext,
         snapshot: Dict[str, OptionQuote],
+        *,
+        selections: Optional[ChainSelections] = None,
     ) -> None:
         direction = signal.direction
-        if direction not in ("call", "put"):
+        if direction not in _VALID_DIRECTIONS:
             return
         underlying = context.candle.get("close")
         if underlying is None:
             return
         name = getattr(strategy, "name", strategy.__class__.__name__)
-        strategy_tag = _format_strategy_tag(name, context.timeframe, self._tag_include_timeframe)
+        strategy_tag = sys.intern(_format_strategy_tag(name, context.timeframe, self._tag_include_timeframe))
         request = SelectionRequest(
             symbol=context.symbol,
             option_type=direction,
@@ -173,7 +366,9 @@ class ResearchSignalRunner:
             max_otm=self.max_otm,
             price_ranges=self.price_ranges,
         )
-        selection = select_contract(snapshot.values(), request, selector_name=self.selector_name)
+        if selections is None:
+            selections = ChainSelections(snapshot, self.selector_name)
+        selection = selections.select(request)
         if not selection:
             self._log(f"[RESEARCH] {name} no contract for {direction} on {context.timeframe}")
             return
@@ -183,7 +378,7 @@ class ResearchSignalRunner:
             self._log(f"[RESEARCH] {name} no entry mark for {quote.contract.key}")
             return
         ts = _timestamp_iso(context.timestamp)
-        signal_id = _build_signal_id(name, context.timeframe, ts, quote.contract.key, signal.variant)
+        signal_id = sys.intern(_build_signal_id(name, context.timeframe, ts, quote.contract.key, signal.variant))
         event = ResearchSignalEvent(
             ts=ts,
             event="signal",
@@ -226,12 +421,13 @@ class ResearchSignalRunner:
         candle_close = event.candle.get("close")
         if candle_close is None:
             return
-        bucket = _bucket_from_candle(event)
+        bucket = sys.intern(_bucket_from_candle(event))
         ts = _timestamp_iso(event.closed_at)
-        for signal in list(self._active_signals.values()):
+        # No awaits in this loop, so nothing can mutate the dict mid-iteration.
+        for signal in self._active_signals.values():
             if signal.timeframe != event.timeframe:
                 continue
-            if not _should_record(self._touch_seen, signal.signal_id, "candle_close", bucket):
+            if not self._touch_seen.add(signal.signal_id, "candle_close", bucket):
                 continue
             quote = self.quote_service.get_quote(signal.contract_key)
             if quote is None:
@@ -262,8 +458,17 @@ class ResearchSignalRunner:
             record_research_path_event(path_event, logger=self._log)
 
     async def _poll_touches(self) -> None:
+        # Ticks are scheduled against fixed deadlines so the cadence doesn't
+        # drift by each tick's run time; a long tick skips missed deadlines.
+        loop = asyncio.get_running_loop()
+        interval = max(self.touch_poll_secs, 0.2)
+        next_tick = loop.time()
         while not self._touch_stop.is_set():
-            await asyncio.sleep(max(self.touch_poll_secs, 0.2))
+            next_tick += interval
+            now_mono = loop.time()
+            if next_tick < now_mono:
+                next_tick = now_mono + interval
+            await asyncio.sleep(next_tick - now_mono)
             if not self._active_signals:
                 continue
             async with price_lock:
@@ -273,131 +478,111 @@ class ResearchSignalRunner:
             if self.touch_tolerance is None or self.touch_tolerance <= 0:
                 continue
             now = datetime.now(NY_TZ)
-            zones, levels = self._objects_cache.get_current()
-            async with self._lock:
-                self._process_touches(latest_price, now, zones, levels)
+            index = self._objects_cache.get_touch_index()
+            payload = (latest_price, now, index)
+            if self._busy:
+                # Only the newest tick is worth replaying once the handler in
+                # flight finishes; overwrite any tick that is still waiting.
+                already_queued = self._queued_touch is not None
+                self._queued_touch = payload
+                if not already_queued:
+                    self._pending.append((self._run_queued_touch, None))
+                continue
+            await self._run_exclusive(self._touch_tick, payload)
+
+    async def _touch_tick(self, payload: tuple[float, datetime, TouchIndex]) -> None:
+        latest_price, now, index = payload
+        self._process_touches(latest_price, now, index=index)
+
+    async def _run_queued_touch(self, _payload: object) -> None:
+        payload, self._queued_touch = self._queued_touch, None
+        if payload is not None:
+            await self._touch_tick(payload)
 
     def _process_touches(
         self,
         latest_price: float,
         now: datetime,
-        zones: list,
-        levels: list,
+        zones: Optional[list] = None,
+        levels: Optional[list] = None,
+        *,
+        index: Optional[TouchIndex] = None,
     ) -> None:
-        for signal in list(self._active_signals.values()):
-            ema_history = self._ema_cache.get_last_two(signal.timeframe)
-            if not ema_history:
-                continue
-            latest = ema_history[-1]
-            ema_levels = _extract_ema_levels(latest)
+        if index is None:
+            index = TouchIndex(zones or [], levels or [])
+        # Object hits depend only on price, so resolve them once per tick.
+        # Keys and buckets are interned: _touch_seen keeps one copy of each
+        # across polls and dict lookups reuse the cached hash.
+        object_hits = [
+            (key, reason)
+            for _, key, reason in index.levels_near(latest_price, self.touch_tolerance)
+        ]
+        object_hits.extend(
+            (key, reason)
+            for _, key, reason in index.zones_near(latest_price, self.touch_tolerance)
+        )
+        ts = _timestamp_iso(now)
+        underlying_price = float(latest_price)
+        by_timeframe: Dict[str, List[ActiveSignal]] = {}
+        for signal in self._active_signals.values():
+            by_timeframe.setdefault(signal.timeframe, []).append(signal)
+        for timeframe, signals in by_timeframe.items():
+            ema_levels = self._ema_cache.get_latest_levels(timeframe)
             if not ema_levels:
                 continue
-            bucket = _bucket_id(now, signal.timeframe)
-            quote = self.quote_service.get_quote(signal.contract_key)
-            if quote is None:
-                continue
-            mark = _entry_mark(quote)
-            if mark is None:
+            ema_hits = [
+                (sys.intern(f"ema:{period}"), "ema_touch")
+                for period, value in ema_levels.items()
+                if abs(latest_price - value) <= self.touch_tolerance
+            ]
+            hits = ema_hits + object_hits
+            if not hits:
                 continue
-            for period, value in ema_levels.items():
-                if abs(latest_price - value) > self.touch_tolerance:
-                    continue
-                event_key = f"ema:{period}"
-                if not _should_record(self._touch_seen, signal.signal_id, event_key, bucket):
-                    continue
-                path_event = ResearchPathEvent(
-                    ts=_timestamp_iso(now),
-                    event="touch",
-                    event_key=event_key,
-                    signal_id=signal.signal_id,
-                    strategy_tag=signal.strategy_tag,
-                    timeframe=signal.timeframe,
-                    symbol=signal.symbol,
-                    option_type=signal.option_type,
-                    strike=signal.strike,
-                    expiration=signal.expiration,
-                    contract_key=signal.contract_key,
-                    underlying_price=float(latest_price),
-                    mark=float(mark),
-                    bid=_to_float(quote.bid),
-                    ask=_to_float(quote.ask),
-                    last=_to_float(quote.last),
-                    reason="ema_touch",
-                    variant=signal.variant,
-                )
-                record_research_path_event(path_event, logger=self._log)
-            for level in levels or []:
-                y = _to_float(level.get("y"))
-                if y is None:
+            bucket = sys.intern(_bucket_id(now, timeframe))
+            for signal in signals:
+                quote = self.quote_service.get_quote(signal.contract_key)
+                if quote is None:
                     continue
-                if abs(latest_price - y) > self.touch_tolerance:
+                mark = _entry_mark(quote)
+                if mark is None:
                     continue
-                event_key = f"level:{_format_price_key(y)}"
-                if not _should_record(self._touch_seen, signal.signal_id, event_key, bucket):
-                    continue
-                reason = f"level_touch:{level.get('type')}:{level.get('id')}"
-                path_event = ResearchPathEvent(
-                    ts=_timestamp_iso(now),
-                    event="touch",
-                    event_key=event_key,
-                    signal_id=signal.signal_id,
-                    strategy_tag=signal.strategy_tag,
-                    timeframe=signal.timeframe,
-                    symbol=signal.symbol,
-                    option_type=signal.option_type,
-                    strike=signal.strike,
-                    expiration=signal.expiration,
-                    contract_key=signal.contract_key,
-                    underlying_price=float(latest_price),
-                    mark=float(mark),
-                    bid=_to_float(quote.bid),
-                    ask=_to_float(quote.ask),
-                    last=_to_float(quote.last),
-                    reason=reason,
-                    variant=signal.variant,
-                )
-                record_research_path_event(path_event, logger=self._log)
-            for zone in zones or []:
-                top = _to_float(zone.get("top"))
-                bottom = _to_float(zone.get("bottom"))
-                if top is None or bottom is None:
-                    continue
-                low, high = (bottom, top) if bottom <= top else (top, bottom)
-                if latest_price < low - self.touch_tolerance:
-                    continue
-                if latest_price > high + self.touch_tolerance:
-                    continue
-                event_key = f"zone:{_format_price_key(low)}-{_format_price_key(high)}"
-                if not _should_record(self._touch_seen, signal.signal_id, event_key, bucket):
-                    continue
-                reason = f"zone_touch:{zone.get('type')}:{zone.get('id')}"
-                path_event = ResearchPathEvent(
-                    ts=_timestamp_iso(now),
-                    event="touch",
-                    event_key=event_key,
-                    signal_id=signal.signal_id,
-                    strategy_tag=signal.strategy_tag,
-                    timeframe=signal.timeframe,
-                    symbol=signal.symbol,
-                    option_type=signal.option_type,
-                    strike=signal.strike,
-                    expiration=signal.expiration,
-                    contract_key=signal.contract_key,
-                    underlying_price=float(latest_price),
-                    mark=float(mark),
-                    bid=_to_float(quote.bid),
-                    ask=_to_float(quote.ask),
-                    last=_to_float(quote.last),
-                    reason=reason,
-                    variant=signal.variant,
-                )
-                record_research_path_event(path_event, logger=self._log)
+                base_fields = None
+                for event_key, reason in hits:
+                    if not self._touch_seen.add(signal.signal_id, event_key, bucket):
+                        continue
+                    if base_fields is None:
+                        # Everything but the key and reason is fixed for this signal and tick.
+                        # Keys follow ResearchPathEvent field order so the JSONL rows match.
+                        base_fields = dict(
+                            ts=ts,
+                            event="touch",
+                            event_key=None,
+                            signal_id=signal.signal_id,
+                            strategy_tag=signal.strategy_tag,
+                            timeframe=signal.timeframe,
+                            symbol=signal.symbol,
+                            option_type=signal.option_type,
+                            strike=signal.strike,
+                            expiration=signal.expiration,
+                            contract_key=signal.contract_key,
+                            underlying_price=underlying_price,
+                            mark=float(mark),
+                            bid=_to_float(quote.bid),
+                            ask=_to_float(quote.ask),
+                            last=_to_float(quote.last),
+                            reason=None,
+                            variant=signal.variant,
+                        )
+                    payload = dict(base_fields)
+                    payload["event_key"] = event_key
+                    payload["reason"] = reason
+                    record_research_path_payload(payload, logger=self._log)
 
     def _clear_timeframe_signals(self, timeframe: str) -> None:
         to_remove = [key for key, sig in self._active_signals.items() if sig.timeframe == timeframe]
         for key in to_remove:
             self._active_signals.pop(key, None)
-            self._touch_seen.pop(key, None)
+        self._touch_seen.forget(to_remove)
 
     def _log(self, message: str) -> None:
         if self.logger:
@@ -414,9 +599,14 @@ async def _call_strategy(
     if handler is None:
         return []
     try:
-        result = handler(context)
-        if inspect.isawaitable(result):
-            result = await result
+        if inspect.iscoroutinefunction(handler):
+            result = await handler(context)
+        else:
+            # Sync strategies do their compute off the loop so touch polling
+            # and Discord traffic keep running while they work.
+            result = await asyncio.to_thread(handler, context)
+            if inspect.isawaitable(result):
+                result = await result
     except Exception as exc:
         if logger:
             name = getattr(strategy, "name", strategy.__class__.__name__)
@@ -488,9 +678,11 @@ def _build_signal_id(
 
 
 def _to_float(value: object) -> Optional[float]:
+    # Quote providers already store bid/ask/last as float|None, so the common
+    # case returns before the conversion and its try block.
+    if value is None or type(value) is float:
+        return value
     try:
-        if value is None:
-            return None
         return float(value)
     except (TypeError, ValueError):
         return None
@@ -500,6 +692,14 @@ def _format_price_key(value: float, places: int = 2) -> str:
     return f"{value:.{places}f}"
 
 
+def _mtime_ns(path) -> Optional[int]:
+    # One stat call answers both "does it exist" and "has it changed".
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def _timestamp_iso(value: datetime) -> str:
     if value.tzinfo is None:
         return value.replace(tzinfo=timezone.utc).isoformat()
@@ -521,6 +721,7 @@ def _bucket_from_candle(event: CandleCloseEvent) -> str:
     return _timestamp_iso(event.closed_at)
 
 
+@lru_cache(maxsize=32)
 def _parse_timeframe_minutes(timeframe: str) -> int:
     raw = str(timeframe).strip().upper().replace("M", "")
     try:
@@ -529,38 +730,50 @@ def _parse_timeframe_minutes(timeframe: str) -> int:
         return 0
 
 
-def _should_record(
-    seen: Dict[str, Dict[str, str]],
-    signal_id: str,
-    event_key: str,
-    bucket: str,
-) -> bool:
-    per_signal = seen.setdefault(signal_id, {})
-    last_bucket = per_signal.get(event_key)
-    if last_bucket == bucket:
-        return False
-    per_signal[event_key] = bucket
-    return True
-
-
-def discover_research_signals(root: Optional[Path] = None) -> List[object]:
+def discover_research_signals(
+    root: Optional[Path] = None,
+    *,
+    logger: Optional[Callable[[str], None]] = None,
+) -> List[object]:
     base = root or Path(__file__).resolve().parents[1] / "strategies_research" / "signals"
     if not base.exists():
         return []
+    with os.scandir(base) as entries:
+        names = sorted(
+            entry.name[:-3]
+            for entry in entries
+            if entry.name.endswith(".py")
+            and not entry.name.startswith("_")
+            and entry.name != "types.py"
+            and entry.is_file()
+        )
+    if not names:
+        return []
+    # Signal modules import independently, so their (often heavy) module-level
+    # setup overlaps; build() still runs in sorted order below.
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+        results = list(pool.map(_import_signal_module, names))
     signals: List[object] = []
-    for path in sorted(base.glob("*.py")):
-        if path.name.startswith("_") or path.name in ("types.py",):
-            continue
-        module_name = f"strategies_research.signals.{path.stem}"
-        try:
-            module = importlib.import_module(module_name)
-        except Exception:
+    for name, (module, error) in zip(names, results):
+        if module is None:
+            # Reported here rather than in the worker so failures log in file order.
+            if logger:
+                logger(f"[RESEARCH] Failed to import signal module {name}: {error!r}")
             continue
         build = getattr(module, "build_signal", None) or getattr(module, "build_strategy", None)
         if not callable(build):
             continue
         try:
             signals.append(build())
-        except Exception:
+        except Exception as exc:
+            if logger:
+                logger(f"[RESEARCH] Failed to build signal from {name}: {exc!r}")
             continue
     return signals
+
+
+def _import_signal_module(stem: str) -> tuple[Optional[object], Optional[BaseException]]:
+    try:
+        return importlib.import_module(f"strategies_research.signals.{stem}"), None
+    except Exception as exc:
+        return None, exc
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import ast
+import asyncio
+import copy
+import hashlib
 import importlib
-from dataclasses import dataclass
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import SimpleNamespace
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
 import cred
 from integrations.discord import bot, edit_discord_message, print_discord
 from integrations.discord.templates import format_strategy_report
 from paths import OPTIONS_STORAGE_DIR, OPTIONS_TRADE_LEDGER_PATH
-from shared_state import print_log, safe_read_json, safe_write_json
-from tools.analytics_trade_ledger import compute_metrics, load_positions
-from utils.json_utils import read_config
+from shared_state import print_log
+from tools.analytics_trade_ledger import compute_metrics, iter_positions
+from utils.json_utils import dumps_json, loads_json, read_config
 
 
 DEFAULT_CONFIG: Dict[str, Any] = {
@@ -21,20 +29,26 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 }
 
 STATE_PATH = OPTIONS_STORAGE_DIR / "strategy_report_message_ids.json"
+REPORT_SEND_CONCURRENCY = 5
 
 
 @dataclass
 class StrategyReportState:
     message_ids: Dict[str, int]
+    content_hashes: Dict[str, str] = field(default_factory=dict)
 
 
 def _merge_defaults(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    merged: Dict[str, Any] = dict(base)
-    for key, value in (override or {}).items():
-        if isinstance(value, dict) and isinstance(merged.get(key), dict):
-            merged[key] = _merge_defaults(merged[key], value)
-        else:
-            merged[key] = value
+    # One deep copy up front, then merge level by level in place; no recursion.
+    merged: Dict[str, Any] = copy.deepcopy(base)
+    stack = [(merged, override or {})]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict) and isinstance(target.get(key), dict):
+                stack.append((target[key], value))
+            else:
+                target[key] = value
     return merged
 
 
@@ -46,20 +60,26 @@ def _load_config() -> Dict[str, Any]:
 
 
 def _load_state(path: Path) -> StrategyReportState:
-    if not path.exists() or path.stat().st_size == 0:
-        return StrategyReportState(message_ids={})
-    data = safe_read_json(path, default={})
+    try:
+        data = loads_json(path.read_bytes())
+    except (OSError, ValueError):
+        data = {}
     if not isinstance(data, dict):
         data = {}
     message_ids = data.get("message_ids")
     if not isinstance(message_ids, dict):
         message_ids = {}
-    return StrategyReportState(message_ids=message_ids)
+    content_hashes = data.get("content_hashes")
+    if not isinstance(content_hashes, dict):
+        content_hashes = {}
+    return StrategyReportState(message_ids=message_ids, content_hashes=content_hashes)
 
 
 def _save_state(path: Path, state: StrategyReportState) -> None:
-    payload = {"message_ids": state.message_ids}
-    safe_write_json(path, payload)
+    payload = {"message_ids": state.message_ids, "content_hashes": state.content_hashes}
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    temp_path.write_text(dumps_json(payload, pretty=True), encoding="utf-8")
+    os.replace(temp_path, path)
 
 
 def _resolve_channel_id(config: Dict[str, Any]) -> int:
@@ -68,6 +88,12 @@ def _resolve_channel_id(config: Dict[str, Any]) -> int:
     return int(getattr(cred, "DISCORD_STRATEGY_REPORTING_CHANNEL_ID", 0) or 0)
 
 
+# Per (ledger, tag) metrics, reused while the tag's position count and latest event time hold.
+_METRICS_CACHE: Dict[Tuple[Path, str], Tuple[Tuple[int, Optional[datetime]], dict]] = {}
+
+# Strategy modules rarely change within a process; reuse the metadata until a file's mtime moves.
+_METADATA_CACHE: Dict[Path, Tuple[Tuple[Tuple[str, int], ...], Dict[str, dict]]] = {}
+
 _CONFIG_IGNORE_KEYS = {
     "STRATEGY_BASE_NAME",
     "STRATEGY_DESCRIPTION",
@@ -77,6 +103,7 @@ _CONFIG_IGNORE_KEYS = {
     "MODE",
     "SINGLE_TIMEFRAME",
     "TIMEFRAMES",
+    "CONFIG_SUMMARY_FIELDS",
 }
 
 
@@ -123,9 +150,17 @@ def _build_config_summary(module: object) -> Optional[str]:
         pieces.append(f"tf={tf_label}")
 
     extras: list[str] = []
-    for name, value in vars(module).items():
-        if not name.isupper() or name in _CONFIG_IGNORE_KEYS:
-            continue
+    fields = getattr(module, "CONFIG_SUMMARY_FIELDS", None)
+    if fields is not None:
+        items = [(name, getattr(module, name, None)) for name in fields]
+    else:
+        # Legacy modules without an allowlist: scan every UPPER_CASE global.
+        items = [
+            (name, value)
+            for name, value in vars(module).items()
+            if name.isupper() and name not in _CONFIG_IGNORE_KEYS
+        ]
+    for name, value in items:
         formatted = _format_config_value(value)
         if formatted is None or formatted == "":
             continue
@@ -135,19 +170,44 @@ def _build_config_summary(module: object) -> Optional[str]:
     return " | ".join(pieces) if pieces else None
 
 
+def _strategy_module_paths(base: Path) -> List[Path]:
+    return [
+        path
+        for path in sorted(base.glob("*.py"))
+        if not path.name.startswith("_") and path.name not in ("types.py", "exit_rules.py")
+    ]
+
+
+def _metadata_cache_key(paths: List[Path]) -> Tuple[Tuple[str, int], ...]:
+    key: List[Tuple[str, int]] = []
+    for path in paths:
+        try:
+            key.append((path.name, path.stat().st_mtime_ns))
+        except FileNotFoundError:
+            continue
+    return tuple(key)
+
+
 def _load_strategy_metadata(root: Optional[Path] = None) -> Dict[str, dict]:
     base = root or Path(__file__).resolve().parents[1] / "strategies" / "options"
     if not base.exists():
         return {}
+    paths = _strategy_module_paths(base)
+    cache_key = _metadata_cache_key(paths)
+    cached = _METADATA_CACHE.get(base)
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
     metadata: Dict[str, dict] = {}
-    for path in sorted(base.glob("*.py")):
-        if path.name.startswith("_") or path.name in ("types.py", "exit_rules.py"):
-            continue
-        module_name = f"strategies.options.{path.stem}"
-        try:
-            module = importlib.import_module(module_name)
-        except Exception:
-            continue
+    for path in paths:
+        constants = _scrape_module_constants(path)
+        if constants is not None and "STRATEGY_BASE_NAME" in constants:
+            # Metadata is plain literals; reading the AST avoids executing the module.
+            module = SimpleNamespace(**constants)
+        else:
+            try:
+                module = importlib.import_module(f"strategies.options.{path.stem}")
+            except Exception:
+                continue
         base_name = getattr(module, "STRATEGY_BASE_NAME", None)
         if not base_name:
             continue
@@ -163,72 +223,127 @@ def _load_strategy_metadata(root: Optional[Path] = None) -> Dict[str, dict]:
             "enabled": bool(enabled) if enabled is not None else None,
             "config_summary": config_summary,
         }
+    _METADATA_CACHE[base] = (cache_key, metadata)
     return metadata
 
 
-def _resolve_metadata(tag: str, metadata: Dict[str, dict]) -> dict:
+def _scrape_module_constants(path: Path) -> Optional[Dict[str, object]]:
+    """Top-level UPPER_CASE literals of a module, or None if any of them needs code to evaluate."""
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return None
+    constants: Dict[str, object] = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        names = [target.id for target in targets if isinstance(target, ast.Name) and target.id.isupper()]
+        if not names:
+            continue
+        if isinstance(node.value, ast.Name) and node.value.id in constants:
+            value = constants[node.value.id]  # alias of an earlier constant, e.g. TRAIL_STOP_EMA = FAST_EMA
+        else:
+            try:
+                value = ast.literal_eval(node.value)
+            except (ValueError, TypeError, SyntaxError):
+                return None
+        for name in names:
+            constants[name] = value
+    return constants
+
+
+def _resolve_metadata(tag: str, metadata: Dict[str, dict], bases_by_len: Optional[List[str]] = None) -> dict:
     if not tag or not metadata:
         return {}
     if tag in metadata:
         return metadata[tag]
-    for base_name in sorted(metadata.keys(), key=len, reverse=True):
+    if bases_by_len is None:
+        bases_by_len = sorted(metadata.keys(), key=len, reverse=True)
+    for base_name in bases_by_len:
         if tag.startswith(f"{base_name}-"):
             return metadata[base_name]
     return {}
 
 
+class _TempClientPool:
+    """REST-only Discord session used when the bot is offline; one login per report run."""
+
+    def __init__(self, logger) -> None:
+        self._logger = logger
+        self._http = None
+        self._params = None
+
+    async def __aenter__(self) -> Optional["_TempClientPool"]:
+        try:
+            from discord.http import HTTPClient, handle_message_parameters
+        except ImportError:
+            self._logger("[STRATEGY REPORT] discord module not available.")
+            return None
+        self._http = HTTPClient(asyncio.get_running_loop())
+        self._params = handle_message_parameters
+        try:
+            # Plain REST login: no gateway connection or on_ready round-trip.
+            await self._http.static_login(cred.DISCORD_TOKEN)
+        except Exception as exc:
+            self._logger(f"[STRATEGY REPORT] Temp client login failed: {exc}")
+            await self._close()
+            return None
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._close()
+
+    async def send_message(self, channel_id: int, content: str) -> int:
+        data = await self._http.send_message(channel_id, params=self._params(content=content))
+        return int(data["id"])
+
+    async def edit_message(self, channel_id: int, message_id: int, content: str) -> int:
+        data = await self._http.edit_message(channel_id, message_id, params=self._params(content=content))
+        return int(data["id"])
+
+    async def _close(self) -> None:
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+
 async def _send_with_temp_client(
-    message: str,
+    jobs: List[Tuple[str, str, Optional[int]]],
     channel_id: int,
     logger,
     *,
-    message_id: Optional[int] = None,
     update_existing: bool = False,
-) -> Optional[int]:
-    try:
-        import discord
-    except ImportError:
-        logger("[STRATEGY REPORT] discord module not available.")
-        return None
-
-    intents = discord.Intents.default()
-    client = discord.Client(intents=intents)
-    sent_id: Optional[int] = None
-
-    @client.event
-    async def on_ready():
-        nonlocal sent_id
-        try:
-            channel = client.get_channel(channel_id)
-            if channel is None:
-                channel = await client.fetch_channel(channel_id)
+) -> Dict[str, Optional[int]]:
+    # One login delivers every report; jobs are (tag, message, message_id).
+    results: Dict[str, Optional[int]] = {tag: None for tag, _, _ in jobs}
+    if not jobs:
+        return results
+    async with _TempClientPool(logger) as client:
+        if client is None:
+            return results
+        for tag, message, message_id in jobs:
+            sent_id: Optional[int] = None
             if message_id and update_existing:
                 try:
-                    existing = await channel.fetch_message(message_id)
-                    await existing.edit(content=message)
-                    sent_id = existing.id
+                    sent_id = await client.edit_message(channel_id, message_id, message)
                 except Exception as exc:
                     logger(f"[STRATEGY REPORT] Temp client edit failed: {exc}")
             if sent_id is None:
-                sent = await channel.send(message)
-                sent_id = sent.id
-        except Exception as exc:
-            logger(f"[STRATEGY REPORT] Temp client send failed: {exc}")
-        finally:
-            await client.close()
+                try:
+                    sent_id = await client.send_message(channel_id, message)
+                except Exception as exc:
+                    logger(f"[STRATEGY REPORT] Temp client send failed: {exc}")
+            results[tag] = sent_id
+    return results
 
-    try:
-        await client.start(cred.DISCORD_TOKEN)
-    except Exception as exc:
-        logger(f"[STRATEGY REPORT] Temp client login failed: {exc}")
-        return None
-    finally:
-        if not client.is_closed():
-            await client.close()
-        http = getattr(client, "http", None)
-        if http is not None:
-            await http.close()
-    return sent_id
+
+async def _limited(limit: asyncio.Semaphore, send: Awaitable):
+    async with limit:
+        return await send
 
 
 async def send_strategy_reports(
@@ -252,37 +367,34 @@ async def send_strategy_reports(
         log(f"[STRATEGY REPORT] Ledger not found: {path}")
         return
 
-    positions = load_positions(path)
-    if not positions:
+    by_tag: Dict[str, list] = defaultdict(list)
+    for position in iter_positions(path):
+        by_tag[position.strategy_tag or "unknown"].append(position)
+    if not by_tag:
         log("[STRATEGY REPORT] No positions found; skipping.")
         return
 
-    by_tag: Dict[str, list] = {}
-    for position in positions:
-        tag = position.strategy_tag or "unknown"
-        by_tag.setdefault(tag, []).append(position)
-
     state = _load_state(STATE_PATH)
     updated = False
     use_temp_client = not bot.is_ready()
     metadata = _load_strategy_metadata()
-
-    for tag in sorted(by_tag.keys()):
-        metrics = compute_metrics(by_tag[tag])
-        last_updated = trading_day
-        meta = _resolve_metadata(tag, metadata)
-        description = meta.get("description")
-        assessment = meta.get("assessment")
-        enabled = meta.get("enabled")
-        config_summary = meta.get("config_summary")
+    bases_by_len = sorted(metadata.keys(), key=len, reverse=True)  # longest prefix wins
+    update_existing = bool(config.get("update_existing", True))
+    temp_jobs: List[Tuple[str, str, Optional[int]]] = []
+    bot_sends: List[Tuple[str, bool, Awaitable]] = []
+    content_hashes: Dict[str, str] = {}
+
+    for tag, positions in sorted(by_tag.items()):
+        metrics = _cached_metrics(path, tag, positions)
+        meta = _resolve_metadata(tag, metadata, bases_by_len)
         message = format_strategy_report(
             tag,
             metrics,
-            description=description,
-            last_updated=last_updated,
-            assessment=assessment,
-            enabled=enabled,
-            config_summary=config_summary,
+            description=meta.get("description"),
+            last_updated=trading_day,
+            assessment=meta.get("assessment"),
+            enabled=meta.get("enabled"),
+            config_summary=meta.get("config_summary"),
         )
 
         message_id = state.message_ids.get(tag)
@@ -292,24 +404,70 @@ async def send_strategy_reports(
             except (TypeError, ValueError):
                 message_id = None
 
-        if message_id and config.get("update_existing", True) and not use_temp_client:
-            await edit_discord_message(message_id, message, channel_id=target_channel)
+        content_hash = _content_hash(message)
+        if message_id and update_existing and state.content_hashes.get(tag) == content_hash:
+            continue  # the posted report already says this; skip the edit round-trip
+        content_hashes[tag] = content_hash
+
+        if use_temp_client:
+            temp_jobs.append((tag, message, message_id))
+        elif message_id and update_existing:
+            bot_sends.append((tag, False, edit_discord_message(message_id, message, channel_id=target_channel)))
         else:
-            if use_temp_client:
-                sent_id = await _send_with_temp_client(
-                    message,
-                    target_channel,
-                    log,
-                    message_id=message_id,
-                    update_existing=bool(config.get("update_existing", True)),
-                )
-            else:
-                sent = await print_discord(message, channel_id=target_channel)
-                sent_id = sent.id if sent else None
-            if sent_id:
+            bot_sends.append((tag, True, print_discord(message, channel_id=target_channel)))
+
+    if bot_sends:
+        # Reports are independent HTTP calls; run them together, capped to
+        # stay under Discord's per-second request budget.
+        limit = asyncio.Semaphore(REPORT_SEND_CONCURRENCY)
+        results = await asyncio.gather(
+            *(_limited(limit, send) for _, _, send in bot_sends),
+            return_exceptions=True,
+        )
+        for (tag, is_new, _), result in zip(bot_sends, results):
+            if isinstance(result, Exception):
+                log(f"[STRATEGY REPORT] {tag} send failed: {result}")
+                continue
+            if not result:
+                continue  # the Discord helpers log and return None when delivery failed
+            sent_id = result.id if is_new else None
+            if is_new and not sent_id:
+                continue
+            if sent_id and state.message_ids.get(tag) != sent_id:
+                state.message_ids[tag] = sent_id
+            state.content_hashes[tag] = content_hashes[tag]
+            updated = True
+
+    if temp_jobs:
+        sent_ids = await _send_with_temp_client(
+            temp_jobs,
+            target_channel,
+            log,
+            update_existing=update_existing,
+        )
+        for tag, sent_id in sent_ids.items():
+            if not sent_id:
+                continue
+            if state.message_ids.get(tag) != sent_id:
                 state.message_ids[tag] = sent_id
-                updated = True
+            state.content_hashes[tag] = content_hashes[tag]
+            updated = True
 
     if updated:
         STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
         _save_state(STATE_PATH, state)
+
+
+def _content_hash(message: str) -> str:
+    return hashlib.blake2b(message.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _cached_metrics(path: Path, tag: str, positions: list) -> dict:
+    # Any new ledger event for the tag either adds a position or moves its latest event time.
+    fingerprint = (len(positions), max((p.last_event_at for p in positions if p.last_event_at), default=None))
+    cached = _METRICS_CACHE.get((path, tag))
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    metrics = compute_metrics(positions)
+    _METRICS_CACHE[(path, tag)] = (fingerprint, metrics)
+    return metrics
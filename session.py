@@ -4,6 +4,7 @@ import cred
 import aiohttp
 import pandas_market_calendars as mcal
 from datetime import datetime
+from functools import lru_cache
 from shared_state import print_log
 from utils.timezone import NY_TZ_NAME
 
@@ -17,9 +18,14 @@ def get_session_bounds(day_str: str):
     raw_open, raw_close = _nyse_session(day_str)
     return normalize_session_times(raw_open, raw_close)
 
+@lru_cache(maxsize=1)
+def _nyse_calendar():
+    return mcal.get_calendar("NYSE")
+
+@lru_cache(maxsize=32)
 def _nyse_session(day_str: str):
-    cal = mcal.get_calendar("NYSE")
-    sched = cal.schedule(start_date=day_str, end_date=day_str)
+    # Timestamps are immutable, so repeat lookups for a day can share one result.
+    sched = _nyse_calendar().schedule(start_date=day_str, end_date=day_str)
     if sched.empty:
         return None, None
     row = sched.iloc[0]
@@ -29,22 +35,37 @@ def _nyse_session(day_str: str):
         row["market_close"].tz_convert(NY_TZ_NAME),
     )
 
+_HTTP_SESSION = None
+
+def _get_http_session():
+    """Return the shared Polygon HTTP session, creating it on first use."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        _HTTP_SESSION = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=300))
+    return _HTTP_SESSION
+
+async def close_http_session():
+    global _HTTP_SESSION
+    if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+        await _HTTP_SESSION.close()
+    _HTTP_SESSION = None
+
 async def is_market_open():
     """Check if the stock market is open today using Polygon.io API."""
     url = "https://api.polygon.io/v1/marketstatus/now"
     params = {"apiKey": cred.POLYGON_API_KEY}
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    print_log(f"\n[DATA_AQUISITION] 'is_market_open()' DATA: \n{data}\n")
-                    market_status = data.get("market", "closed")
-                    return market_status in ["open", "extended-hours"]
-                else:
-                    print_log(f"[ERROR] Polygon API request failed with status {response.status}: {await response.text()}")
-                    return False
+        session = _get_http_session()
+        async with session.get(url, params=params) as response:
+            if response.status == 200:
+                data = await response.json()
+                print_log(f"\n[DATA_AQUISITION] 'is_market_open()' DATA: \n{data}\n")
+                market_status = data.get("market", "closed")
+                return market_status in ["open", "extended-hours"]
+            else:
+                print_log(f"[ERROR] Polygon API request failed with status {response.status}: {await response.text()}")
+                return False
     except Exception as e:
         print_log(f"[ERROR] Exception in is_market_open: {e}")
         return False
@@ -56,6 +77,7 @@ async def wait_until_market_open(target_time, tz):
         remaining = (target_time - now).total_seconds()
         if remaining <= 0.2:
             break
-        # sleep in larger chunks until the last second
-        await asyncio.sleep(min(remaining - 0.1, 1.0))
+        # one sleep straight to just before the target; the loop only repeats
+        # if the wall clock moved while we slept
+        await asyncio.sleep(remaining - 0.1)
     print_log("Market open hit; starting...")
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Callable, List, Sequence, TypeVar, Union
+
+
+StrategyT = TypeVar("StrategyT")
+
+
+def build_for_timeframes(
+    factory: Callable[..., StrategyT],
+    *,
+    base_name: str,
+    mode: str,
+    timeframes: Sequence[str],
+    single_timeframe: str,
+    default_timeframe: str,
+    **kwargs,
+) -> Union[StrategyT, List[StrategyT]]:
+    # Multi mode builds one "<base>-<tf>" instance per timeframe; single mode builds one.
+    if (mode or "single").lower() == "multi":
+        strategies = [
+            factory(timeframe=tf, name=f"{base_name}-{tf.lower()}", **kwargs)
+            for tf in (timeframes or [single_timeframe or default_timeframe])
+            if tf
+        ]
+        if strategies:
+            return strategies
+        return factory(timeframe=single_timeframe or default_timeframe, name=base_name, **kwargs)
+    timeframe = single_timeframe or (timeframes[0] if timeframes else default_timeframe)
+    return factory(timeframe=timeframe, name=base_name, **kwargs)
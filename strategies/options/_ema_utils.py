@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+
+def sorted_ema_keys(ema_snapshot: dict) -> Tuple[str, ...]:
+    # Snapshots carry the same EMA labels every candle, so memoize the order per key set.
+    return _sort_ema_key_tuple(tuple(ema_snapshot))
+
+
+def float_ema_snapshot(ema_snapshot: dict) -> Dict[str, float]:
+    # Cast once per candle; lookups are then plain dict reads.
+    floats: Dict[str, float] = {}
+    for key, value in ema_snapshot.items():
+        if value is None:
+            continue
+        if value.__class__ is float:
+            floats[key] = value
+            continue
+        try:
+            floats[key] = float(value)
+        except (TypeError, ValueError):
+            continue
+    return floats
+
+
+def tag_matches(base: str, tag: Optional[str]) -> bool:
+    if not tag:
+        return False
+    if tag == base:
+        return True
+    return tag.startswith(f"{base}-")
+
+
+@lru_cache(maxsize=32)
+def _sort_ema_key_tuple(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(sorted((key for key in keys if key != "x"), key=_ema_sort_key))
+
+
+def _ema_sort_key(value: str) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("inf")
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Mapping, Optional, Sequence
+
+
+def run_backtests_parallel(
+    strategies: Sequence[object],
+    panels: Mapping[str, Mapping[str, Any]],
+    *,
+    max_workers: Optional[int] = None,
+) -> List[Any]:
+    """Run each strategy's batch run_backtest on the panel for its timeframe, one process per job.
+
+    Results come back in strategy order. Strategies without a panel for their timeframe
+    get None. Multi mode strategies keep independent state, so the jobs share nothing.
+    """
+    jobs = [(idx, strategy, panels.get(strategy.timeframe)) for idx, strategy in enumerate(strategies)]
+    results: List[Any] = [None] * len(jobs)
+    jobs = [job for job in jobs if job[2] is not None]
+    if not jobs:
+        return results
+    if len(jobs) == 1:
+        _, strategy, panel = jobs[0]
+        results[jobs[0][0]] = strategy.run_backtest(panel)
+        return results
+    workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+    # spawn keeps workers independent of whatever the parent has running (event loop, sockets).
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [(idx, pool.submit(_run_backtest, strategy, panel)) for idx, strategy, panel in jobs]
+        for idx, future in futures:
+            results[idx] = future.result()
+    return results
+
+
+def _run_backtest(strategy: object, panel: Mapping[str, Any]) -> Any:
+    return strategy.run_backtest(panel)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import numpy as np
+
+from ._ema_utils import float_ema_snapshot, sorted_ema_keys, tag_matches
 from .types import PositionAction, StrategyContext, StrategySignal
 
 
@@ -10,6 +13,7 @@ STRATEGY_BASE_NAME = "candle-ema-break"
 MODE = "single"  # "single" or "multi"
 SINGLE_TIMEFRAME = "2M"
 TIMEFRAMES = ["2M", "5M", "15M"]
+CONFIG_SUMMARY_FIELDS = ()  # constants shown in the strategy report
 STRATEGY_DESCRIPTION = (
     "Triggers when a candle body crosses above/below an EMA and sets direction. "
     "Exits when a candle breaks back through the same EMA to stop out. "
@@ -46,25 +50,26 @@ class CandleEmaBreakStrategy:
         if open_price is None or close_price is None:
             return None
 
+        ema = float_ema_snapshot(context.ema)
         if self._active_direction and self._active_ema:
-            ema_value = _get_ema_value(context.ema, self._active_ema)
+            ema_value = ema.get(self._active_ema)
             if ema_value is None:
                 return None
             if self._active_direction == "call":
-                if _crossed_down(open_price, close_price, ema_value):
+                if open_price >= ema_value > close_price:
                     self._pending_stop = True
                     self._stop_reason = f"Stop: candle broke EMA {self._active_ema} down"
             else:
-                if _crossed_up(open_price, close_price, ema_value):
+                if open_price <= ema_value < close_price:
                     self._pending_stop = True
                     self._stop_reason = f"Stop: candle broke EMA {self._active_ema} up"
             return None
 
-        for ema_key in _sorted_ema_keys(context.ema):
-            ema_value = _get_ema_value(context.ema, ema_key)
+        for ema_key in sorted_ema_keys(context.ema):
+            ema_value = ema.get(ema_key)
             if ema_value is None:
                 continue
-            if _crossed_up(open_price, close_price, ema_value):
+            if open_price <= ema_value < close_price:
                 self._active_direction = "call"
                 self._active_ema = ema_key
                 self._pending_stop = False
@@ -73,7 +78,7 @@ class CandleEmaBreakStrategy:
                     direction="call",
                     reason=f"Candle broke EMA {ema_key} up",
                 )
-            if _crossed_down(open_price, close_price, ema_value):
+            if open_price >= ema_value > close_price:
                 self._active_direction = "put"
                 self._active_ema = ema_key
                 self._pending_stop = False
@@ -84,11 +89,43 @@ class CandleEmaBreakStrategy:
                 )
         return None
 
+    @classmethod
+    def run_vectorized(cls, opens, closes, emas: Dict[str, np.ndarray]) -> np.ndarray:
+        """Replay a full candle series for backtests without a Python call per candle.
+
+        Returns an int8 array: 1 = call entry, -1 = put entry, 2 = stop hit, 0 = nothing.
+        The position is treated as closed on its stop candle, as the live runner does
+        on the next position update. Missing EMA values should be NaN.
+        """
+        opens = np.asarray(opens, dtype=float)
+        closes = np.asarray(closes, dtype=float)
+        signals = np.zeros(len(opens), dtype=np.int8)
+        keys = sorted_ema_keys(emas)
+        if not keys or not len(opens):
+            return signals
+        ema_matrix = np.column_stack([np.asarray(emas[key], dtype=float) for key in keys])
+        # NaN compares False, matching the live path skipping missing EMAs.
+        cross_up = (opens[:, None] <= ema_matrix) & (ema_matrix < closes[:, None])
+        cross_down = (opens[:, None] >= ema_matrix) & (ema_matrix > closes[:, None])
+        crossed = cross_up | cross_down
+        active_col: Optional[int] = None
+        direction = 0
+        for row in np.flatnonzero(crossed.any(axis=1)):
+            if active_col is None:
+                col = int(np.argmax(crossed[row]))  # lowest EMA first, as in the live loop
+                direction = 1 if cross_up[row, col] else -1
+                active_col = col
+                signals[row] = direction
+            elif cross_down[row, active_col] if direction == 1 else cross_up[row, active_col]:
+                signals[row] = 2
+                active_col = None
+        return signals
+
     def on_position_update(self, updates):
         if not self._pending_stop or not updates:
             return None
         update = updates[0]
-        if update.strategy_tag and not _tag_matches(self.name, update.strategy_tag):
+        if update.strategy_tag and not tag_matches(self.name, update.strategy_tag):
             return None
         self._pending_stop = False
         self._active_direction = None
@@ -103,44 +140,6 @@ class CandleEmaBreakStrategy:
         )
 
 
-def _sorted_ema_keys(ema_snapshot: dict) -> List[str]:
-    keys = [key for key in ema_snapshot.keys() if key != "x"]
-    return sorted(keys, key=_ema_sort_key)
-
-
-def _ema_sort_key(value: str) -> float:
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return float("inf")
-
-
-def _get_ema_value(ema_snapshot: dict, key: str) -> Optional[float]:
-    value = ema_snapshot.get(key)
-    if value is None:
-        return None
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
-
-
-def _crossed_up(open_price: float, close_price: float, ema_value: float) -> bool:
-    return open_price <= ema_value < close_price
-
-
-def _crossed_down(open_price: float, close_price: float, ema_value: float) -> bool:
-    return open_price >= ema_value > close_price
-
-
-def _tag_matches(base: str, tag: Optional[str]) -> bool:
-    if not tag:
-        return False
-    if tag == base:
-        return True
-    return tag.startswith(f"{base}-")
-
-
 def build_strategy() -> object:
     if not IS_ENABLED:
         return None
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from ._ema_utils import float_ema_snapshot, sorted_ema_keys, tag_matches
 from .types import PositionAction, StrategyContext, StrategySignal
 
 
@@ -12,6 +13,7 @@ TIMEFRAMES = ["5M", "15M"] # , "2M"]
 FAST_EMA = "13"
 SLOW_EMA = "48"
 TRAIL_STOP_EMA = FAST_EMA
+CONFIG_SUMMARY_FIELDS = ("FAST_EMA", "SLOW_EMA", "TRAIL_STOP_EMA")  # constants shown in the strategy report
 IS_ENABLED = True  # Set to True to enable this strategy
 STRATEGY_DESCRIPTION = (
     "Candle/EMA break entries filtered by trend alignment (fast vs slow EMA). "
@@ -58,22 +60,23 @@ class CandleEmaBreakTrendTrailStrategy:
         if open_price is None or close_price is None:
             return None
 
+        ema = float_ema_snapshot(context.ema)
         if self._active_direction and self._entry_ema:
-            stop_ema_key = self._resolve_stop_ema_key(context.ema)
+            stop_ema_key = self._resolve_stop_ema_key(ema)
             if not stop_ema_key:
                 return None
-            stop_ema_value = _get_ema_value(context.ema, stop_ema_key)
+            stop_ema_value = ema.get(stop_ema_key)
             if stop_ema_value is None:
                 return None
             if self._active_direction == "call":
-                if _crossed_down(open_price, close_price, stop_ema_value):
+                if open_price >= stop_ema_value > close_price:
                     stage = "trail" if self._trail_armed else "initial"
                     self._pending_stop = True
                     self._stop_reason = (
                         f"Stop ({stage}): candle broke EMA {stop_ema_key} down"
                     )
             else:
-                if _crossed_up(open_price, close_price, stop_ema_value):
+                if open_price <= stop_ema_value < close_price:
                     stage = "trail" if self._trail_armed else "initial"
                     self._pending_stop = True
                     self._stop_reason = (
@@ -81,15 +84,15 @@ class CandleEmaBreakTrendTrailStrategy:
                     )
             return None
 
-        trend_direction = _trend_direction(context.ema, self.fast, self.slow)
+        trend_direction = _trend_direction(ema, self.fast, self.slow)
         if not trend_direction:
             return None
 
-        for ema_key in _sorted_ema_keys(context.ema):
-            ema_value = _get_ema_value(context.ema, ema_key)
+        for ema_key in sorted_ema_keys(context.ema):
+            ema_value = ema.get(ema_key)
             if ema_value is None:
                 continue
-            if trend_direction == "call" and _crossed_up(open_price, close_price, ema_value):
+            if trend_direction == "call" and open_price <= ema_value < close_price:
                 self._activate_position(direction="call", entry_ema=ema_key)
                 return StrategySignal(
                     direction="call",
@@ -98,7 +101,7 @@ class CandleEmaBreakTrendTrailStrategy:
                         f"{self.fast} above slow EMA {self.slow}"
                     ),
                 )
-            if trend_direction == "put" and _crossed_down(open_price, close_price, ema_value):
+            if trend_direction == "put" and open_price >= ema_value > close_price:
                 self._activate_position(direction="put", entry_ema=ema_key)
                 return StrategySignal(
                     direction="put",
@@ -117,7 +120,7 @@ class CandleEmaBreakTrendTrailStrategy:
             return None
 
         update = updates[0]
-        if update.strategy_tag and not _tag_matches(self.name, update.strategy_tag):
+        if update.strategy_tag and not tag_matches(self.name, update.strategy_tag):
             return None
 
         reason = self._stop_reason or "Stop"
@@ -140,19 +143,18 @@ class CandleEmaBreakTrendTrailStrategy:
         self._pending_stop = False
         self._stop_reason = None
 
-    def _resolve_stop_ema_key(self, ema_snapshot: dict) -> Optional[str]:
-        self._trail_armed = self._should_use_trail_stop(ema_snapshot)
+    def _resolve_stop_ema_key(self, ema: Dict[str, float]) -> Optional[str]:
+        self._trail_armed = self._should_use_trail_stop(ema)
         if self._trail_armed:
-            trail_value = _get_ema_value(ema_snapshot, self.trail_stop_ema)
-            if trail_value is not None:
+            if self.trail_stop_ema in ema:
                 return self.trail_stop_ema
         return self._entry_ema
 
-    def _should_use_trail_stop(self, ema_snapshot: dict) -> bool:
+    def _should_use_trail_stop(self, ema: Dict[str, float]) -> bool:
         if not self._entry_ema or not self._active_direction:
             return False
-        entry_value = _get_ema_value(ema_snapshot, self._entry_ema)
-        trail_value = _get_ema_value(ema_snapshot, self.trail_stop_ema)
+        entry_value = ema.get(self._entry_ema)
+        trail_value = ema.get(self.trail_stop_ema)
         if entry_value is None or trail_value is None:
             return False
         if self._active_direction == "call":
@@ -162,9 +164,9 @@ class CandleEmaBreakTrendTrailStrategy:
         return False
 
 
-def _trend_direction(ema_snapshot: dict, fast: str, slow: str) -> Optional[str]:
-    fast_value = _get_ema_value(ema_snapshot, fast)
-    slow_value = _get_ema_value(ema_snapshot, slow)
+def _trend_direction(ema: Dict[str, float], fast: str, slow: str) -> Optional[str]:
+    fast_value = ema.get(fast)
+    slow_value = ema.get(slow)
     if fast_value is None or slow_value is None:
         return None
     if fast_value > slow_value:
@@ -174,44 +176,6 @@ def _trend_direction(ema_snapshot: dict, fast: str, slow: str) -> Optional[str]:
     return None
 
 
-def _sorted_ema_keys(ema_snapshot: dict) -> List[str]:
-    keys = [key for key in ema_snapshot.keys() if key != "x"]
-    return sorted(keys, key=_ema_sort_key)
-
-
-def _ema_sort_key(value: str) -> float:
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return float("inf")
-
-
-def _get_ema_value(ema_snapshot: dict, key: str) -> Optional[float]:
-    value = ema_snapshot.get(key)
-    if value is None:
-        return None
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
-
-
-def _crossed_up(open_price: float, close_price: float, ema_value: float) -> bool:
-    return open_price <= ema_value < close_price
-
-
-def _crossed_down(open_price: float, close_price: float, ema_value: float) -> bool:
-    return open_price >= ema_value > close_price
-
-
-def _tag_matches(base: str, tag: Optional[str]) -> bool:
-    if not tag:
-        return False
-    if tag == base:
-        return True
-    return tag.startswith(f"{base}-")
-
-
 def build_strategy() -> object:
     if not IS_ENABLED:
         return None
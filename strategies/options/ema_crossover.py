@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import sys
+from typing import Optional
 
+import numpy as np
+
+from ._build_helpers import build_for_timeframes
 from .exit_rules import ProfitTargetPlan, ProfitTargetStep
 from .types import StrategyContext, StrategySignal
 
@@ -11,6 +15,7 @@ SINGLE_TIMEFRAME = "15M"
 TIMEFRAMES = ["2M", "5M", "15M"]
 FAST_EMA = "13"
 SLOW_EMA = "48"
+CONFIG_SUMMARY_FIELDS = ("FAST_EMA", "SLOW_EMA")  # constants shown in the strategy report
 IS_ENABLED = True
 STRATEGY_DESCRIPTION = (
     "Tracks a fast/slow EMA crossover on the configured timeframe. "
@@ -21,7 +26,16 @@ STRATEGY_ASSESSMENT = ""
 
 
 class EmaCrossoverStrategy:
-    name = STRATEGY_BASE_NAME
+    __slots__ = (
+        "timeframe",
+        "fast",
+        "slow",
+        "name",
+        "_reason_call",
+        "_reason_put",
+        "_last_direction",
+        "exit_plan",
+    )
 
     def __init__(
         self,
@@ -32,13 +46,16 @@ class EmaCrossoverStrategy:
         name: Optional[str] = None,
     ) -> None:
         self.timeframe = timeframe
-        self.fast = fast
-        self.slow = slow
-        if name:
-            self.name = name
+        # Interned so lookups against the runner's interned snapshot keys hit on identity.
+        self.fast = sys.intern(fast)
+        self.slow = sys.intern(slow)
+        # Slots rule out a class-level default name, so it is always set here.
+        self.name = name or STRATEGY_BASE_NAME
+        self._reason_call = f"EMA crossover {self.fast}>{self.slow}"
+        self._reason_put = f"EMA crossover {self.fast}<{self.slow}"
         self._last_direction: Optional[str] = None
         # Take-profit plan uses watcher updates for trims/closes.
-        self.exit_plan = ProfitTargetPlan([
+        self.exit_plan = ProfitTargetPlan((
             ProfitTargetStep(
                 target_pct=100.0,
                 action="trim",
@@ -49,7 +66,7 @@ class EmaCrossoverStrategy:
                 target_pct=200.0, 
                 action="close",
             ),
-        ])
+        ))
 
     def on_position_update(self, updates):
         return self.exit_plan.evaluate(updates, timeframe=self.timeframe)
@@ -58,11 +75,12 @@ class EmaCrossoverStrategy:
         if context.timeframe != self.timeframe:
             return None
 
-        if not context.ema:
+        ema = context.ema
+        if not ema:
             return None
 
-        fast_val = context.ema.get(self.fast)
-        slow_val = context.ema.get(self.slow)
+        fast_val = ema.get(self.fast)
+        slow_val = ema.get(self.slow)
         if fast_val is None or slow_val is None:
             return None
 
@@ -77,42 +95,43 @@ class EmaCrossoverStrategy:
             return None
 
         self._last_direction = direction
-        reason = f"EMA crossover {self.fast}>{self.slow}" if direction == "call" else f"EMA crossover {self.fast}<{self.slow}"
+        reason = self._reason_call if direction == "call" else self._reason_put
         return StrategySignal(direction=direction, reason=reason)
 
+    @classmethod
+    def backtest_batch(cls, fast, slow) -> np.ndarray:
+        """Replay fast/slow EMA series for backtests without a Python call per candle.
+
+        Returns an int8 array: 1 = new call signal, -1 = new put signal, 0 = nothing.
+        Missing EMA values should be NaN; like equal values they leave the last
+        direction untouched.
+        """
+        fast = np.asarray(fast, dtype=float)
+        slow = np.asarray(slow, dtype=float)
+        # NaN compares False both ways, so it yields 0 like a missing EMA.
+        directions = (fast > slow).astype(np.int8) - (fast < slow).astype(np.int8)
+        signals = np.zeros(len(directions), dtype=np.int8)
+        rows = np.flatnonzero(directions)
+        if not len(rows):
+            return signals
+        moves = directions[rows]
+        flips = np.empty(len(moves), dtype=bool)
+        flips[0] = True
+        np.not_equal(moves[1:], moves[:-1], out=flips[1:])
+        signals[rows[flips]] = moves[flips]
+        return signals
+
 
 def build_strategy() -> object:
     if not IS_ENABLED:
         return None
-    base_name = STRATEGY_BASE_NAME
-    mode = str(MODE or "single").lower()
-    if mode == "multi":
-        timeframes = TIMEFRAMES if isinstance(TIMEFRAMES, list) else []
-        if not timeframes:
-            timeframes = [SINGLE_TIMEFRAME] if SINGLE_TIMEFRAME else ["15M"]
-        strategies: List[EmaCrossoverStrategy] = []
-        for tf in timeframes:
-            if not tf:
-                continue
-            name = f"{base_name}-{str(tf).lower()}"
-            strategies.append(
-                EmaCrossoverStrategy(
-                    timeframe=str(tf),
-                    fast=FAST_EMA,
-                    slow=SLOW_EMA,
-                    name=name,
-                )
-            )
-        return strategies or EmaCrossoverStrategy(
-            timeframe=SINGLE_TIMEFRAME or "15M",
-            fast=FAST_EMA,
-            slow=SLOW_EMA,
-            name=base_name,
-        )
-    single_tf = SINGLE_TIMEFRAME or (TIMEFRAMES[0] if TIMEFRAMES else "15M")
-    return EmaCrossoverStrategy(
-        timeframe=single_tf,
+    return build_for_timeframes(
+        EmaCrossoverStrategy,
+        base_name=STRATEGY_BASE_NAME,
+        mode=MODE,
+        timeframes=TIMEFRAMES,
+        single_timeframe=SINGLE_TIMEFRAME,
+        default_timeframe="15M",
         fast=FAST_EMA,
         slow=SLOW_EMA,
-        name=base_name,
     )
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import sys
+from typing import Dict, Mapping, Optional, Tuple
 
+import numpy as np
+
+from ._build_helpers import build_for_timeframes
+from ._ema_utils import float_ema_snapshot, sorted_ema_keys
 from .types import PositionAction, StrategyContext, StrategySignal
 
 
@@ -16,6 +21,15 @@ TREND_MIN_SPREAD_PCT = 0.18
 CHOP_MAX_SPREAD_PCT = 0.10
 SNAP_SETUP_MAX_BARS = 4
 SNAP_MAX_BARS_IN_TRADE = 6
+CONFIG_SUMMARY_FIELDS = (  # constants shown in the strategy report
+    "FAST_EMA",
+    "SLOW_EMA",
+    "TRAIL_STOP_EMA",
+    "TREND_MIN_SPREAD_PCT",
+    "CHOP_MAX_SPREAD_PCT",
+    "SNAP_SETUP_MAX_BARS",
+    "SNAP_MAX_BARS_IN_TRADE",
+)
 IS_ENABLED = False  # Set to True to enable this strategy
 STRATEGY_DESCRIPTION = (
     "Regime-adaptive strategy that trades trend continuation when EMA spread is wide "
@@ -27,7 +41,31 @@ STRATEGY_ASSESSMENT = ""
 
 
 class EmaRegimeFusionStrategy:
-    name = STRATEGY_BASE_NAME
+    __slots__ = (
+        "timeframe",
+        "fast",
+        "slow",
+        "trail_stop_ema",
+        "trend_min_spread_pct",
+        "chop_max_spread_pct",
+        "snap_setup_max_bars",
+        "snap_max_bars_in_trade",
+        "name",
+        "_tag_prefix",
+        "_snap_call_reason",
+        "_snap_put_reason",
+        "_active_mode",
+        "_active_direction",
+        "_bars_in_trade",
+        "_trend_entry_ema",
+        "_trend_using_trail",
+        "_snap_stop_level",
+        "_setup_direction",
+        "_setup_excursion",
+        "_setup_bars",
+        "_pending_close",
+        "_close_reason",
+    )
 
     def __init__(
         self,
@@ -43,15 +81,25 @@ class EmaRegimeFusionStrategy:
         name: Optional[str] = None,
     ) -> None:
         self.timeframe = timeframe
-        self.fast = fast
-        self.slow = slow
-        self.trail_stop_ema = trail_stop_ema
+        # Interned so lookups against the runner's interned snapshot keys hit on identity.
+        self.fast = sys.intern(fast)
+        self.slow = sys.intern(slow)
+        self.trail_stop_ema = sys.intern(trail_stop_ema)
         self.trend_min_spread_pct = float(trend_min_spread_pct)
         self.chop_max_spread_pct = float(chop_max_spread_pct)
         self.snap_setup_max_bars = int(snap_setup_max_bars)
         self.snap_max_bars_in_trade = int(snap_max_bars_in_trade)
-        if name:
-            self.name = name
+        # Slots rule out a class-level default name, so it is always set here.
+        self.name = sys.intern(name) if name else STRATEGY_BASE_NAME
+        self._tag_prefix = f"{self.name}-"
+        self._snap_call_reason = (
+            f"Chop regime snapback call: extension below EMA {self.slow}, "
+            f"reclaim above EMA {self.fast}"
+        )
+        self._snap_put_reason = (
+            f"Chop regime snapback put: extension above EMA {self.slow}, "
+            f"reclaim below EMA {self.fast}"
+        )
 
         self._active_mode: Optional[str] = None  # "trend" | "snap"
         self._active_direction: Optional[str] = None  # "call" | "put"
@@ -73,7 +121,7 @@ class EmaRegimeFusionStrategy:
         if context.timeframe != self.timeframe:
             return None
 
-        ema = context.ema or {}
+        ema = context.ema
         if not ema:
             return None
 
@@ -85,8 +133,9 @@ class EmaRegimeFusionStrategy:
         high_price = _resolve_high(candle, open_price, close_price)
         low_price = _resolve_low(candle, open_price, close_price)
 
-        fast_value = _get_ema_value(ema, self.fast)
-        slow_value = _get_ema_value(ema, self.slow)
+        ema = float_ema_snapshot(ema)
+        fast_value = ema.get(self.fast)
+        slow_value = ema.get(self.slow)
         if fast_value is None or slow_value is None:
             return None
 
@@ -109,11 +158,11 @@ class EmaRegimeFusionStrategy:
             return None
 
         regime = _resolve_regime(
-            fast_value=fast_value,
-            slow_value=slow_value,
-            price=close_price,
-            trend_min_spread_pct=self.trend_min_spread_pct,
-            chop_max_spread_pct=self.chop_max_spread_pct,
+            fast_value,
+            slow_value,
+            close_price,
+            self.trend_min_spread_pct,
+            self.chop_max_spread_pct,
         )
 
         if regime == "trend":
@@ -142,8 +191,12 @@ class EmaRegimeFusionStrategy:
     def on_position_update(self, updates):
         if not self._pending_close or not updates:
             return None
+        name = self.name
+        prefix = self._tag_prefix
         for update in updates:
-            if update.strategy_tag and not _tag_matches(self.name, update.strategy_tag):
+            tag = update.strategy_tag
+            # str == checks identity first, so the interned-name case never compares characters.
+            if tag and tag != name and not tag.startswith(prefix):
                 continue
             reason = self._close_reason or "Exit"
             self._reset_position()
@@ -155,32 +208,194 @@ class EmaRegimeFusionStrategy:
             )
         return None
 
+    def run_backtest(self, panel: Mapping[str, object]) -> Tuple[np.ndarray, np.ndarray]:
+        """Replay an OHLC + EMA panel for backtests using this instance's settings.
+
+        ``panel`` holds ``open``/``high``/``low``/``close`` arrays and an ``ema`` mapping
+        of EMA key -> array; missing values should be NaN. Returns two int8 arrays:
+        entry direction (1 = call, -1 = put, 0 = nothing) and close flags. A position
+        is treated as closed on the candle its exit fires, as the live runner does on
+        the next position update. The live state of this instance is left untouched.
+        """
+        opens = np.asarray(panel["open"], dtype=float)
+        closes = np.asarray(panel["close"], dtype=float)
+        size = len(opens)
+        signals = np.zeros(size, dtype=np.int8)
+        close_flags = np.zeros(size, dtype=np.int8)
+        emas = panel.get("ema") or {}
+        if not size or self.fast not in emas or self.slow not in emas:
+            return signals, close_flags
+        highs = np.asarray(panel.get("high", np.full(size, np.nan)), dtype=float)
+        lows = np.asarray(panel.get("low", np.full(size, np.nan)), dtype=float)
+        highs = np.where(np.isnan(highs), np.maximum(opens, closes), highs)
+        lows = np.where(np.isnan(lows), np.minimum(opens, closes), lows)
+
+        keys = sorted_ema_keys(emas)
+        ema_matrix = np.column_stack([np.asarray(emas[key], dtype=float) for key in keys])
+        fast = ema_matrix[:, keys.index(self.fast)]
+        slow = ema_matrix[:, keys.index(self.slow)]
+        valid = ~(np.isnan(opens) | np.isnan(closes) | np.isnan(fast) | np.isnan(slow))
+
+        # Per-bar inputs that do not depend on strategy state are computed up front.
+        # Regime codes: 0 = neutral, 1 = trend, 2 = chop.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread_pct = np.abs(fast - slow) / closes * 100.0
+        regimes = np.where(
+            closes <= 0,
+            0,
+            np.where(
+                spread_pct >= self.trend_min_spread_pct,
+                1,
+                np.where(spread_pct <= self.chop_max_spread_pct, 2, 0),
+            ),
+        )
+        trend_dirs = (fast > slow).astype(np.int8) - (fast < slow).astype(np.int8)
+        cross_up = (opens[:, None] <= ema_matrix) & (ema_matrix < closes[:, None])
+        cross_down = (opens[:, None] >= ema_matrix) & (ema_matrix > closes[:, None])
+        # Lowest EMA first, as in the live loop; -1 when nothing broke.
+        first_up = np.where(cross_up.any(axis=1), cross_up.argmax(axis=1), -1)
+        first_down = np.where(cross_down.any(axis=1), cross_down.argmax(axis=1), -1)
+
+        trail_col = keys.index(self.trail_stop_ema) if self.trail_stop_ema in emas else -1
+        ema_rows = ema_matrix.tolist()
+        o_list, c_list = opens.tolist(), closes.tolist()
+        h_list, l_list = highs.tolist(), lows.tolist()
+        slow_list, fast_list = slow.tolist(), fast.tolist()
+        regimes, trend_dirs = regimes.tolist(), trend_dirs.tolist()
+        first_up, first_down = first_up.tolist(), first_down.tolist()
+
+        mode = 0  # 0 = flat, 1 = trend, 2 = snap
+        direction = 0
+        bars_in_trade = 0
+        entry_col = -1
+        snap_stop: Optional[float] = None
+        setup_dir = 0
+        setup_excursion: Optional[float] = None
+        setup_bars = 0
+
+        for row in np.flatnonzero(valid).tolist():
+            open_price, close_price = o_list[row], c_list[row]
+            if mode:
+                bars_in_trade += 1
+                exit_now = False
+                if mode == 1:
+                    values = ema_rows[row]
+                    stop_value = values[entry_col]
+                    if trail_col >= 0 and stop_value == stop_value:
+                        trail_value = values[trail_col]
+                        if (direction == 1 and trail_value > stop_value) or (
+                            direction == -1 and trail_value < stop_value
+                        ):
+                            stop_value = trail_value
+                    if stop_value == stop_value:
+                        if direction == 1:
+                            exit_now = open_price >= stop_value > close_price
+                        else:
+                            exit_now = open_price <= stop_value < close_price
+                else:
+                    if snap_stop is not None:
+                        if direction == 1:
+                            exit_now = open_price >= snap_stop > close_price
+                        else:
+                            exit_now = open_price <= snap_stop < close_price
+                    if not exit_now:
+                        if direction == 1:
+                            exit_now = h_list[row] >= slow_list[row]
+                        else:
+                            exit_now = l_list[row] <= slow_list[row]
+                    if not exit_now:
+                        exit_now = bars_in_trade >= self.snap_max_bars_in_trade
+                if exit_now:
+                    close_flags[row] = 1
+                    mode = direction = bars_in_trade = 0
+                    entry_col = -1
+                    snap_stop = None
+                continue
+
+            regime = regimes[row]
+            if regime == 1:
+                setup_dir, setup_excursion, setup_bars = 0, None, 0
+                trend = trend_dirs[row]
+                col = first_up[row] if trend == 1 else first_down[row] if trend == -1 else -1
+                if col >= 0:
+                    signals[row] = trend
+                    mode, direction, bars_in_trade, entry_col = 1, trend, 0, col
+                    snap_stop = None
+                continue
+
+            if regime != 2:
+                setup_dir, setup_excursion, setup_bars = 0, None, 0
+                continue
+
+            if setup_dir:
+                setup_bars += 1
+                if setup_bars > self.snap_setup_max_bars:
+                    setup_dir, setup_excursion, setup_bars = 0, None, 0
+            low_price, high_price, slow_value = l_list[row], h_list[row], slow_list[row]
+            extended_down = low_price < slow_value
+            extended_up = high_price > slow_value
+            if extended_down != extended_up:
+                new_dir = 1 if extended_down else -1
+                if new_dir != setup_dir:
+                    setup_dir = new_dir
+                    setup_excursion = low_price if extended_down else high_price
+                    setup_bars = 0
+                elif setup_dir == 1:
+                    setup_excursion = min(setup_excursion, low_price)
+                else:
+                    setup_excursion = max(setup_excursion, high_price)
+            elif extended_down:
+                if setup_dir == 1:
+                    setup_excursion = min(setup_excursion, low_price)
+                elif setup_dir == -1:
+                    setup_excursion = max(setup_excursion, high_price)
+
+            fast_value = fast_list[row]
+            if setup_dir == 1 and open_price <= fast_value < close_price:
+                entered = 1
+            elif setup_dir == -1 and open_price >= fast_value > close_price:
+                entered = -1
+            else:
+                continue
+            signals[row] = entered
+            mode, direction, bars_in_trade, entry_col = 2, entered, 0, -1
+            snap_stop = setup_excursion
+            setup_dir, setup_excursion, setup_bars = 0, None, 0
+
+        return signals, close_flags
+
     def _build_trend_entry_signal(
         self,
         *,
-        ema_snapshot: dict,
+        ema_snapshot: Dict[str, float],
         open_price: float,
         close_price: float,
         fast_value: float,
         slow_value: float,
     ) -> Optional[StrategySignal]:
-        direction = _trend_direction(fast_value=fast_value, slow_value=slow_value)
+        direction = _trend_direction(fast_value, slow_value)
         if not direction:
             return None
-        for ema_key in _sorted_ema_keys(ema_snapshot):
-            ema_value = _get_ema_value(ema_snapshot, ema_key)
-            if ema_value is None:
-                continue
-            if direction == "call" and _crossed_up(open_price, close_price, ema_value):
-                self._activate_trend(direction="call", entry_ema=ema_key)
-                return StrategySignal(
-                    direction="call",
-                    reason=(
-                        f"Trend regime: candle broke EMA {ema_key} up with "
-                        f"EMA {self.fast}>{self.slow}"
-                    ),
-                )
-            if direction == "put" and _crossed_down(open_price, close_price, ema_value):
+        # A body can only cross an EMA in the trend direction if it closed that way,
+        # so the sorted EMA walk is skipped outright for the opposite candle.
+        if direction == "call":
+            if close_price <= open_price:
+                return None
+            for ema_key in sorted_ema_keys(ema_snapshot):
+                if open_price <= ema_snapshot[ema_key] < close_price:
+                    self._activate_trend(direction="call", entry_ema=ema_key)
+                    return StrategySignal(
+                        direction="call",
+                        reason=(
+                            f"Trend regime: candle broke EMA {ema_key} up with "
+                            f"EMA {self.fast}>{self.slow}"
+                        ),
+                    )
+            return None
+        if close_price >= open_price:
+            return None
+        for ema_key in sorted_ema_keys(ema_snapshot):
+            if open_price >= ema_snapshot[ema_key] > close_price:
                 self._activate_trend(direction="put", entry_ema=ema_key)
                 return StrategySignal(
                     direction="put",
@@ -208,104 +423,71 @@ class EmaRegimeFusionStrategy:
 
         self._update_setup(low_price=low_price, high_price=high_price, slow_value=slow_value)
 
-        if self._setup_direction == "call" and _crossed_up(open_price, close_price, fast_value):
+        if self._setup_direction == "call" and open_price <= fast_value < close_price:
             stop_level = self._setup_excursion if self._setup_excursion is not None else low_price
             self._activate_snap(direction="call", stop_level=stop_level)
             self._reset_setup()
-            return StrategySignal(
-                direction="call",
-                reason=(
-                    f"Chop regime snapback call: extension below EMA {self.slow}, "
-                    f"reclaim above EMA {self.fast}"
-                ),
-            )
+            return StrategySignal(direction="call", reason=self._snap_call_reason)
 
-        if self._setup_direction == "put" and _crossed_down(open_price, close_price, fast_value):
+        if self._setup_direction == "put" and open_price >= fast_value > close_price:
             stop_level = self._setup_excursion if self._setup_excursion is not None else high_price
             self._activate_snap(direction="put", stop_level=stop_level)
             self._reset_setup()
-            return StrategySignal(
-                direction="put",
-                reason=(
-                    f"Chop regime snapback put: extension above EMA {self.slow}, "
-                    f"reclaim below EMA {self.fast}"
-                ),
-            )
+            return StrategySignal(direction="put", reason=self._snap_put_reason)
         return None
 
     def _update_setup(self, *, low_price: float, high_price: float, slow_value: float) -> None:
         extended_down = low_price < slow_value
         extended_up = high_price > slow_value
 
-        if extended_down and not extended_up:
-            if self._setup_direction != "call":
-                self._setup_direction = "call"
-                self._setup_excursion = low_price
-                self._setup_bars = 0
-            else:
-                if self._setup_excursion is None:
-                    self._setup_excursion = low_price
-                else:
-                    self._setup_excursion = min(self._setup_excursion, low_price)
-            return
-
-        if extended_up and not extended_down:
-            if self._setup_direction != "put":
-                self._setup_direction = "put"
-                self._setup_excursion = high_price
+        if extended_down != extended_up:
+            direction = "call" if extended_down else "put"
+            if direction != self._setup_direction:
+                self._setup_direction = direction
+                self._setup_excursion = low_price if extended_down else high_price
                 self._setup_bars = 0
-            else:
-                if self._setup_excursion is None:
-                    self._setup_excursion = high_price
-                else:
-                    self._setup_excursion = max(self._setup_excursion, high_price)
-            return
-
-        if self._setup_direction == "call" and extended_down:
-            if self._setup_excursion is None:
-                self._setup_excursion = low_price
-            else:
-                self._setup_excursion = min(self._setup_excursion, low_price)
+                return
+        elif not extended_down:
             return
 
-        if self._setup_direction == "put" and extended_up:
-            if self._setup_excursion is None:
-                self._setup_excursion = high_price
-            else:
-                self._setup_excursion = max(self._setup_excursion, high_price)
+        # The excursion is always seeded together with the direction, so it is never None here.
+        if self._setup_direction == "call":
+            self._setup_excursion = min(self._setup_excursion, low_price)
+        elif self._setup_direction == "put":
+            self._setup_excursion = max(self._setup_excursion, high_price)
 
-    def _evaluate_trend_trade(self, *, ema_snapshot: dict, open_price: float, close_price: float) -> None:
-        stop_key = self._resolve_trend_stop_ema_key(ema_snapshot)
-        if not stop_key:
-            return
-        stop_value = _get_ema_value(ema_snapshot, stop_key)
+    def _evaluate_trend_trade(self, *, ema_snapshot: Dict[str, float], open_price: float, close_price: float) -> None:
+        stop_key, stop_value = self._resolve_trend_stop(ema_snapshot)
         if stop_value is None:
             return
-        if self._active_direction == "call" and _crossed_down(open_price, close_price, stop_value):
+        if self._active_direction == "call" and open_price >= stop_value > close_price:
             stage = "trail" if self._trend_using_trail else "initial"
             self._queue_close(f"Trend stop ({stage}): broke EMA {stop_key} down")
             return
-        if self._active_direction == "put" and _crossed_up(open_price, close_price, stop_value):
+        if self._active_direction == "put" and open_price <= stop_value < close_price:
             stage = "trail" if self._trend_using_trail else "initial"
             self._queue_close(f"Trend stop ({stage}): broke EMA {stop_key} up")
 
-    def _resolve_trend_stop_ema_key(self, ema_snapshot: dict) -> Optional[str]:
-        if not self._trend_entry_ema or not self._active_direction:
-            self._trend_using_trail = False
-            return None
-        entry_value = _get_ema_value(ema_snapshot, self._trend_entry_ema)
-        trail_value = _get_ema_value(ema_snapshot, self.trail_stop_ema)
-        if entry_value is None or trail_value is None:
-            self._trend_using_trail = False
-            return self._trend_entry_ema
+    def _resolve_trend_stop(self, ema_snapshot: Dict[str, float]) -> Tuple[Optional[str], Optional[float]]:
+        # Returns the stop EMA key with its value so the caller does not look it up again.
+        self._trend_using_trail = False
+        entry_key = self._trend_entry_ema
+        if not entry_key or not self._active_direction:
+            return None, None
+        entry_value = ema_snapshot.get(entry_key)
+        trail_key = self.trail_stop_ema
+        if entry_value is None or trail_key == entry_key:
+            return entry_key, entry_value
+        trail_value = ema_snapshot.get(trail_key)
+        if trail_value is None:
+            return entry_key, entry_value
         if self._active_direction == "call" and trail_value > entry_value:
             self._trend_using_trail = True
-            return self.trail_stop_ema
+            return trail_key, trail_value
         if self._active_direction == "put" and trail_value < entry_value:
             self._trend_using_trail = True
-            return self.trail_stop_ema
-        self._trend_using_trail = False
-        return self._trend_entry_ema
+            return trail_key, trail_value
+        return entry_key, entry_value
 
     def _evaluate_snap_trade(
         self,
@@ -320,10 +502,10 @@ class EmaRegimeFusionStrategy:
             return
 
         if self._snap_stop_level is not None:
-            if self._active_direction == "call" and _crossed_down(open_price, close_price, self._snap_stop_level):
+            if self._active_direction == "call" and open_price >= self._snap_stop_level > close_price:
                 self._queue_close(f"Snap stop: broke excursion low {self._snap_stop_level:.2f}")
                 return
-            if self._active_direction == "put" and _crossed_up(open_price, close_price, self._snap_stop_level):
+            if self._active_direction == "put" and open_price <= self._snap_stop_level < close_price:
                 self._queue_close(f"Snap stop: broke excursion high {self._snap_stop_level:.2f}")
                 return
 
@@ -378,7 +560,6 @@ class EmaRegimeFusionStrategy:
 
 
 def _resolve_regime(
-    *,
     fast_value: float,
     slow_value: float,
     price: float,
@@ -395,7 +576,7 @@ def _resolve_regime(
     return "neutral"
 
 
-def _trend_direction(*, fast_value: float, slow_value: float) -> Optional[str]:
+def _trend_direction(fast_value: float, slow_value: float) -> Optional[str]:
     if fast_value > slow_value:
         return "call"
     if fast_value < slow_value:
@@ -403,29 +584,10 @@ def _trend_direction(*, fast_value: float, slow_value: float) -> Optional[str]:
     return None
 
 
-def _sorted_ema_keys(ema_snapshot: dict) -> List[str]:
-    keys = [key for key in ema_snapshot.keys() if key != "x"]
-    return sorted(keys, key=_ema_sort_key)
-
-
-def _ema_sort_key(value: str) -> float:
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return float("inf")
-
-
-def _get_ema_value(ema_snapshot: dict, key: str) -> Optional[float]:
-    value = ema_snapshot.get(key)
-    if value is None:
-        return None
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
-
-
 def _to_float(value: object) -> Optional[float]:
+    # Candle fields are normally floats already; skip the conversion and handler setup.
+    if value.__class__ is float:
+        return value
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -446,63 +608,16 @@ def _resolve_low(candle: dict, open_price: float, close_price: float) -> float:
     return low_value
 
 
-def _crossed_up(open_price: float, close_price: float, level: float) -> bool:
-    return open_price <= level < close_price
-
-
-def _crossed_down(open_price: float, close_price: float, level: float) -> bool:
-    return open_price >= level > close_price
-
-
-def _tag_matches(base: str, tag: Optional[str]) -> bool:
-    if not tag:
-        return False
-    if tag == base:
-        return True
-    return tag.startswith(f"{base}-")
-
-
 def build_strategy() -> object:
     if not IS_ENABLED:
         return None
-    base_name = STRATEGY_BASE_NAME
-    mode = str(MODE or "single").lower()
-    if mode == "multi":
-        timeframes = TIMEFRAMES if isinstance(TIMEFRAMES, list) else []
-        if not timeframes:
-            timeframes = [SINGLE_TIMEFRAME] if SINGLE_TIMEFRAME else ["5M"]
-        strategies: List[EmaRegimeFusionStrategy] = []
-        for tf in timeframes:
-            if not tf:
-                continue
-            name = f"{base_name}-{str(tf).lower()}"
-            strategies.append(
-                EmaRegimeFusionStrategy(
-                    timeframe=str(tf),
-                    fast=FAST_EMA,
-                    slow=SLOW_EMA,
-                    trail_stop_ema=TRAIL_STOP_EMA,
-                    trend_min_spread_pct=TREND_MIN_SPREAD_PCT,
-                    chop_max_spread_pct=CHOP_MAX_SPREAD_PCT,
-                    snap_setup_max_bars=SNAP_SETUP_MAX_BARS,
-                    snap_max_bars_in_trade=SNAP_MAX_BARS_IN_TRADE,
-                    name=name,
-                )
-            )
-        return strategies or EmaRegimeFusionStrategy(
-            timeframe=SINGLE_TIMEFRAME or "5M",
-            fast=FAST_EMA,
-            slow=SLOW_EMA,
-            trail_stop_ema=TRAIL_STOP_EMA,
-            trend_min_spread_pct=TREND_MIN_SPREAD_PCT,
-            chop_max_spread_pct=CHOP_MAX_SPREAD_PCT,
-            snap_setup_max_bars=SNAP_SETUP_MAX_BARS,
-            snap_max_bars_in_trade=SNAP_MAX_BARS_IN_TRADE,
-            name=base_name,
-        )
-    single_tf = SINGLE_TIMEFRAME or (TIMEFRAMES[0] if TIMEFRAMES else "5M")
-    return EmaRegimeFusionStrategy(
-        timeframe=single_tf,
+    return build_for_timeframes(
+        EmaRegimeFusionStrategy,
+        base_name=STRATEGY_BASE_NAME,
+        mode=MODE,
+        timeframes=TIMEFRAMES,
+        single_timeframe=SINGLE_TIMEFRAME,
+        default_timeframe="5M",
         fast=FAST_EMA,
         slow=SLOW_EMA,
         trail_stop_ema=TRAIL_STOP_EMA,
@@ -510,5 +625,4 @@ def build_strategy() -> object:
         chop_max_spread_pct=CHOP_MAX_SPREAD_PCT,
         snap_setup_max_bars=SNAP_SETUP_MAX_BARS,
         snap_max_bars_in_trade=SNAP_MAX_BARS_IN_TRADE,
-        name=base_name,
     )
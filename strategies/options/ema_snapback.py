@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from .types import PositionAction, StrategyContext, StrategySignal
 
@@ -14,6 +16,13 @@ SLOW_EMA = "48"
 CHOP_MAX_SPREAD_PCT = 0.12
 SETUP_MAX_BARS = 4
 MAX_BARS_IN_TRADE = 6
+CONFIG_SUMMARY_FIELDS = (  # constants shown in the strategy report
+    "FAST_EMA",
+    "SLOW_EMA",
+    "CHOP_MAX_SPREAD_PCT",
+    "SETUP_MAX_BARS",
+    "MAX_BARS_IN_TRADE",
+)
 IS_ENABLED = False  # Set to True to enable this strategy
 STRATEGY_DESCRIPTION = (
     "Mean-reversion strategy for choppy conditions. Looks for extension beyond the slow EMA "
@@ -88,12 +97,7 @@ class EmaSnapbackStrategy:
             )
             return None
 
-        if not _is_chop(
-            fast_value=fast_value,
-            slow_value=slow_value,
-            price=close_price,
-            max_spread_pct=self.chop_max_spread_pct,
-        ):
+        if not _is_chop(fast_value, slow_value, close_price, self.chop_max_spread_pct):
             self._reset_setup()
             return None
 
@@ -108,7 +112,7 @@ class EmaSnapbackStrategy:
             slow_value=slow_value,
         )
 
-        if self._pending_direction == "call" and _crossed_up(open_price, close_price, fast_value):
+        if self._pending_direction == "call" and open_price <= fast_value < close_price:
             stop_level = self._pending_excursion if self._pending_excursion is not None else low_price
             self._activate_position(direction="call", stop_level=stop_level)
             self._reset_setup()
@@ -120,7 +124,7 @@ class EmaSnapbackStrategy:
                 ),
             )
 
-        if self._pending_direction == "put" and _crossed_down(open_price, close_price, fast_value):
+        if self._pending_direction == "put" and open_price >= fast_value > close_price:
             stop_level = self._pending_excursion if self._pending_excursion is not None else high_price
             self._activate_position(direction="put", stop_level=stop_level)
             self._reset_setup()
@@ -134,6 +138,116 @@ class EmaSnapbackStrategy:
 
         return None
 
+    def process_candles(
+        self,
+        open_arr,
+        high_arr,
+        low_arr,
+        close_arr,
+        fast_arr,
+        slow_arr,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Replay candle and fast/slow EMA arrays for backtests using this instance's settings.
+
+        Returns entry directions as int8 (1 = call, -1 = put, 0 = nothing), the stop level
+        set on each entry bar (NaN elsewhere) and int8 close flags. A position is treated
+        as closed on the candle its exit fires, as the live runner does on the next
+        position update. Missing values should be NaN; the live state is left untouched.
+        """
+        opens = np.asarray(open_arr, dtype=float)
+        closes = np.asarray(close_arr, dtype=float)
+        fast = np.asarray(fast_arr, dtype=float)
+        slow = np.asarray(slow_arr, dtype=float)
+        highs = np.asarray(high_arr, dtype=float)
+        lows = np.asarray(low_arr, dtype=float)
+        size = len(opens)
+        signals = np.zeros(size, dtype=np.int8)
+        stop_levels = np.full(size, np.nan)
+        close_flags = np.zeros(size, dtype=np.int8)
+        if not size:
+            return signals, stop_levels, close_flags
+
+        # Every predicate that does not depend on strategy state is computed up front.
+        highs = np.where(np.isnan(highs), np.maximum(opens, closes), highs)
+        lows = np.where(np.isnan(lows), np.minimum(opens, closes), lows)
+        valid = ~(np.isnan(opens) | np.isnan(closes) | np.isnan(fast) | np.isnan(slow))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread_pct = np.abs(fast - slow) / closes * 100.0
+        is_chop = (closes > 0) & (spread_pct <= self.chop_max_spread_pct)
+        extended_down = lows < slow
+        extended_up = highs > slow
+        crossed_up = (opens <= fast) & (fast < closes)
+        crossed_down = (opens >= fast) & (fast > closes)
+
+        o_list, c_list = opens.tolist(), closes.tolist()
+        h_list, l_list, slow_list = highs.tolist(), lows.tolist(), slow.tolist()
+        chop_list = is_chop.tolist()
+        down_list, up_list = extended_down.tolist(), extended_up.tolist()
+        cross_up_list, cross_down_list = crossed_up.tolist(), crossed_down.tolist()
+
+        setup_dir = 0  # 1 = call, -1 = put
+        excursion = 0.0
+        setup_bars = 0
+        active_dir = 0
+        stop_level: Optional[float] = None
+        bars_in_trade = 0
+
+        for row in np.flatnonzero(valid).tolist():
+            if active_dir:
+                bars_in_trade += 1
+                open_price, close_price = o_list[row], c_list[row]
+                if stop_level is not None and (
+                    (active_dir == 1 and open_price >= stop_level > close_price)
+                    or (active_dir == -1 and open_price <= stop_level < close_price)
+                ):
+                    exit_now = True
+                elif active_dir == 1:
+                    exit_now = h_list[row] >= slow_list[row]
+                else:
+                    exit_now = l_list[row] <= slow_list[row]
+                if exit_now or bars_in_trade >= self.max_bars_in_trade:
+                    close_flags[row] = 1
+                    active_dir = 0
+                    stop_level = None
+                    bars_in_trade = 0
+                continue
+
+            if not chop_list[row]:
+                setup_dir, setup_bars = 0, 0
+                continue
+
+            if setup_dir:
+                setup_bars += 1
+                if setup_bars > self.setup_max_bars:
+                    setup_dir, setup_bars = 0, 0
+
+            down, up = down_list[row], up_list[row]
+            if down != up:
+                new_dir = 1 if down else -1
+                if new_dir != setup_dir:
+                    setup_dir = new_dir
+                    excursion = l_list[row] if down else h_list[row]
+                    setup_bars = 0
+                elif new_dir == 1:
+                    excursion = min(excursion, l_list[row])
+                else:
+                    excursion = max(excursion, h_list[row])
+            elif down:
+                if setup_dir == 1:
+                    excursion = min(excursion, l_list[row])
+                elif setup_dir == -1:
+                    excursion = max(excursion, h_list[row])
+
+            if (setup_dir == 1 and cross_up_list[row]) or (setup_dir == -1 and cross_down_list[row]):
+                signals[row] = setup_dir
+                stop_levels[row] = excursion
+                active_dir = setup_dir
+                stop_level = excursion
+                bars_in_trade = 0
+                setup_dir, setup_bars = 0, 0
+
+        return signals, stop_levels, close_flags
+
     def on_position_update(self, updates):
         if not self._pending_close or not updates:
             return None
@@ -153,42 +267,21 @@ class EmaSnapbackStrategy:
         extended_down = low_price < slow_value
         extended_up = high_price > slow_value
 
-        if extended_down and not extended_up:
-            if self._pending_direction != "call":
-                self._pending_direction = "call"
-                self._pending_excursion = low_price
+        if extended_down != extended_up:
+            direction = "call" if extended_down else "put"
+            if direction != self._pending_direction:
+                self._pending_direction = direction
+                self._pending_excursion = low_price if extended_down else high_price
                 self._pending_bars = 0
-            else:
-                if self._pending_excursion is None:
-                    self._pending_excursion = low_price
-                else:
-                    self._pending_excursion = min(self._pending_excursion, low_price)
-            return
-
-        if extended_up and not extended_down:
-            if self._pending_direction != "put":
-                self._pending_direction = "put"
-                self._pending_excursion = high_price
-                self._pending_bars = 0
-            else:
-                if self._pending_excursion is None:
-                    self._pending_excursion = high_price
-                else:
-                    self._pending_excursion = max(self._pending_excursion, high_price)
-            return
-
-        if self._pending_direction == "call" and extended_down:
-            if self._pending_excursion is None:
-                self._pending_excursion = low_price
-            else:
-                self._pending_excursion = min(self._pending_excursion, low_price)
+                return
+        elif not extended_down:
             return
 
-        if self._pending_direction == "put" and extended_up:
-            if self._pending_excursion is None:
-                self._pending_excursion = high_price
-            else:
-                self._pending_excursion = max(self._pending_excursion, high_price)
+        # The excursion is always seeded together with the direction, so it is never None here.
+        if self._pending_direction == "call":
+            self._pending_excursion = min(self._pending_excursion, low_price)
+        elif self._pending_direction == "put":
+            self._pending_excursion = max(self._pending_excursion, high_price)
 
     def _evaluate_active_trade(
         self,
@@ -203,10 +296,10 @@ class EmaSnapbackStrategy:
             return
 
         if self._stop_level is not None:
-            if self._active_direction == "call" and _crossed_down(open_price, close_price, self._stop_level):
+            if self._active_direction == "call" and open_price >= self._stop_level > close_price:
                 self._queue_close(f"Stop: broke excursion low {self._stop_level:.2f}")
                 return
-            if self._active_direction == "put" and _crossed_up(open_price, close_price, self._stop_level):
+            if self._active_direction == "put" and open_price <= self._stop_level < close_price:
                 self._queue_close(f"Stop: broke excursion high {self._stop_level:.2f}")
                 return
 
@@ -244,7 +337,7 @@ class EmaSnapbackStrategy:
         self._close_reason = None
 
 
-def _is_chop(*, fast_value: float, slow_value: float, price: float, max_spread_pct: float) -> bool:
+def _is_chop(fast_value: float, slow_value: float, price: float, max_spread_pct: float) -> bool:
     if price <= 0:
         return False
     spread_pct = abs(fast_value - slow_value) / price * 100.0
@@ -252,6 +345,9 @@ def _is_chop(*, fast_value: float, slow_value: float, price: float, max_spread_p
 
 
 def _to_float(value: object) -> Optional[float]:
+    # Candle fields are normally floats already; skip the conversion and handler setup.
+    if value.__class__ is float:
+        return value
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -276,20 +372,14 @@ def _get_ema_value(ema_snapshot: dict, key: str) -> Optional[float]:
     value = ema_snapshot.get(key)
     if value is None:
         return None
+    if value.__class__ is float:
+        return value
     try:
         return float(value)
     except (TypeError, ValueError):
         return None
 
 
-def _crossed_up(open_price: float, close_price: float, level: float) -> bool:
-    return open_price <= level < close_price
-
-
-def _crossed_down(open_price: float, close_price: float, level: float) -> bool:
-    return open_price >= level > close_price
-
-
 def _tag_matches(base: str, tag: Optional[str]) -> bool:
     if not tag:
         return False
@@ -20,7 +20,7 @@ class ProfitTargetStep:
 
 class ProfitTargetPlan:
     def __init__(self, steps: Iterable[ProfitTargetStep]) -> None:
-        self._steps: List[ProfitTargetStep] = sorted(steps, key=lambda s: s.target_pct)
+        self._steps: Tuple[ProfitTargetStep, ...] = tuple(sorted(steps, key=lambda s: s.target_pct))
         self._fired: Set[Tuple[str, float]] = set()
 
     def evaluate(
@@ -51,7 +51,7 @@ class ProfitTargetPlan:
             if key in self._fired:
                 continue
             if update.unrealized_pct < step.target_pct:
-                continue
+                break  # steps are sorted, so no later target is met either
             action = self._build_action(step, update, timeframe)
             if action:
                 actions.append(action)
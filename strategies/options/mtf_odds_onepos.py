@@ -19,6 +19,17 @@ EXIT_NEUTRAL_THRESHOLD = 0.80
 EXIT_REVERSE_THRESHOLD = 2.0
 MAX_BARS_IN_TRADE = 8
 IMPULSE_MIN_BODY_RATIO = 0.55
+CONFIG_SUMMARY_FIELDS = (  # constants shown in the strategy report
+    "SIGNAL_TIMEFRAME",
+    "FAST_EMA",
+    "SLOW_EMA",
+    "ODDS_DECAY",
+    "ENTRY_THRESHOLD",
+    "EXIT_NEUTRAL_THRESHOLD",
+    "EXIT_REVERSE_THRESHOLD",
+    "MAX_BARS_IN_TRADE",
+    "IMPULSE_MIN_BODY_RATIO",
+)
 IS_ENABLED = False
 STRATEGY_DESCRIPTION = (
     "Single-position multi-timeframe odds engine. Every closed candle contributes weighted "
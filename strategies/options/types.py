@@ -4,8 +4,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from utils.compat_utils import DATACLASS_SLOTS
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class StrategyContext:
     symbol: str
     timeframe: str
@@ -14,13 +16,13 @@ class StrategyContext:
     timestamp: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class StrategySignal:
     direction: str
     reason: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PositionAction:
     action: str  # "close" | "trim" | "add"
     position_id: str
@@ -57,3 +57,26 @@ def test_extract_trade_results_from_summary():
     assert results["total"] == pytest.approx(20.0)
     assert results["percent"] == pytest.approx(20.0)
     assert results["total_investment"] == pytest.approx(100.0)
+
+
+def test_append_trade_update_accepts_line_batches():
+    message = format_trade_open(
+        strategy_name="ema",
+        ticker_symbol="SPY",
+        strike=500.0,
+        option_type="call",
+        quantity=1,
+        order_price=1.0,
+        total_investment=100.0,
+    )
+    lines = [
+        format_trade_trim(1, 120.0, 1.2, "tp"),
+        format_trade_close(avg_exit=1.2, total_pnl=20.0, percent=20.0, profit_indicator=None),
+    ]
+
+    sequential = message
+    for line in lines:
+        sequential = append_trade_update(sequential, line)
+
+    assert append_trade_update(message, lines) == sequential
+    assert append_trade_update(message, []) == message
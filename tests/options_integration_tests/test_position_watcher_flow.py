@@ -104,6 +104,6 @@ async def test_position_watcher_routes_updates_to_strategy():
         assert update.strategy_tag == "test-strategy"
         assert update.mark_price == pytest.approx(1.2)
     finally:
-        runner.stop()
+        await runner.stop()
         await watcher.stop()
         await service.stop()
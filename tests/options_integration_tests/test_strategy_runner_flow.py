@@ -104,6 +104,78 @@ async def test_strategy_runner_opens_and_flips(tmp_path, monkeypatch):
             )
             assert flipped, "expected an open put after bearish crossover"
         finally:
-            runner.stop()
+            await runner.stop()
     finally:
         await service.stop()
+
+
+async def test_candle_closes_only_reach_strategies_for_their_timeframe():
+    calls = []
+
+    class Pinned:
+        name = "pinned"
+        timeframe = "2M"
+
+        def on_candle_close(self, context):
+            calls.append(("pinned", context.timeframe))
+
+    class Unpinned:
+        name = "unpinned"
+
+        def on_candle_close(self, context):
+            calls.append(("unpinned", context.timeframe))
+
+    reads = []
+
+    async def _latest(timeframe):
+        reads.append(timeframe)
+        return {"13": 1.0}
+
+    def _event(timeframe):
+        return CandleCloseEvent(
+            symbol="SPY",
+            timeframe=timeframe,
+            candle={"close": 500.0},
+            closed_at=datetime.now(timezone.utc),
+            source="test",
+        )
+
+    runner = OptionsStrategyRunner(MarketEventBus(), None, [Pinned(), Unpinned()], expiration="20260106")
+    runner._ema_cache.get_latest_async = _latest  # type: ignore
+
+    await runner._process_candle(_event("2M"))
+    await runner._process_candle(_event("5M"))
+
+    assert calls == [("pinned", "2M"), ("unpinned", "2M"), ("unpinned", "5M")]
+
+    pinned_only = OptionsStrategyRunner(MarketEventBus(), None, [Pinned()], expiration="20260106")
+    pinned_only._ema_cache.get_latest_async = _latest  # type: ignore
+    reads.clear()
+
+    await pinned_only._process_candle(_event("15M"))
+
+    assert reads == []
+
+
+async def test_failing_handler_does_not_strand_queued_work():
+    logs = []
+    order = []
+    gate = asyncio.Event()
+    runner = OptionsStrategyRunner(MarketEventBus(), None, [], expiration="20260106", logger=logs.append)
+
+    async def _failing(_payload):
+        await gate.wait()
+        raise RuntimeError("boom")
+
+    async def _record(payload):
+        order.append(payload)
+
+    first = asyncio.create_task(runner._run_exclusive(_failing, None))
+    await asyncio.sleep(0)
+    await runner._run_exclusive(_record, "queued")
+    gate.set()
+    await first
+
+    assert order == ["queued"]
+    assert not runner._pending and not runner._busy
+    assert any("boom" in line for line in logs)
@@ -0,0 +1,47 @@
+import random
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import numpy as np
+
+from strategies.options.candle_ema_break import CandleEmaBreakStrategy
+from strategies.options.types import StrategyContext
+
+
+def _replay(opens, closes, emas):
+    # Live path: close the position on the candle its stop fires.
+    strategy = CandleEmaBreakStrategy(timeframe="2M")
+    out = []
+    for idx, (open_price, close_price) in enumerate(zip(opens, closes)):
+        snapshot = {key: (None if np.isnan(values[idx]) else values[idx]) for key, values in emas.items()}
+        context = StrategyContext(
+            symbol="SPY",
+            timeframe="2M",
+            candle={"open": open_price, "close": close_price},
+            ema=snapshot,
+            timestamp=datetime.now(timezone.utc),
+        )
+        signal = strategy.on_candle_close(context)
+        if signal is not None:
+            out.append(1 if signal.direction == "call" else -1)
+        elif strategy.on_position_update([SimpleNamespace(strategy_tag=None, position_id="p")]):
+            out.append(2)
+        else:
+            out.append(0)
+    return out
+
+
+def test_run_vectorized_matches_live_replay():
+    rnd = random.Random(7)
+    n = 500
+    opens = np.array([rnd.uniform(98, 102) for _ in range(n)])
+    closes = np.array([rnd.uniform(98, 102) for _ in range(n)])
+    emas = {
+        key: np.array([np.nan if rnd.random() < 0.05 else rnd.uniform(98, 102) for _ in range(n)])
+        for key in ("48", "9", "13")
+    }
+
+    vectorized = CandleEmaBreakStrategy.run_vectorized(opens, closes, emas)
+
+    assert vectorized.tolist() == _replay(opens, closes, emas)
+    assert {1, -1, 2} <= set(vectorized.tolist())
@@ -0,0 +1,44 @@
+import random
+from datetime import datetime, timezone
+
+import numpy as np
+
+from strategies.options.ema_crossover import EmaCrossoverStrategy
+from strategies.options.types import StrategyContext
+
+
+def _replay(fast, slow):
+    strategy = EmaCrossoverStrategy(timeframe="2M")
+    out = []
+    for fast_value, slow_value in zip(fast, slow):
+        context = StrategyContext(
+            symbol="SPY",
+            timeframe="2M",
+            candle={"open": 1.0, "close": 1.0},
+            ema={
+                "13": None if np.isnan(fast_value) else fast_value,
+                "48": None if np.isnan(slow_value) else slow_value,
+            },
+            timestamp=datetime.now(timezone.utc),
+        )
+        signal = strategy.on_candle_close(context)
+        out.append(0 if signal is None else (1 if signal.direction == "call" else -1))
+    return out
+
+
+def test_backtest_batch_matches_live_replay():
+    rnd = random.Random(11)
+    n = 400
+    fast = np.array([np.nan if rnd.random() < 0.05 else float(rnd.randint(98, 102)) for _ in range(n)])
+    slow = np.array([np.nan if rnd.random() < 0.05 else float(rnd.randint(98, 102)) for _ in range(n)])
+
+    batch = EmaCrossoverStrategy.backtest_batch(fast, slow)
+
+    assert batch.dtype == np.int8
+    assert batch.tolist() == _replay(fast, slow)
+    assert {1, -1} <= set(batch.tolist())
+
+
+def test_backtest_batch_handles_flat_series():
+    assert EmaCrossoverStrategy.backtest_batch([1.0, 1.0], [1.0, 1.0]).tolist() == [0, 0]
+    assert EmaCrossoverStrategy.backtest_batch([], []).tolist() == []
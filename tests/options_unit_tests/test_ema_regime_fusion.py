@@ -0,0 +1,105 @@
+import random
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import numpy as np
+
+from strategies.options._parallel import run_backtests_parallel
+from strategies.options.ema_regime_fusion import EmaRegimeFusionStrategy
+from strategies.options.types import StrategyContext
+
+
+def _strategy():
+    return EmaRegimeFusionStrategy(
+        timeframe="2M",
+        trail_stop_ema="9",
+        trend_min_spread_pct=0.3,
+        chop_max_spread_pct=0.15,
+    )
+
+
+def _value(array, idx):
+    value = array[idx]
+    return None if np.isnan(value) else float(value)
+
+
+def _replay(panel):
+    # Live path: close the position on the candle its exit fires.
+    strategy = _strategy()
+    signals, closes = [], []
+    for idx in range(len(panel["open"])):
+        candle = {"open": _value(panel["open"], idx), "close": _value(panel["close"], idx)}
+        for field in ("high", "low"):
+            if _value(panel[field], idx) is not None:
+                candle[field] = _value(panel[field], idx)
+        context = StrategyContext(
+            symbol="SPY",
+            timeframe="2M",
+            candle=candle,
+            ema={key: _value(values, idx) for key, values in panel["ema"].items()},
+            timestamp=datetime.now(timezone.utc),
+        )
+        signal = strategy.on_candle_close(context)
+        signals.append(0 if signal is None else (1 if signal.direction == "call" else -1))
+        action = strategy.on_position_update([SimpleNamespace(strategy_tag=None, position_id="p")])
+        closes.append(1 if action is not None else 0)
+    return signals, closes
+
+
+def _panel(rnd, n, ema_width):
+    def series(nan_rate=0.03, width=1.0):
+        return np.array(
+            [np.nan if rnd.random() < nan_rate else 100 + rnd.uniform(-width, width) for _ in range(n)]
+        )
+
+    opens, closes = series(0.01), series(0.01)
+    highs = np.maximum(opens, closes) + np.array([rnd.uniform(0, 0.5) for _ in range(n)])
+    lows = np.minimum(opens, closes) - np.array([rnd.uniform(0, 0.5) for _ in range(n)])
+    highs[[rnd.random() < 0.2 for _ in range(n)]] = np.nan
+    lows[[rnd.random() < 0.2 for _ in range(n)]] = np.nan
+    return {
+        "open": opens,
+        "high": highs,
+        "low": lows,
+        "close": closes,
+        # Tight EMA spreads keep a share of bars in the chop regime.
+        "ema": {key: series(width=ema_width) for key in ("9", "13", "48", "200")},
+    }
+
+
+def test_run_backtest_matches_live_replay():
+    rnd = random.Random(5)
+    seen_signals, seen_closes = set(), 0
+    for _ in range(20):
+        panel = _panel(rnd, 300, ema_width=rnd.choice((0.1, 0.3, 1.0)))
+        signals, closes = _strategy().run_backtest(panel)
+        expected_signals, expected_closes = _replay(panel)
+        assert signals.tolist() == expected_signals
+        assert closes.tolist() == expected_closes
+        seen_signals.update(expected_signals)
+        seen_closes += sum(expected_closes)
+    assert {1, -1} <= seen_signals
+    assert seen_closes
+
+
+def test_run_backtest_without_configured_emas_is_flat():
+    panel = {"open": [1.0, 2.0], "close": [2.0, 1.0], "ema": {"9": [1.5, 1.5]}}
+    signals, closes = _strategy().run_backtest(panel)
+    assert signals.tolist() == [0, 0]
+    assert closes.tolist() == [0, 0]
+
+
+def test_run_backtests_parallel_matches_serial_per_timeframe():
+    rnd = random.Random(9)
+    panels = {tf: _panel(rnd, 200, ema_width=0.3) for tf in ("2M", "5M")}
+    strategies = [
+        EmaRegimeFusionStrategy(timeframe=tf, trend_min_spread_pct=0.3, chop_max_spread_pct=0.15)
+        for tf in ("2M", "5M", "15M")
+    ]
+
+    results = run_backtests_parallel(strategies, panels, max_workers=2)
+
+    assert results[2] is None
+    for strategy, result in zip(strategies[:2], results[:2]):
+        expected = strategy.run_backtest(panels[strategy.timeframe])
+        assert [array.tolist() for array in result] == [array.tolist() for array in expected]
@@ -0,0 +1,71 @@
+import random
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import numpy as np
+
+from strategies.options.ema_snapback import EmaSnapbackStrategy
+from strategies.options.types import StrategyContext
+
+
+def _value(array, idx):
+    value = array[idx]
+    return None if np.isnan(value) else float(value)
+
+
+def _replay(opens, highs, lows, closes, fast, slow):
+    # Live path: close the position on the candle its exit fires.
+    strategy = EmaSnapbackStrategy(timeframe="5M")
+    signals, stops, exits = [], [], []
+    for idx in range(len(opens)):
+        candle = {"open": _value(opens, idx), "close": _value(closes, idx)}
+        if _value(highs, idx) is not None:
+            candle["high"] = _value(highs, idx)
+        if _value(lows, idx) is not None:
+            candle["low"] = _value(lows, idx)
+        context = StrategyContext(
+            symbol="SPY",
+            timeframe="5M",
+            candle=candle,
+            ema={"13": _value(fast, idx), "48": _value(slow, idx)},
+            timestamp=datetime.now(timezone.utc),
+        )
+        signal = strategy.on_candle_close(context)
+        if signal is None:
+            signals.append(0)
+            stops.append(None)
+        else:
+            signals.append(1 if signal.direction == "call" else -1)
+            stops.append(strategy._stop_level)
+        action = strategy.on_position_update([SimpleNamespace(strategy_tag=None, position_id="p")])
+        exits.append(1 if action is not None else 0)
+    return signals, stops, exits
+
+
+def test_process_candles_matches_live_replay():
+    rnd = random.Random(21)
+    n = 400
+    seen = set()
+    for width in (0.05, 0.1, 0.3):
+        def series(nan_rate, spread):
+            return np.array(
+                [np.nan if rnd.random() < nan_rate else 100 + rnd.uniform(-spread, spread) for _ in range(n)]
+            )
+
+        opens, closes = series(0.01, 1.0), series(0.01, 1.0)
+        highs = np.maximum(opens, closes) + np.array([rnd.uniform(0, 0.5) for _ in range(n)])
+        lows = np.minimum(opens, closes) - np.array([rnd.uniform(0, 0.5) for _ in range(n)])
+        highs[[rnd.random() < 0.2 for _ in range(n)]] = np.nan
+        lows[[rnd.random() < 0.2 for _ in range(n)]] = np.nan
+        fast, slow = series(0.03, width), series(0.03, width)
+
+        signals, stop_levels, exits = EmaSnapbackStrategy(timeframe="5M").process_candles(
+            opens, highs, lows, closes, fast, slow
+        )
+        expected_signals, expected_stops, expected_exits = _replay(opens, highs, lows, closes, fast, slow)
+
+        assert signals.tolist() == expected_signals
+        assert exits.tolist() == expected_exits
+        assert [None if np.isnan(level) else level for level in stop_levels.tolist()] == expected_stops
+        seen.update(expected_signals)
+    assert {1, -1} <= seen
@@ -141,3 +141,19 @@ def test_profit_target_plan_resets_after_close():
     reopened = _make_update("pos-6", pct=120.0, qty=4)
     actions = plan.evaluate_update(reopened)
     assert len(actions) == 1
+
+
+def test_profit_target_plan_sorts_steps_and_stops_at_first_unmet_target():
+    plan = ProfitTargetPlan(
+        [
+            ProfitTargetStep(target_pct=200.0, action="close"),
+            ProfitTargetStep(target_pct=50.0, action="trim", quantity=1),
+            ProfitTargetStep(target_pct=100.0, action="trim", quantity=1),
+        ]
+    )
+
+    actions = plan.evaluate_update(_make_update("pos-9", pct=120.0, qty=4))
+    assert [action.reason for action in actions] == ["TP 50%", "TP 100%"]
+
+    actions = plan.evaluate_update(_make_update("pos-9", pct=210.0, qty=2))
+    assert [(action.action, action.reason) for action in actions] == [("close", "TP 200%")]
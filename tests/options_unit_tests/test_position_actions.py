@@ -1,11 +1,12 @@
 import asyncio
+import functools
 from datetime import datetime, timezone
 
 import pytest
 
 from options.position_watcher import PositionUpdate
 from options.quote_service import OptionContract, OptionQuote
-from runtime.market_bus import MarketEventBus
+from runtime.market_bus import CandleCloseEvent, MarketEventBus
 from runtime.options_strategy_runner import OptionsStrategyRunner
 from strategies.options.types import PositionAction
 from strategies.options.types import StrategyContext, StrategySignal
@@ -170,3 +171,177 @@ async def test_runner_tags_include_timeframe(monkeypatch):
     await runner._handle_signal(SignalStrategy(), StrategySignal(direction="call", reason="x"), context)
 
     assert runner._order_manager.last_strategy_tag == "ema-crossover-2m"
+
+
+async def test_runner_queues_async_hooks_in_order():
+    position = type("Pos", (), {"position_id": "pos-test", "status": "open", "quantity_open": 2})()
+    order_manager = DummyOrderManager(position)
+    seen = []
+
+    async def on_trimmed(_pos, _result, reason, _timeframe):
+        await asyncio.sleep(0)
+        seen.append(reason)
+
+    runner = OptionsStrategyRunner(
+        MarketEventBus(),
+        order_manager,
+        [],
+        expiration="20260106",
+        on_position_trimmed=on_trimmed,
+    )
+    runner.start()
+    try:
+        await runner._apply_position_actions(
+            [
+                PositionAction(action="trim", position_id="pos-test", quantity=1, reason="first"),
+                PositionAction(action="trim", position_id="pos-test", quantity=1, reason="second"),
+            ]
+        )
+        await asyncio.wait_for(runner._hook_queue.join(), timeout=1.0)
+    finally:
+        await runner.stop()
+
+    assert seen == ["first", "second"]
+
+
+async def test_runner_supports_three_arg_hooks():
+    position = type("Pos", (), {"position_id": "pos-test", "status": "open", "quantity_open": 1})()
+    order_manager = DummyOrderManager(position)
+    captured = {}
+
+    def on_closed(_pos, _result, reason):
+        captured["reason"] = reason
+
+    runner = OptionsStrategyRunner(
+        MarketEventBus(),
+        order_manager,
+        [],
+        expiration="20260106",
+        on_position_closed=on_closed,
+    )
+
+    await runner._apply_position_actions(
+        [PositionAction(action="close", position_id="pos-test", reason="stop", timeframe="5M")]
+    )
+
+    assert captured["reason"] == "stop"
+
+
+async def test_runner_defers_overlapping_candle_events(tmp_path, monkeypatch):
+    monkeypatch.setattr("runtime.options_strategy_runner.get_ema_path", lambda tf: tmp_path / f"{tf}.json")
+    seen = []
+
+    class RecordingStrategy:
+        name = "recorder"
+
+        def on_candle_close(self, context):
+            seen.append(context.timeframe)
+            return StrategySignal(direction="call", reason=context.timeframe)
+
+    class SlowOpenOrderManager(DummyOpenOrderManager):
+        async def open_position(self, request, selector_name, quantity, strategy_tag):
+            await asyncio.sleep(0.01)
+            return await super().open_position(request, selector_name, quantity, strategy_tag)
+
+    runner = OptionsStrategyRunner(
+        MarketEventBus(),
+        SlowOpenOrderManager(),
+        [RecordingStrategy()],
+        expiration="20260106",
+    )
+
+    def _event(timeframe):
+        return CandleCloseEvent(
+            symbol="SPY",
+            timeframe=timeframe,
+            candle={"close": 600.0},
+            closed_at=datetime.now(timezone.utc),
+            source="test",
+        )
+
+    await asyncio.gather(runner._handle_event(_event("2M")), runner._handle_event(_event("5M")))
+
+    assert seen == ["2M", "5M"]
+
+
+def test_runner_reload_reuses_bound_entries():
+    kept = SignalStrategy()
+    runner = OptionsStrategyRunner(
+        MarketEventBus(),
+        DummyOpenOrderManager(),
+        [kept, kept],
+        expiration="20260106",
+    )
+    assert len(runner._candle_handlers) == 1
+    entry = runner._candle_handlers[0]
+
+    added = CloseOnUpdateStrategy()
+    runner.reload([kept, added])
+
+    assert runner._candle_handlers[0] is entry
+    assert [name for name, _handler, _is_async in runner._update_handlers] == ["close-on-update"]
+
+
+async def test_full_hook_queue_applies_backpressure_and_stop_drains(monkeypatch):
+    monkeypatch.setattr("runtime.options_strategy_runner._HOOK_QUEUE_MAXSIZE", 1)
+    position = type("Pos", (), {"position_id": "pos-test", "status": "open", "quantity_open": 10})()
+    order_manager = DummyOrderManager(position)
+    gate = asyncio.Event()
+    seen = []
+
+    async def on_trimmed(_pos, _result, reason, _timeframe):
+        await gate.wait()
+        seen.append(reason)
+
+    runner = OptionsStrategyRunner(
+        MarketEventBus(),
+        order_manager,
+        [],
+        expiration="20260106",
+        on_position_trimmed=on_trimmed,
+    )
+    runner.start()
+    actions = [
+        PositionAction(action="trim", position_id="pos-test", quantity=1, reason=str(idx))
+        for idx in range(4)
+    ]
+    apply_task = asyncio.create_task(runner._apply_position_actions(actions))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    # One hook is running and one is queued; the rest wait for room instead of being dropped.
+    assert not apply_task.done()
+
+    gate.set()
+    await apply_task
+    await runner.stop()
+
+    assert seen == ["0", "1", "2", "3"]
+
+
+async def test_runner_awaits_awaitables_from_non_coroutine_callables():
+    position = type("Pos", (), {"position_id": "pos-test", "status": "open", "quantity_open": 2})()
+    seen = []
+
+    async def on_trimmed(label, _pos, _result, reason, _timeframe):
+        seen.append((label, reason))
+
+    class AsyncUpdateHandler:
+        async def __call__(self, updates):
+            return PositionAction(action="trim", position_id="pos-test", quantity=1, reason="from-call")
+
+    runner = OptionsStrategyRunner(
+        MarketEventBus(),
+        DummyOrderManager(position),
+        [],
+        expiration="20260106",
+        on_position_trimmed=functools.partial(on_trimmed, "partial"),
+    )
+    runner.start()
+    try:
+        actions = await runner._resolve_position_actions(AsyncUpdateHandler(), [object()], "handler")
+        await runner._apply_position_actions(actions)
+        await asyncio.wait_for(runner._hook_queue.join(), timeout=1.0)
+    finally:
+        await runner.stop()
+
+    assert seen == [("partial", "from-call")]
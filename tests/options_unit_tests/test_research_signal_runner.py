@@ -1,3 +1,6 @@
+import asyncio
+import threading
+from dataclasses import fields
 from datetime import datetime, timezone
 
 import pytest
@@ -82,10 +85,10 @@ async def test_candle_close_paths_dedupe(monkeypatch):
 async def test_process_touches_records_events(monkeypatch):
     captured = []
 
-    def _capture(event, logger=None):
-        captured.append(event)
+    def _capture(payload, logger=None):
+        captured.append(payload)
 
-    monkeypatch.setattr(rsr, "record_research_path_event", _capture)
+    monkeypatch.setattr(rsr, "record_research_path_payload", _capture)
 
     contract = OptionContract(symbol="SPY", option_type="call", strike=600.0, expiration="2026-01-27")
     quote = OptionQuote(
@@ -116,10 +119,10 @@ async def test_process_touches_records_events(monkeypatch):
         variant="13x48-bull",
     )
 
-    def _ema_history(_timeframe):
-        return [{"13": 100.0}]
+    def _ema_levels(_timeframe):
+        return {13: 100.0}
 
-    runner._ema_cache.get_last_two = _ema_history  # type: ignore
+    runner._ema_cache.get_latest_levels = _ema_levels  # type: ignore
 
     levels = [{"id": "L1", "type": "support", "y": 100.0}]
     zones = [{"id": "Z1", "type": "support", "top": 101.0, "bottom": 99.0}]
@@ -128,8 +131,56 @@ async def test_process_touches_records_events(monkeypatch):
     runner._process_touches(100.0, now, zones, levels)
     runner._process_touches(100.0, now, zones, levels)
 
-    keys = sorted({event.event_key for event in captured})
+    keys = sorted({payload["event_key"] for payload in captured})
     assert keys == ["ema:13", "level:100.00", "zone:99.00-101.00"]
+    assert list(captured[0]) == [field.name for field in fields(rsr.ResearchPathEvent)]
+
+
+async def test_process_touches_reads_ema_once_per_timeframe(monkeypatch):
+    captured = []
+    monkeypatch.setattr(rsr, "record_research_path_payload", lambda payload, logger=None: captured.append(payload))
+
+    contract = OptionContract(symbol="SPY", option_type="call", strike=600.0, expiration="2026-01-27")
+    quote = OptionQuote(
+        contract=contract,
+        bid=0.95,
+        ask=1.05,
+        last=1.00,
+        volume=None,
+        open_interest=None,
+        updated_at=datetime.now(timezone.utc),
+    )
+    runner = rsr.ResearchSignalRunner(
+        bus=MarketEventBus(),
+        quote_service=DummyQuoteService(quote),
+        strategies=[],
+        expiration="2026-01-27",
+        touch_tolerance=0.5,
+    )
+    for signal_id in ("sig-1", "sig-2"):
+        runner._active_signals[signal_id] = rsr.ActiveSignal(
+            signal_id=signal_id,
+            strategy_tag="ema-crossover",
+            timeframe="2M",
+            symbol="SPY",
+            contract_key=contract.key,
+            option_type="call",
+            strike=600.0,
+            expiration="2026-01-27",
+            variant=None,
+        )
+    lookups = []
+
+    def _ema_levels(timeframe):
+        lookups.append(timeframe)
+        return {13: 100.0}
+
+    runner._ema_cache.get_latest_levels = _ema_levels  # type: ignore
+
+    runner._process_touches(100.0, datetime(2026, 1, 27, 14, 30, tzinfo=timezone.utc), [], [])
+
+    assert lookups == ["2M"]
+    assert [payload["signal_id"] for payload in captured] == ["sig-1", "sig-2"]
 
 
 async def test_signal_tags_include_timeframe(monkeypatch):
@@ -175,3 +226,278 @@ async def test_signal_tags_include_timeframe(monkeypatch):
 
     assert len(captured) == 1
     assert captured[0].strategy_tag == "ema-crossover-2m"
+
+
+async def test_call_strategy_runs_sync_handlers_off_the_loop_thread():
+    loop_thread = threading.get_ident()
+    seen = {}
+
+    class SyncStrategy:
+        name = "sync"
+
+        def on_candle_close(self, context):
+            seen["sync"] = threading.get_ident()
+            return ResearchSignal(direction="call", reason="sync")
+
+    class AsyncStrategy:
+        name = "async"
+
+        async def on_candle_close(self, context):
+            seen["async"] = threading.get_ident()
+            return [ResearchSignal(direction="put", reason="async")]
+
+    context = ResearchContext(
+        symbol="SPY",
+        timeframe="2M",
+        candle={"close": 600.0},
+        ema_history=[],
+        timestamp=datetime.now(timezone.utc),
+    )
+
+    sync_signals = await rsr._call_strategy(SyncStrategy(), context)
+    async_signals = await rsr._call_strategy(AsyncStrategy(), context)
+
+    assert [signal.direction for signal in sync_signals] == ["call"]
+    assert [signal.direction for signal in async_signals] == ["put"]
+    assert seen["sync"] != loop_thread
+    assert seen["async"] == loop_thread
+
+
+def test_touch_index_returns_nearby_objects_in_file_order():
+    levels = [
+        {"id": "far", "y": 90.0},
+        {"id": "b", "y": 100.2},
+        {"id": "bad", "y": None},
+        {"id": "a", "y": 99.9},
+    ]
+    zones = [
+        {"id": "wide", "top": 120.0, "bottom": 80.0},
+        {"id": "below", "top": 95.0, "bottom": 94.0},
+        {"id": "flipped", "top": 99.0, "bottom": 101.0},
+    ]
+    index = rsr.TouchIndex(zones, levels)
+
+    assert [level["id"] for level, _, _ in index.levels_near(100.0, 0.5)] == ["b", "a"]
+    assert [key for _, key, _ in index.zones_near(100.0, 0.5)] == ["zone:80.00-120.00", "zone:99.00-101.00"]
+
+
+def test_ema_history_cache_parses_levels_once(tmp_path, monkeypatch):
+    ema_path = tmp_path / "2M.json"
+    ema_path.write_text('[{"x": 1, "13": 99.5}, {"x": 2, "13": "100.25", "48": 98}]')
+    monkeypatch.setattr(rsr, "get_ema_path", lambda _tf: ema_path)
+    parsed = []
+    real_extract = rsr._extract_ema_levels
+    monkeypatch.setattr(rsr, "_extract_ema_levels", lambda snap: parsed.append(snap) or real_extract(snap))
+    cache = rsr.EmaHistoryCache()
+
+    assert cache.get_latest_levels("2M") == {13: 100.25, 48: 98.0}
+    assert cache.get_latest_levels("2M") is cache.get_latest_levels("2M")
+    assert len(cache.get_last_two("2M")) == 2
+    assert len(parsed) == 1
+
+
+def test_seen_buckets_dedupes_and_evicts_oldest():
+    seen = rsr.SeenBuckets(max_size=2)
+
+    assert seen.add("sig-1", "ema:13", "b1")
+    assert not seen.add("sig-1", "ema:13", "b1")
+    assert seen.add("sig-1", "ema:13", "b2")
+    assert seen.add("sig-2", "ema:13", "b2")
+    assert len(seen) == 2
+    assert seen.add("sig-1", "ema:13", "b1")  # evicted, so recorded again
+
+    seen.forget(["sig-1"])
+    assert len(seen) == 1
+    assert not seen.add("sig-2", "ema:13", "b2")
+
+
+def test_chain_selections_bucket_chain_and_reuse_results(monkeypatch):
+    call = OptionContract(symbol="SPY", option_type="call", strike=600.0, expiration="2026-01-27")
+    put = OptionContract(symbol="SPY", option_type="put", strike=600.0, expiration="2026-01-27")
+    now = datetime.now(timezone.utc)
+    snapshot = {
+        contract.key: OptionQuote(
+            contract=contract,
+            bid=0.35,
+            ask=0.40,
+            last=0.38,
+            volume=None,
+            open_interest=None,
+            updated_at=now,
+        )
+        for contract in (call, put)
+    }
+    seen_quotes = []
+    real_select = rsr.select_contract
+
+    def _counting_select(quotes, request, selector_name):
+        seen_quotes.append(list(quotes))
+        return real_select(seen_quotes[-1], request, selector_name=selector_name)
+
+    monkeypatch.setattr(rsr, "select_contract", _counting_select)
+    selections = rsr.ChainSelections(snapshot, "price-range-otm")
+    request = rsr.SelectionRequest(
+        symbol="SPY", option_type="call", expiration="2026-01-27", underlying_price=599.5
+    )
+
+    first = selections.select(request)
+    second = selections.select(request)
+
+    assert first is second
+    assert first.quote.contract == call
+    assert len(seen_quotes) == 1
+    assert [quote.contract for quote in seen_quotes[0]] == [call]
+
+
+async def test_touch_ticks_wait_for_inflight_candle_close():
+    order = []
+    gate = asyncio.Event()
+
+    class SlowStrategy:
+        name = "slow"
+
+        async def on_candle_close(self, _context):
+            order.append("candle-start")
+            await gate.wait()
+            order.append("candle-end")
+            return None
+
+    contract = OptionContract(symbol="SPY", option_type="call", strike=600.0, expiration="2026-01-27")
+    quote = OptionQuote(
+        contract=contract,
+        bid=0.95,
+        ask=1.05,
+        last=1.00,
+        volume=None,
+        open_interest=None,
+        updated_at=datetime.now(timezone.utc),
+    )
+    runner = rsr.ResearchSignalRunner(
+        bus=MarketEventBus(),
+        quote_service=DummyQuoteService(quote),
+        strategies=[SlowStrategy()],
+        expiration="2026-01-27",
+    )
+    runner._ema_cache.get_last_two = lambda _tf: []  # type: ignore
+    runner._process_touches = lambda *_args, **_kwargs: order.append("touch")  # type: ignore
+    event = CandleCloseEvent(
+        symbol="SPY",
+        timeframe="2M",
+        candle={"close": 600.0},
+        closed_at=datetime(2026, 1, 27, tzinfo=timezone.utc),
+        source="schedule",
+    )
+
+    candle_task = asyncio.create_task(runner._handle_event(event))
+    await asyncio.sleep(0)
+    await runner._run_exclusive(runner._touch_tick, (600.0, datetime.now(timezone.utc), None))
+    gate.set()
+    await candle_task
+
+    assert order == ["candle-start", "candle-end", "touch"]
+
+
+async def test_touch_polls_during_slow_candle_replay_only_the_newest_tick(monkeypatch):
+    touches = []
+    gate = asyncio.Event()
+
+    class SlowStrategy:
+        name = "slow"
+
+        async def on_candle_close(self, _context):
+            await gate.wait()
+            return None
+
+    contract = OptionContract(symbol="SPY", option_type="call", strike=600.0, expiration="2026-01-27")
+    quote = OptionQuote(
+        contract=contract,
+        bid=0.95,
+        ask=1.05,
+        last=1.00,
+        volume=None,
+        open_interest=None,
+        updated_at=datetime.now(timezone.utc),
+    )
+    runner = rsr.ResearchSignalRunner(
+        bus=MarketEventBus(),
+        quote_service=DummyQuoteService(quote),
+        strategies=[SlowStrategy()],
+        expiration="2026-01-27",
+        touch_poll_secs=0.2,
+    )
+    runner._ema_cache.get_last_two = lambda _tf: []  # type: ignore
+    runner._objects_cache.get_touch_index = lambda: None  # type: ignore
+    runner._process_touches = lambda price, *_args, **_kwargs: touches.append(price)  # type: ignore
+    runner._active_signals["sig"] = object()  # type: ignore
+
+    async def _no_close_paths(_event):
+        return None
+
+    runner._record_candle_close_paths = _no_close_paths  # type: ignore
+    monkeypatch.setattr(rsr.shared_state, "latest_price", 600.0)
+    event = CandleCloseEvent(
+        symbol="SPY",
+        timeframe="2M",
+        candle={"close": 600.0},
+        closed_at=datetime(2026, 1, 27, tzinfo=timezone.utc),
+        source="schedule",
+    )
+
+    candle_task = asyncio.create_task(runner._handle_event(event))
+    poll_task = asyncio.create_task(runner._poll_touches())
+    try:
+        for price in (601.0, 602.0, 603.0):
+            monkeypatch.setattr(rsr.shared_state, "latest_price", price)
+            await asyncio.sleep(0.25)
+        assert touches == []
+        assert len(runner._pending) == 1
+        gate.set()
+        await candle_task
+    finally:
+        runner._touch_stop.set()
+        poll_task.cancel()
+
+    assert touches[0] == 603.0
+    assert len(touches) == 1
+
+
+async def test_failing_handler_does_not_strand_queued_work():
+    logs = []
+    order = []
+    gate = asyncio.Event()
+    runner = rsr.ResearchSignalRunner(
+        bus=MarketEventBus(),
+        quote_service=None,
+        strategies=[],
+        expiration="2026-01-27",
+        logger=logs.append,
+    )
+
+    async def _failing(_payload):
+        await gate.wait()
+        raise RuntimeError("boom")
+
+    async def _record(payload):
+        order.append(payload)
+
+    first = asyncio.create_task(runner._run_exclusive(_failing, None))
+    await asyncio.sleep(0)
+    await runner._run_exclusive(_record, "queued")
+    gate.set()
+    await first
+
+    assert order == ["queued"]
+    assert not runner._pending and not runner._busy
+    assert any("boom" in line for line in logs)
+
+
+def test_discovery_logs_modules_that_fail_to_import(tmp_path):
+    (tmp_path / "ema_crossover.py").write_text("")
+    (tmp_path / "does_not_exist_signal.py").write_text("")
+    logs = []
+
+    signals = rsr.discover_research_signals(tmp_path, logger=logs.append)
+
+    assert [signal.__class__.__name__ for signal in signals] == ["EmaCrossoverSignal"]
+    assert len(logs) == 1
+    assert "does_not_exist_signal" in logs[0]
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from options.execution_tradier import OrderSubmitResult
 from options.order_manager import Position
 from options.quote_service import OptionContract
-from options.trade_ledger import build_trade_event, record_trade_event
+from options.trade_ledger import build_trade_event, record_trade_event, record_trade_events
 
 
 def _make_position() -> Position:
@@ -54,3 +54,29 @@ def test_record_trade_event_writes_jsonl(tmp_path):
     assert data["realized_pnl"] == 50.0
     assert data["reason"] == "signal"
     assert "ts" in data
+
+
+def test_record_trade_events_appends_batch(tmp_path):
+    position = _make_position()
+    events = [
+        build_trade_event("open", position, None, 2, 1.5, "signal"),
+        build_trade_event("trim", position, None, 1, 2.0, "tp"),
+    ]
+
+    ledger_path = tmp_path / "trade_events.jsonl"
+    record_trade_events(events, path=ledger_path)
+    record_trade_events([], path=ledger_path)
+
+    lines = ledger_path.read_text().strip().splitlines()
+    assert [json.loads(line)["event"] for line in lines] == ["open", "trim"]
+
+
+def test_record_trade_events_logs_serialization_failures(tmp_path):
+    logs = []
+    ledger_path = tmp_path / "nested" / "trade_events.jsonl"
+
+    record_trade_events([object()], path=ledger_path, logger=logs.append)
+
+    assert len(logs) == 1
+    assert logs[0].startswith("[LEDGER] Failed to write 1 trade event(s):")
+    assert not ledger_path.exists()
@@ -1,7 +1,7 @@
 import asyncio
 import json
 
-from data_acquisition import add_markers
+from data_acquisition import add_markers, add_markers_bulk
 
 
 def test_add_markers_writes_to_timeframe_file(tmp_path, monkeypatch):
@@ -35,3 +35,22 @@ def test_add_markers_writes_to_timeframe_file(tmp_path, monkeypatch):
     assert m["percentage"] is None
     assert m["style"]["marker"] == "^"
     assert m["style"]["color"] == "blue"
+
+
+def test_add_markers_bulk_skips_repeat_events_on_same_candle(tmp_path, monkeypatch):
+    marker_path = tmp_path / "5M.json"
+    monkeypatch.setattr("data_acquisition.get_markers_path", lambda tf: marker_path, raising=True)
+    monkeypatch.setattr("data_acquisition.get_current_candle_index", lambda tf: 7, raising=True)
+
+    async def _price():
+        return 500.0
+
+    monkeypatch.setattr("data_acquisition.get_current_price", _price, raising=True)
+
+    asyncio.run(add_markers_bulk([("buy", "5M"), ("buy", "5M")], x_offset=1))
+    asyncio.run(add_markers_bulk([("buy", "5M"), ("sell", "5M")], x_offset=1))
+
+    with open(marker_path, "r") as f:
+        markers = json.load(f)
+
+    assert [(m["event_type"], m["x"]) for m in markers] == [("buy", 8), ("sell", 8)]
@@ -79,7 +79,13 @@ def dummy_config(monkeypatch, ny_tz):
         return mapping[key]
 
     monkeypatch.setattr(main, "read_config", _fake_read_config, raising=False)
-    monkeypatch.setattr(pipeline_config_loader, "read_config", _fake_read_config, raising=False)
+    monkeypatch.setattr(
+        pipeline_config_loader,
+        "read_config_bulk",
+        lambda keys: {key: _fake_read_config(key) for key in keys},
+        raising=False,
+    )
+    monkeypatch.setattr(pipeline_config_loader, "_CACHE", None, raising=False)  # drop memoized config
 
     # Ensure shared_state.latest_price is reset between tests
     import shared_state
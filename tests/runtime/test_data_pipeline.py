@@ -59,3 +59,18 @@ async def test_pipeline_closes_candle(monkeypatch):
     candle = args[2]
     assert candle["open"] == candle["high"] == candle["low"] == candle["close"] == 100.0
 
+
+
+def test_pipeline_config_copies_do_not_leak_into_the_memo(monkeypatch):
+    from runtime import pipeline_config_loader
+
+    cfg = {"TIMEFRAMES": ["1M"], "CANDLE_BUFFER": 0, "SYMBOL": "TEST"}
+    monkeypatch.setattr(pipeline_config_loader, "read_config_bulk", lambda keys: {key: cfg[key] for key in keys})
+    monkeypatch.setattr(pipeline_config_loader, "_CACHE", None)
+
+    first = pipeline_config_loader.load_pipeline_config()
+    first["timeframes"].append("5M")
+
+    second = pipeline_config_loader.load_pipeline_config()
+    assert second["timeframes"] == ["1M"]
+    assert second["timeframes"] is not first["timeframes"]
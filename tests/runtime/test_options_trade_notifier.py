@@ -0,0 +1,199 @@
+import asyncio
+
+import pytest
+
+import runtime.options_trade_notifier as notifier_mod
+from runtime.options_trade_notifier import OptionsTradeNotifier, TradeMessageState
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def edits(monkeypatch):
+    calls = []
+
+    async def _fake_edit(message_id, content):
+        calls.append((message_id, content))
+
+    monkeypatch.setattr(notifier_mod, "edit_discord_message", _fake_edit)
+    monkeypatch.setattr(notifier_mod, "EDIT_DEBOUNCE_SECS", 0.01)
+    return calls
+
+
+async def test_edits_within_debounce_window_are_coalesced(edits):
+    notifier = OptionsTradeNotifier(order_manager=None)
+    notifier._trade_messages["pos-1"] = TradeMessageState(message_id=42, content="open")
+
+    await notifier._edit_trade_message("pos-1", "Added 1")
+    await notifier._edit_trade_message("pos-1", "Sold 1")
+    await asyncio.sleep(0.05)
+
+    assert edits == [(42, "open\nAdded 1\nSold 1")]
+
+
+async def test_stop_flushes_pending_edits(edits):
+    notifier = OptionsTradeNotifier(order_manager=None)
+    notifier._trade_messages["pos-1"] = TradeMessageState(message_id=7, content="open")
+
+    await notifier._edit_trade_message("pos-1", "Sold 1")
+    await notifier.stop()
+
+    assert edits == [(7, "open\nSold 1")]
+
+
+async def test_message_ids_are_loaded_once(monkeypatch):
+    loads = []
+
+    def _fake_load():
+        loads.append(1)
+        return {}
+
+    monkeypatch.setattr(notifier_mod, "load_message_ids", _fake_load)
+    notifier = OptionsTradeNotifier(order_manager=None)
+
+    assert await notifier._get_trade_state("pos-a") is None
+    assert await notifier._get_trade_state("pos-b") is None
+    assert len(loads) == 1
+
+
+async def test_trade_events_are_written_in_background(monkeypatch):
+    written = []
+    monkeypatch.setattr(notifier_mod, "record_trade_events", lambda events, logger=None: written.extend(events))
+    notifier = OptionsTradeNotifier(order_manager=None)
+
+    notifier._queue_trade_event("evt-1")
+    notifier._queue_trade_event("evt-2")
+    await notifier.stop()
+
+    assert written == ["evt-1", "evt-2"]
+
+
+async def test_failed_ledger_batch_does_not_stop_the_writer(monkeypatch):
+    logs = []
+    written = []
+
+    def _flaky_record(events, logger=None):
+        if "bad" in events:
+            raise ValueError("not serializable")
+        written.extend(events)
+
+    monkeypatch.setattr(notifier_mod, "record_trade_events", _flaky_record)
+    notifier = OptionsTradeNotifier(order_manager=None, logger=logs.append)
+
+    notifier._queue_trade_event("bad")
+    await asyncio.sleep(0.05)
+    notifier._queue_trade_event("evt-2")
+    await asyncio.wait_for(notifier.stop(), 1)
+
+    assert written == ["evt-2"]
+    assert logs == ["[OPTIONS] Trade ledger write failed: not serializable"]
+
+
+async def test_stop_drops_ledger_events_after_timeout(monkeypatch):
+    logs = []
+    release = asyncio.Event()
+
+    async def _stuck_drain():
+        await release.wait()
+
+    notifier = OptionsTradeNotifier(order_manager=None, logger=logs.append)
+    monkeypatch.setattr(notifier, "_drain_ledger", _stuck_drain)
+    notifier._queue_trade_event("evt-1")
+    notifier._queue_trade_event("evt-2")
+
+    await notifier.stop(timeout=0.01)
+
+    assert logs == ["[OPTIONS] Trade ledger not drained after 0.01s; dropping 2 queued event(s)."]
+    assert notifier._ledger_task is None
+
+
+async def test_marker_failures_are_logged_not_raised(monkeypatch):
+    logs = []
+
+    async def _failing_markers(*_args, **_kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(notifier_mod, "add_markers_bulk", _failing_markers)
+    monkeypatch.setattr(notifier_mod, "MARKER_FLUSH_SECS", 0)
+    notifier = OptionsTradeNotifier(order_manager=None, logger=logs.append)
+
+    notifier._schedule_marker("buy", "5M")
+    await notifier.stop()
+
+    assert logs == ["[OPTIONS] Marker write failed: disk full"]
+
+
+async def test_markers_are_coalesced_into_one_bulk_write(monkeypatch):
+    calls = []
+
+    async def _fake_bulk(events, x_offset=0):
+        calls.append((list(events), x_offset))
+
+    monkeypatch.setattr(notifier_mod, "add_markers_bulk", _fake_bulk)
+    monkeypatch.setattr(notifier_mod, "MARKER_FLUSH_SECS", 0.01)
+    notifier = OptionsTradeNotifier(order_manager=None)
+
+    notifier._schedule_marker("buy", "5M")
+    notifier._schedule_marker("buy", "5M")
+    notifier._schedule_marker("trim", None)
+    await notifier.stop()
+
+    assert calls == [([("buy", "5M"), ("trim", "2M")], 1)]
+
+
+async def test_unknown_position_skips_message_fetch(monkeypatch):
+    fetched = []
+
+    async def _fake_fetch(message_id):
+        fetched.append(message_id)
+        return None
+
+    monkeypatch.setattr(notifier_mod, "load_message_ids", lambda: {"pos-known": 99})
+    monkeypatch.setattr(notifier_mod, "get_message_content", _fake_fetch)
+    notifier = OptionsTradeNotifier(order_manager=None)
+
+    assert await notifier._get_trade_state("pos-unknown") is None
+    assert await notifier._get_trade_state("pos-known") is None
+    assert fetched == [99]
+
+
+async def test_trade_state_cache_evicts_least_recent(monkeypatch):
+    monkeypatch.setattr(notifier_mod, "TRADE_STATE_CACHE_SIZE", 2)
+    monkeypatch.setattr(notifier_mod, "load_message_ids", lambda: {})
+    notifier = OptionsTradeNotifier(order_manager=None)
+    for idx in range(2):
+        notifier._remember_trade_state(f"pos-{idx}", TradeMessageState(message_id=idx, content="open"))
+
+    assert await notifier._get_trade_state("pos-0") is not None
+    notifier._remember_trade_state("pos-2", TradeMessageState(message_id=2, content="open"))
+
+    assert list(notifier._trade_messages) == ["pos-0", "pos-2"]
+
+
+async def test_closed_state_is_dropped_after_final_edit(edits):
+    notifier = OptionsTradeNotifier(order_manager=None)
+    notifier._remember_trade_state("pos-1", TradeMessageState(message_id=9, content="open"))
+
+    await notifier._edit_trade_message("pos-1", "Closed")
+    notifier._forget_trade_state("pos-1")
+    assert "pos-1" in notifier._trade_messages
+    await notifier.stop()
+
+    assert edits == [(9, "open\nClosed")]
+    assert "pos-1" not in notifier._trade_messages
+
+
+async def test_handler_failures_are_logged_with_label(monkeypatch):
+    logs = []
+
+    def _broken_event(*_args, **_kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(notifier_mod, "build_trade_event", _broken_event)
+    notifier = OptionsTradeNotifier(order_manager=None, logger=logs.append)
+
+    await notifier.on_position_opened(None, None, "signal")
+    await notifier.on_position_closed(None, None, "exit")
+
+    assert logs == ["[OPTIONS] Open notify failed: boom", "[OPTIONS] Close notify failed: boom"]
@@ -0,0 +1,258 @@
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+import runtime.strategy_reporting as reporting
+
+
+pytestmark = pytest.mark.anyio
+
+
+def _fake_discord_http(calls):
+    class _HTTPClient:
+        def __init__(self, loop):
+            self.closed = False
+
+        async def static_login(self, token):
+            calls.append(("login",))
+
+        async def send_message(self, channel_id, *, params):
+            calls.append(("send", channel_id, params["content"]))
+            return {"id": str(100 + len(calls))}
+
+        async def edit_message(self, channel_id, message_id, *, params):
+            raise LookupError(message_id)
+
+        async def close(self):
+            calls.append(("close",))
+
+    return SimpleNamespace(
+        HTTPClient=_HTTPClient,
+        handle_message_parameters=lambda content: {"content": content},
+    )
+
+
+async def test_temp_client_sends_all_reports_with_one_login(monkeypatch):
+    calls = []
+    monkeypatch.setitem(sys.modules, "discord.http", _fake_discord_http(calls))
+
+    results = await reporting._send_with_temp_client(
+        [("alpha", "report a", None), ("beta", "report b", 7)],
+        123,
+        lambda _msg: None,
+        update_existing=True,
+    )
+
+    assert calls == [
+        ("login",),
+        ("send", 123, "report a"),
+        ("send", 123, "report b"),
+        ("close",),
+    ]
+    assert results == {"alpha": 102, "beta": 103}
+
+
+async def test_reports_are_sent_concurrently_and_ids_saved(tmp_path, monkeypatch):
+    ledger = tmp_path / "ledger.jsonl"
+    ledger.write_text("")
+    state_path = tmp_path / "state.json"
+    in_flight = []
+    peak = []
+
+    async def _fake_print(message, channel_id=None):
+        in_flight.append(message)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0)
+        in_flight.remove(message)
+        return SimpleNamespace(id=len(message))
+
+    monkeypatch.setattr(reporting, "_load_config", lambda: {"enabled": True, "update_existing": True})
+    monkeypatch.setattr(reporting, "_resolve_channel_id", lambda _cfg: 1)
+    monkeypatch.setattr(reporting, "bot", SimpleNamespace(is_ready=lambda: True))
+    monkeypatch.setattr(
+        reporting,
+        "iter_positions",
+        lambda _path: iter([SimpleNamespace(strategy_tag="a", last_event_at=None), SimpleNamespace(strategy_tag="bb", last_event_at=None)]),
+    )
+    monkeypatch.setattr(reporting, "compute_metrics", lambda positions: {})
+    monkeypatch.setattr(reporting, "format_strategy_report", lambda tag, metrics, **_kw: tag)
+    monkeypatch.setattr(reporting, "_load_strategy_metadata", lambda: {})
+    monkeypatch.setattr(reporting, "print_discord", _fake_print)
+    monkeypatch.setattr(reporting, "STATE_PATH", state_path)
+
+    await reporting.send_strategy_reports("2026-01-27", ledger_path=ledger, logger=lambda _msg: None)
+
+    assert max(peak) == 2
+    assert reporting._load_state(state_path).message_ids == {"a": 1, "bb": 2}
+
+
+def test_report_state_round_trip_and_missing_file(tmp_path):
+    path = tmp_path / "state.json"
+    assert reporting._load_state(path).message_ids == {}
+
+    reporting._save_state(path, reporting.StrategyReportState(message_ids={"a": 5}))
+
+    assert reporting._load_state(path).message_ids == {"a": 5}
+    assert not path.with_suffix(".json.tmp").exists()
+
+
+def test_strategy_metadata_is_cached_until_a_module_changes(tmp_path, monkeypatch):
+    module_path = tmp_path / "alpha.py"
+    module_path.write_text("")
+    (tmp_path / "types.py").write_text("")
+    imported = []
+
+    def _fake_import(name):
+        imported.append(name)
+        return SimpleNamespace(STRATEGY_BASE_NAME="alpha", STRATEGY_DESCRIPTION="first")
+
+    monkeypatch.setattr(reporting.importlib, "import_module", _fake_import)
+    monkeypatch.setattr(reporting, "_METADATA_CACHE", {})
+
+    first = reporting._load_strategy_metadata(tmp_path)
+    second = reporting._load_strategy_metadata(tmp_path)
+
+    assert imported == ["strategies.options.alpha"]
+    assert second is first
+    assert first["alpha"]["description"] == "first"
+
+    stat = module_path.stat()
+    os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    reporting._load_strategy_metadata(tmp_path)
+
+    assert len(imported) == 2
+
+
+def test_config_summary_uses_allowlist_when_present():
+    module = SimpleNamespace(
+        MODE="single",
+        SINGLE_TIMEFRAME="5M",
+        FAST_EMA="13",
+        SLOW_EMA="48",
+        UNLISTED="skip",
+        CONFIG_SUMMARY_FIELDS=("FAST_EMA", "SLOW_EMA"),
+    )
+    legacy = SimpleNamespace(MODE="single", SINGLE_TIMEFRAME="5M", FAST_EMA="13")
+
+    assert reporting._build_config_summary(module) == "mode=single | tf=5M | fast_ema=13 | slow_ema=48"
+    assert reporting._build_config_summary(legacy) == "mode=single | tf=5M | fast_ema=13"
+
+
+async def test_unchanged_reports_skip_the_edit(tmp_path, monkeypatch):
+    ledger = tmp_path / "ledger.jsonl"
+    ledger.write_text("")
+    state_path = tmp_path / "state.json"
+    reporting._save_state(state_path, reporting.StrategyReportState(message_ids={"a": 11}))
+    edits = []
+
+    async def _fake_edit(message_id, message, channel_id=None):
+        edits.append((message_id, message))
+        return SimpleNamespace(id=message_id)
+
+    monkeypatch.setattr(reporting, "_load_config", lambda: {"enabled": True, "update_existing": True})
+    monkeypatch.setattr(reporting, "_resolve_channel_id", lambda _cfg: 1)
+    monkeypatch.setattr(reporting, "bot", SimpleNamespace(is_ready=lambda: True))
+    monkeypatch.setattr(reporting, "iter_positions", lambda _path: iter([SimpleNamespace(strategy_tag="a", last_event_at=None)]))
+    monkeypatch.setattr(reporting, "compute_metrics", lambda positions: {})
+    monkeypatch.setattr(reporting, "format_strategy_report", lambda tag, metrics, last_updated=None, **_kw: f"{tag} {last_updated}")
+    monkeypatch.setattr(reporting, "_load_strategy_metadata", lambda: {})
+    monkeypatch.setattr(reporting, "edit_discord_message", _fake_edit)
+    monkeypatch.setattr(reporting, "STATE_PATH", state_path)
+
+    for day in ("2026-01-27", "2026-01-27", "2026-01-28"):
+        await reporting.send_strategy_reports(day, ledger_path=ledger, logger=lambda _msg: None)
+
+    assert edits == [(11, "a 2026-01-27"), (11, "a 2026-01-28")]
+    assert reporting._load_state(state_path).message_ids == {"a": 11}
+
+
+async def test_failed_edit_is_retried_on_the_next_run(tmp_path, monkeypatch):
+    ledger = tmp_path / "ledger.jsonl"
+    ledger.write_text("")
+    state_path = tmp_path / "state.json"
+    reporting._save_state(state_path, reporting.StrategyReportState(message_ids={"a": 11}))
+    edits = []
+
+    async def _flaky_edit(message_id, message, channel_id=None):
+        edits.append((message_id, message))
+        # The Discord helper logs and returns None when the edit fails.
+        return None if len(edits) == 1 else SimpleNamespace(id=message_id)
+
+    monkeypatch.setattr(reporting, "_load_config", lambda: {"enabled": True, "update_existing": True})
+    monkeypatch.setattr(reporting, "_resolve_channel_id", lambda _cfg: 1)
+    monkeypatch.setattr(reporting, "bot", SimpleNamespace(is_ready=lambda: True))
+    monkeypatch.setattr(reporting, "iter_positions", lambda _path: iter([SimpleNamespace(strategy_tag="a", last_event_at=None)]))
+    monkeypatch.setattr(reporting, "compute_metrics", lambda positions: {})
+    monkeypatch.setattr(reporting, "format_strategy_report", lambda tag, metrics, **_kw: tag)
+    monkeypatch.setattr(reporting, "_load_strategy_metadata", lambda: {})
+    monkeypatch.setattr(reporting, "edit_discord_message", _flaky_edit)
+    monkeypatch.setattr(reporting, "STATE_PATH", state_path)
+
+    for _ in range(3):
+        await reporting.send_strategy_reports("2026-01-27", ledger_path=ledger, logger=lambda _msg: None)
+
+    assert edits == [(11, "a"), (11, "a")]
+    assert reporting._load_state(state_path).content_hashes == {"a": reporting._content_hash("a")}
+
+
+def test_strategy_metadata_is_read_without_importing(tmp_path, monkeypatch):
+    (tmp_path / "beta.py").write_text(
+        'STRATEGY_BASE_NAME = "beta"\n'
+        'MODE = "single"\n'
+        'SINGLE_TIMEFRAME = "5M"\n'
+        'FAST_EMA = "13"\n'
+        "TRAIL_STOP_EMA = FAST_EMA\n"
+        'CONFIG_SUMMARY_FIELDS = ("FAST_EMA", "TRAIL_STOP_EMA")\n'
+        'STRATEGY_DESCRIPTION = ("Two " "parts")\n'
+        "IS_ENABLED = False\n"
+        "raise RuntimeError('module body must not run')\n"
+    )
+    (tmp_path / "gamma.py").write_text("STRATEGY_BASE_NAME = 'gam' + 'ma'\n")
+    imported = []
+
+    def _fake_import(name):
+        imported.append(name)
+        return SimpleNamespace(STRATEGY_BASE_NAME="gamma")
+
+    monkeypatch.setattr(reporting.importlib, "import_module", _fake_import)
+    monkeypatch.setattr(reporting, "_METADATA_CACHE", {})
+
+    metadata = reporting._load_strategy_metadata(tmp_path)
+
+    assert imported == ["strategies.options.gamma"]
+    assert metadata["beta"] == {
+        "description": "Two parts",
+        "assessment": None,
+        "enabled": False,
+        "config_summary": "mode=single | tf=5M | fast_ema=13 | trail_stop_ema=13",
+    }
+    assert "gamma" in metadata
+
+
+def test_metrics_are_reused_until_the_tag_sees_a_new_event(tmp_path, monkeypatch):
+    from datetime import datetime
+
+    calls = []
+    monkeypatch.setattr(reporting, "compute_metrics", lambda positions: calls.append(len(positions)) or {"n": len(positions)})
+    monkeypatch.setattr(reporting, "_METRICS_CACHE", {})
+    ledger = tmp_path / "ledger.jsonl"
+    first = [SimpleNamespace(last_event_at=datetime(2026, 1, 27, 10)), SimpleNamespace(last_event_at=None)]
+
+    reporting._cached_metrics(ledger, "a", first)
+    reporting._cached_metrics(ledger, "a", list(first))
+    later = [SimpleNamespace(last_event_at=datetime(2026, 1, 27, 11)), SimpleNamespace(last_event_at=None)]
+    assert reporting._cached_metrics(ledger, "a", later) == {"n": 2}
+
+    assert calls == [2, 2]
+
+
+def test_merge_defaults_merges_nested_dicts_without_touching_base():
+    base = {"enabled": False, "limits": {"a": 1, "b": {"c": 2}}}
+
+    merged = reporting._merge_defaults(base, {"enabled": True, "limits": {"b": {"d": 3}}})
+
+    assert merged == {"enabled": True, "limits": {"a": 1, "b": {"c": 2, "d": 3}}}
+    assert base == {"enabled": False, "limits": {"a": 1, "b": {"c": 2}}}
@@ -22,3 +22,27 @@ async def test_wait_until_market_open_past():
     await main.wait_until_market_open(target, NY_TZ)
     elapsed = time.monotonic() - start
     assert elapsed < 0.05  # should return immediately
+
+
+async def test_wait_until_market_open_sleeps_once_for_long_waits(monkeypatch):
+    import session
+
+    start = main.datetime(2026, 1, 27, 9, 0, tzinfo=NY_TZ)
+    clock = [start]
+    sleeps = []
+
+    class _Clock:
+        @staticmethod
+        def now(tz=None):
+            return clock[0]
+
+    async def _fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += main.timedelta(seconds=seconds)
+
+    monkeypatch.setattr(session, "datetime", _Clock)
+    monkeypatch.setattr(session.asyncio, "sleep", _fake_sleep)
+
+    await session.wait_until_market_open(start + main.timedelta(minutes=30), NY_TZ)
+
+    assert sleeps == [pytest.approx(1800 - 0.1)]
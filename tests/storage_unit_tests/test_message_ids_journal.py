@@ -0,0 +1,21 @@
+# tests/storage_unit_tests/test_message_ids_journal.py
+import importlib
+
+
+def test_message_ids_append_and_compact(tmp_path, monkeypatch):
+    json_utils = importlib.import_module("utils.json_utils")
+    path = tmp_path / "message_ids.jsonl"
+    monkeypatch.setattr(json_utils, "MESSAGE_IDS_PATH", path)
+
+    json_utils.save_message_ids("pos-1", 11)
+    json_utils.save_message_ids("pos-2", 22)
+    json_utils.save_message_ids("pos-1", 33)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"pos-3": 4')  # torn write is ignored
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 4
+    assert json_utils.load_message_ids() == {"pos-1": 33, "pos-2": 22}
+
+    assert json_utils.compact_message_ids() == {"pos-1": 33, "pos-2": 22}
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+    assert json_utils.load_message_ids() == {"pos-1": 33, "pos-2": 22}
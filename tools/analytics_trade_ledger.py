@@ -6,7 +6,7 @@ import sys
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -57,6 +57,10 @@ def _safe_float(value: object) -> Optional[float]:
 
 
 def _load_positions(path: Path) -> list[PositionSummary]:
+    return list(_load_position_map(path).values())
+
+
+def _load_position_map(path: Path) -> dict[str, PositionSummary]:
     positions: dict[str, PositionSummary] = {}
     with path.open("r", encoding="utf-8") as handle:
         for line in handle:
@@ -123,13 +127,19 @@ def _load_positions(path: Path) -> list[PositionSummary]:
                 except (TypeError, ValueError):
                     pass
 
-    return list(positions.values())
+    return positions
 
 
 def load_positions(path: Path) -> list[PositionSummary]:
     return _load_positions(path)
 
 
+def iter_positions(path: Path) -> Iterator[PositionSummary]:
+    # A position's events can be anywhere in the ledger, so summaries are only
+    # final after the full pass; this just skips the extra list copy.
+    return iter(_load_position_map(path).values())
+
+
 def _is_closed(summary: PositionSummary) -> bool:
     if summary.closed_at is not None:
         return True
@@ -0,0 +1,5 @@
+# utils/compat_utils.py, Python version shims shared across packages
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters fall back to a __dict__.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -7,6 +7,23 @@ import pandas as pd
 import os
 from paths import pretty_path, get_ema_path, CONFIG_PATH, MARKERS_PATH, MESSAGE_IDS_PATH, ORDER_CANDLE_TYPE_PATH, PRIORITY_CANDLES_PATH, LINE_DATA_PATH
 
+try:
+    import orjson  # optional speedup for hot-path JSON; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+def dumps_json(obj, pretty=False):
+    """Serialize `obj` to JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode("utf-8")
+    return json.dumps(obj, indent=2 if pretty else None)
+
+def loads_json(data):
+    """Parse JSON from str/bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def read_config(key=None):
     """Reads the configuration file and optionally returns a specific key."""
     with CONFIG_PATH.open("r") as f:
@@ -15,15 +32,29 @@ def read_config(key=None):
         return config  # Return the whole config if no key is provided
     return config.get(key)  # Return the specific key's value or None if key doesn't exist
 
+def read_config_bulk(keys):
+    """Reads the configuration file once and returns the requested keys as a dict."""
+    with CONFIG_PATH.open("r") as f:
+        config = json.load(f)
+    return {key: config.get(key) for key in keys}
+
 def load_message_ids():
-    if os.path.exists(MESSAGE_IDS_PATH):
-        with open(MESSAGE_IDS_PATH, 'r') as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                return {}
-    else:
+    """Fold the append-only message id journal into one dict; later lines win."""
+    message_ids = {}
+    try:
+        with open(MESSAGE_IDS_PATH, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = loads_json(line)
+                except ValueError:
+                    continue  # torn trailing write from a crash
+                if isinstance(entry, dict):
+                    message_ids.update(entry)
+    except FileNotFoundError:
         return {}
+    return message_ids
 
 def update_config_value(key, value):
     """Update a single key in the config file with a new value."""
@@ -55,14 +86,7 @@ def reset_json(file_path, contents):
         print_log(f"[RESET] Cleared file: `{pretty_path(file_path)}`")
 
 def get_correct_message_ids():
-    if os.path.exists(MESSAGE_IDS_PATH):
-        with open(MESSAGE_IDS_PATH, 'r') as file:
-            json_message_ids_dict = json.load(file)
-            #print (f"{json_message_ids_dict}")
-    else:
-        json_message_ids_dict = {}
-    
-    return json_message_ids_dict
+    return load_message_ids()
 
 def add_candle_type_to_json(candle_type):
     # Read the current contents of the file, or initialize an empty list if file does not exist
@@ -169,22 +193,18 @@ def resolve_flags(indent_level):
         json.dump(updated_line_data, file, indent=4)
 
 def save_message_ids(order_id, message_id):
-    # Load existing data
-    if MESSAGE_IDS_PATH.exists():
-        with open(MESSAGE_IDS_PATH, 'r') as f:
-            try:
-                existing_data = json.load(f)
-            except json.JSONDecodeError:
-                existing_data = {}
-    else:
-        existing_data = {}
-
-    # Update existing data with new data
-    existing_data[order_id] = message_id
-
-    # Write updated data back to file
-    with open(MESSAGE_IDS_PATH, 'w') as f:
-        json.dump(existing_data, f, indent=4)
+    # Append one line instead of rewriting the whole mapping on every open
+    with open(MESSAGE_IDS_PATH, 'a', encoding='utf-8') as f:
+        f.write(dumps_json({order_id: message_id}) + "\n")
+
+def compact_message_ids():
+    """Rewrite the message id journal as a single line holding the folded dict."""
+    message_ids = load_message_ids()
+    temp_file = MESSAGE_IDS_PATH.with_suffix(".tmp")
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        f.write(dumps_json(message_ids) + "\n")
+    temp_file.replace(MESSAGE_IDS_PATH)
+    return message_ids
 
 def EOD_reset_all_jsons():
     """
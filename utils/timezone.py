@@ -1,4 +1,8 @@
+from zoneinfo import ZoneInfo
+
 import pytz
 
 NY_TZ_NAME = "America/New_York"
 NY_TZ = pytz.timezone(NY_TZ_NAME)
+# stdlib zone for code that only needs datetime.now(tz)/astimezone, no localize()
+NY_ZONEINFO = ZoneInfo(NY_TZ_NAME)